@@ -0,0 +1,145 @@
+"""Compare per-worker profile caching with the shared-memory tier.
+
+Each worker process reads the profiles of the same hot users. A miss costs
+a simulated database read. Run with `uv run benchmark_cache.py`.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+from utils.cache import Cache, CacheBackend, MemoryBackend, TieredBackend
+from utils.logger import get_logger
+from utils.profile_cache import CachedResponse, ProfileCache
+from utils.shm_cache import SharedMemoryBackend
+
+logger = get_logger()
+
+# Size of a typical serialized profile
+PROFILE_BYTES = 6 * 1024
+
+
+def _worker(
+    shm_path: Optional[str],
+    users: List[uuid.UUID],
+    reads: int,
+    db_latency: float,
+    results: "multiprocessing.Queue[Tuple[int, float]]",
+) -> None:
+    backend: CacheBackend = MemoryBackend(64 * 1024 * 1024)
+    if shm_path:
+        backend = TieredBackend(backend, SharedMemoryBackend(shm_path, 4096, 16 * 1024))
+    cache = ProfileCache(Cache(backend))
+    builds = 0
+
+    async def build() -> CachedResponse:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(db_latency)
+        return CachedResponse(b"x" * PROFILE_BYTES)
+
+    async def run() -> None:
+        # Each worker sees the hot users in its own order, like real traffic
+        order = random.Random(os.getpid())
+        for _ in range(reads):
+            user_id = order.choice(users)
+            await cache.get_or_build(user_id, 1, "profile", "", build)
+        await backend.close()
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    results.put((builds, time.perf_counter() - started))
+
+
+def run_workers(
+    workers: int, users: int, reads: int, db_latency: float, shared: bool
+) -> Tuple[int, float]:
+    """Total database reads and slowest worker time of one configuration"""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    with tempfile.TemporaryDirectory(dir="/dev/shm" if shared else None) as directory:
+        shm_path = os.path.join(directory, "profile-cache") if shared else None
+        if shm_path:
+            asyncio.run(SharedMemoryBackend(shm_path, 4096, 16 * 1024).close())
+        processes = [
+            context.Process(
+                target=_worker, args=(shm_path, user_ids, reads, db_latency, results)
+            )
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    return sum(builds for builds, _ in outcomes), max(
+        elapsed for _, elapsed in outcomes
+    )
+
+
+def time_hits(cache: ProfileCache, reads: int) -> float:
+    """Mean seconds per read of a key already in `cache`"""
+    user_id = uuid.uuid4()
+
+    async def build() -> CachedResponse:
+        return CachedResponse(b"x" * PROFILE_BYTES)
+
+    async def run() -> float:
+        await cache.get_or_build(user_id, 1, "profile", "", build)
+        started = time.perf_counter()
+        for _ in range(reads):
+            await cache.get_or_build(user_id, 1, "profile", "", build)
+        return (time.perf_counter() - started) / reads
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--db-latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    for shared in (False, True):
+        db_reads, elapsed = run_workers(
+            args.workers, args.users, args.reads, args.db_latency, shared
+        )
+        logger.info(
+            "Profile cache benchmark",
+            extra={
+                "tier": "shared memory" if shared else "per worker",
+                "workers": args.workers,
+                "reads": args.workers * args.reads,
+                "db_reads": db_reads,
+                "seconds": round(elapsed, 3),
+            },
+        )
+
+    with tempfile.TemporaryDirectory(dir="/dev/shm") as directory:
+        shm = SharedMemoryBackend(os.path.join(directory, "hits"), 4096, 16 * 1024)
+        # No local entries fit, so every hit is served by the shared tier
+        tiered = TieredBackend(MemoryBackend(0), shm)
+        shared_hit = time_hits(ProfileCache(Cache(tiered)), args.reads)
+        asyncio.run(shm.close())
+    memory = MemoryBackend(64 * 1024 * 1024)
+    local_hit = time_hits(ProfileCache(Cache(memory)), args.reads)
+    logger.info(
+        "Profile cache hit latency",
+        extra={
+            "local_hit_us": round(local_hit * 1e6, 2),
+            "shared_hit_us": round(shared_hit * 1e6, 2),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
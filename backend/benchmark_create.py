@@ -0,0 +1,165 @@
+"""Compare creating a profile entry with and without a refresh after the insert.
+
+Creates used to commit, then refresh the new row to read its generated
+columns: a SELECT round trip per create. They now read them back with
+INSERT ... RETURNING. Runs against the database of DB_URL, inside a
+transaction that is rolled back. `--rtt-ms` routes the connection through
+a local proxy adding that round-trip time, as a database on another host
+would. Run with `uv run benchmark_create.py`.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import date
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from models import Experience, User
+from settings import settings
+from utils.logger import get_logger
+
+logger = get_logger()
+
+
+async def _pipe(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float
+) -> None:
+    try:
+        while data := await reader.read(65536):
+            await asyncio.sleep(delay)
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _delayed_proxy(url: URL, rtt: float) -> Tuple[asyncio.Server, URL]:
+    """TCP proxy to the database adding `rtt` seconds to every round trip"""
+    socket_dir = url.query.get("host")
+
+    async def connect() -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if isinstance(socket_dir, str) and socket_dir.startswith("/"):
+            path = f"{socket_dir}/.s.PGSQL.{url.port or 5432}"
+            return await asyncio.open_unix_connection(path)
+        return await asyncio.open_connection(url.host, url.port or 5432)
+
+    async def serve(
+        client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter
+    ) -> None:
+        server_reader, server_writer = await connect()
+        await asyncio.gather(
+            _pipe(client_reader, server_writer, rtt / 2),
+            _pipe(server_reader, client_writer, rtt / 2),
+        )
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    proxied = url.set(host="127.0.0.1", port=port).difference_update_query(["host"])
+    return server, proxied
+
+
+def _experience(user_id: uuid.UUID) -> Experience:
+    return Experience(
+        user_id=user_id,
+        job_title="Engineer",
+        company_name="Acme",
+        start_date=date(2020, 1, 1),
+    )
+
+
+async def time_creates(url: URL, creates: int) -> Tuple[List[float], List[float]]:
+    """Seconds per create with a refresh after the insert, and without"""
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            user_id = uuid.uuid4()
+            await connection.execute(
+                insert(User).values(
+                    id=user_id,
+                    first_name="Bench",
+                    last_name="Mark",
+                    email=f"{user_id}@example.com",
+                    hashed_password="x",
+                )
+            )
+            # Commits only release savepoints, so nothing is kept
+            session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+
+            async def create(refresh: bool) -> float:
+                started = time.perf_counter()
+                experience = _experience(user_id)
+                session.add(experience)
+                await session.commit()
+                if refresh:
+                    await session.refresh(experience)
+                return time.perf_counter() - started
+
+            # Warm up the prepared statements of both paths
+            await create(refresh=True)
+            with_refresh: List[float] = []
+            returning: List[float] = []
+            for _ in range(creates):
+                with_refresh.append(await create(refresh=True))
+                returning.append(await create(refresh=False))
+
+            await session.close()
+            await transaction.rollback()
+            return with_refresh, returning
+    finally:
+        await engine.dispose()
+
+
+async def run(creates: int, rtt_ms: float) -> None:
+    url = make_url(settings.DB_URL)
+    proxy: Optional[asyncio.Server] = None
+    if rtt_ms:
+        proxy, url = await _delayed_proxy(url, rtt_ms / 1000)
+    try:
+        with_refresh, returning = await time_creates(url, creates)
+    finally:
+        if proxy is not None:
+            proxy.close()
+
+    def summary(samples: List[float]) -> Any:
+        ordered = sorted(samples)
+        return {
+            "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+            "p95_ms": round(ordered[int(len(ordered) * 0.95)] * 1000, 3),
+        }
+
+    for name, samples in (("refresh", with_refresh), ("returning", returning)):
+        logger.info(
+            "Create benchmark",
+            extra={
+                "path": name,
+                "creates": creates,
+                "rtt_ms": rtt_ms,
+                **summary(samples),
+            },
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--creates", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.creates, args.rtt_ms))
+
+
+if __name__ == "__main__":
+    main()
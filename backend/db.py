@@ -1,4 +1,5 @@
-from typing import AsyncGenerator, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -70,3 +71,15 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
     async for session in sessionmanager.get_session():
         yield session
+
+
+@asynccontextmanager
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """Session for work that outlives the request that started it."""
+    if not sessionmanager.session_factory:
+        sessionmanager.init_db()
+    if not sessionmanager.session_factory:
+        raise RuntimeError("Database session factory is not initialized.")
+
+    async with sessionmanager.session_factory() as session:
+        yield session
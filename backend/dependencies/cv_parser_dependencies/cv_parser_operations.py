@@ -0,0 +1,274 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dependencies.user_input_dependencies.section_operations import (
+    bump_profile_version,
+)
+from models import (
+    CVImportPreview,
+    CVParseRun,
+    Education,
+    Experience,
+    PersonalInfo,
+    Project,
+    TechnicalSkill,
+    User,
+)
+from settings import settings
+from utils.profile_cache import profile_cache
+from utils.timing import StageTimer
+
+PERSONAL_INFO_FIELDS = (
+    "full_name",
+    "email",
+    "phone",
+    "location",
+    "linkedin_url",
+    "github_url",
+    "portfolio_url",
+    "website_url",
+    "professional_title",
+)
+
+
+def parse_date(date_str: Optional[str]) -> Optional[date]:
+    """Helper to parse YYYY-MM-DD string to date object."""
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+def user_import_lock_key(user_id: UUID) -> int:
+    """Derive the signed 64-bit advisory lock key for a user's CV imports"""
+    return int.from_bytes(user_id.bytes[:8], "big", signed=True)
+
+
+class CVParserOperations:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_parsed_cv(
+        self, user: User, parsed_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Save parsed CV data to the user's profile and return a summary"""
+        # Serialize imports of the same user across workers until commit
+        await self.db.execute(
+            select(func.pg_advisory_xact_lock(user_import_lock_key(user.id)))
+        )
+
+        #  Personal Info
+        p_info_data = parsed_data.get("personal_info")
+        if p_info_data:
+            parsed_info = {
+                field: p_info_data.get(field) or None for field in PERSONAL_INFO_FIELDS
+            }
+            # One upsert keyed on the unique user_id: a new row falls back to
+            # the account name and email, an existing one keeps the values the
+            # CV does not provide
+            query = pg_insert(PersonalInfo).values(
+                user_id=user.id,
+                **{
+                    **parsed_info,
+                    "full_name": parsed_info["full_name"]
+                    or f"{user.first_name} {user.last_name}",
+                    "email": parsed_info["email"] or user.email,
+                },
+            )
+            found = {field: value for field, value in parsed_info.items() if value}
+            if found:
+                query = query.on_conflict_do_update(
+                    index_elements=[PersonalInfo.user_id],
+                    set_={**found, "updated_at": func.now()},
+                )
+            else:
+                query = query.on_conflict_do_nothing(
+                    index_elements=[PersonalInfo.user_id]
+                )
+            await self.db.execute(query)
+
+        #  Education
+        education_list = parsed_data.get("education", [])
+        if education_list:
+            for edu in education_list:
+                new_edu = Education(
+                    user_id=user.id,
+                    institution_name=edu.get("institution_name")
+                    or "Unknown Institution",
+                    degree=edu.get("degree") or "Unknown Degree",
+                    field_of_study=edu.get("field_of_study"),
+                    start_date=parse_date(edu.get("start_date")),
+                    end_date=parse_date(edu.get("end_date")),
+                    is_current=edu.get("is_current", False),
+                    grade=edu.get("grade"),
+                    location=edu.get("location"),
+                    description=edu.get("description"),
+                )
+                self.db.add(new_edu)
+
+        # Experiences
+        experience_list = parsed_data.get("experiences", [])
+        if experience_list:
+            for exp in experience_list:
+                new_exp = Experience(
+                    user_id=user.id,
+                    job_title=exp.get("job_title") or "Unknown Title",
+                    company_name=exp.get("company_name") or "Unknown Company",
+                    location=exp.get("location"),
+                    employment_type=exp.get("employment_type"),
+                    start_date=parse_date(exp.get("start_date"))
+                    or date.today(),  # valid start_date
+                    end_date=parse_date(exp.get("end_date")),
+                    is_current=exp.get("is_current", False),
+                    description=exp.get("description"),
+                    achievements=exp.get("achievements"),
+                    technologies_used=exp.get("technologies_used"),
+                )
+                self.db.add(new_exp)
+
+        #  Projects
+        project_list = parsed_data.get("projects", [])
+        if project_list:
+            for proj in project_list:
+                new_proj = Project(
+                    user_id=user.id,
+                    project_name=proj.get("project_name") or "Unknown Project",
+                    description=proj.get("description") or "",
+                    highlights=proj.get("highlights"),
+                    project_url=proj.get("project_url"),
+                    github_url=proj.get("github_url"),
+                    start_date=parse_date(proj.get("start_date")),
+                    end_date=parse_date(proj.get("end_date")),
+                    technologies_used=proj.get("technologies_used"),
+                    is_featured=proj.get("is_featured", False),
+                )
+                self.db.add(new_proj)
+
+        # Skills
+        skills_list = parsed_data.get("skills", [])
+        if skills_list:
+            new_skill_group = TechnicalSkill(
+                user_id=user.id,
+                category="Imported Skills",
+                skills=skills_list,
+                display_order=0,
+            )
+            self.db.add(new_skill_group)
+
+        await bump_profile_version(self.db, user.id)
+        await self.db.commit()
+        await profile_cache.invalidate(user.id)
+
+        return {
+            "personal_info": bool(p_info_data),
+            "education_count": len(education_list),
+            "experience_count": len(experience_list),
+            "project_count": len(project_list),
+            "skills_count": len(skills_list),
+        }
+
+    async def record_parse_run(
+        self,
+        user_id: UUID,
+        file_name: Optional[str],
+        file_size: int,
+        model: str,
+        timer: StageTimer,
+        routing_reason: Optional[str] = None,
+        escalated: bool = False,
+        input_tokens: int = 0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        error_message: Optional[str] = None,
+        file_hash: Optional[str] = None,
+    ) -> CVParseRun:
+        """Store the timing record of a CV parse"""
+        parse_run = CVParseRun(
+            user_id=user_id,
+            file_name=file_name,
+            file_size=file_size,
+            file_hash=file_hash,
+            model=model,
+            routing_reason=routing_reason,
+            escalated=escalated,
+            status="failed" if error_message else "success",
+            error_message=error_message,
+            input_tokens=input_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            stage_timings=timer.stages,
+            total_ms=timer.total_ms,
+        )
+        self.db.add(parse_run)
+        await self.db.commit()
+        return parse_run
+
+    async def get_parse_runs(
+        self, user_id: UUID, skip: int = 0, limit: int = 100
+    ) -> List[CVParseRun]:
+        """Retrieve the user's CV parse records, newest first"""
+        query = (
+            select(CVParseRun)
+            .where(CVParseRun.user_id == user_id)
+            .order_by(CVParseRun.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create_import_preview(
+        self, user_id: UUID, file_name: Optional[str], parsed_data: Dict[str, Any]
+    ) -> CVImportPreview:
+        """Store a parsed CV under a short-lived preview token"""
+        # Expired previews of the user are never committed, clear them here
+        await self.db.execute(
+            delete(CVImportPreview).where(
+                CVImportPreview.user_id == user_id,
+                CVImportPreview.expires_at <= func.now(),
+            )
+        )
+        preview = CVImportPreview(
+            user_id=user_id,
+            file_name=file_name,
+            parsed_data=parsed_data,
+            expires_at=datetime.now(UTC)
+            + timedelta(minutes=settings.CV_IMPORT_PREVIEW_EXPIRATION_MINUTES),
+        )
+        self.db.add(preview)
+        await self.db.commit()
+        return preview
+
+    async def commit_import_preview(
+        self,
+        user: User,
+        preview_token: UUID,
+        parsed_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Import a stored preview, or an edited version of it, into the profile.
+
+        The preview is consumed in the same transaction as the import, so a
+        token can only be committed once. Returns None if the token is
+        unknown or expired.
+        """
+        result = await self.db.execute(
+            delete(CVImportPreview)
+            .where(
+                CVImportPreview.id == preview_token,
+                CVImportPreview.user_id == user.id,
+                CVImportPreview.expires_at > func.now(),
+            )
+            .returning(CVImportPreview.parsed_data)
+        )
+        stored_data = result.scalar_one_or_none()
+        if stored_data is None:
+            return None
+
+        return await self.import_parsed_cv(user, parsed_data or stored_data)
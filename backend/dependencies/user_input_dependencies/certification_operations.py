@@ -2,18 +2,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import Certification
 from schemas.user_input_schemas.certification_schemas import (
     CertificationCreateSchema,
     CertificationUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class CertificationOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class CertificationOperations(SectionOperations[Certification]):
+    model = Certification
 
     async def create_certification(
         self, payload: CertificationCreateSchema, user_id: UUID
@@ -33,20 +35,23 @@ class CertificationOperations:
             is_active=payload.is_active,
         )
         self.db.add(certification)
-        await self.db.commit()
-        await self.db.refresh(certification)
+        await self._commit_changes(user_id)
         return certification
 
     async def get_all_certifications(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Certification]:
         """Retrieve all certifications for a user"""
-        query = (
-            select(Certification)
-            .where(Certification.user_id == user_id)
-            .order_by(Certification.display_order)
-            .offset(skip)
-            .limit(limit)
+        query = paginate(
+            select(Certification).where(Certification.user_id == user_id),
+            Certification,
+            skip,
+            limit,
+            cursor,
         )
         result = await self.db.execute(query)
         certifications = result.scalars().all()
@@ -67,41 +72,12 @@ class CertificationOperations:
         self, certification_id: UUID, user_id: UUID, payload: CertificationUpdateSchema
     ) -> Optional[Certification]:
         """Update existing certification"""
-        certification = await self.get_certification_by_id(certification_id, user_id)
-
-        if not certification:
-            return None
-
-        if payload.certification_name is not None:
-            certification.certification_name = payload.certification_name
-        if payload.issuing_organization is not None:
-            certification.issuing_organization = payload.issuing_organization
-        if payload.issue_date is not None:
-            certification.issue_date = payload.issue_date
-        if payload.expiry_date is not None:
-            certification.expiry_date = payload.expiry_date
-        if payload.credential_id is not None:
-            certification.credential_id = payload.credential_id
-        if payload.credential_url is not None:
-            certification.credential_url = payload.credential_url
-        if payload.description is not None:
-            certification.description = payload.description
-        if payload.display_order is not None:
-            certification.display_order = payload.display_order
-        if payload.is_active is not None:
-            certification.is_active = payload.is_active
-
-        await self.db.commit()
-        await self.db.refresh(certification)
-        return certification
+        return await self._update_returning(
+            payload, user_id, self._owned(certification_id, user_id)
+        )
 
     async def delete_certification(self, certification_id: UUID, user_id: UUID) -> bool:
         """Delete certification by ID"""
-        certification = await self.get_certification_by_id(certification_id, user_id)
-
-        if not certification:
-            return False
-
-        await self.db.delete(certification)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(
+            user_id, self._owned(certification_id, user_id)
+        )
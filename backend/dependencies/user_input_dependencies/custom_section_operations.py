@@ -2,18 +2,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import CustomSection
 from schemas.user_input_schemas.custom_section_schemas import (
     CustomSectionCreateSchema,
     CustomSectionUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class CustomSectionOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class CustomSectionOperations(SectionOperations[CustomSection]):
+    model = CustomSection
 
     async def create_custom_section(
         self, payload: CustomSectionCreateSchema, user_id: UUID
@@ -26,13 +28,24 @@ class CustomSectionOperations:
             content_enhanced=None,
         )
         self.db.add(custom_section)
-        await self.db.commit()
-        await self.db.refresh(custom_section)
+        await self._commit_changes(user_id)
         return custom_section
 
-    async def get_all_custom_sections(self, user_id: UUID) -> List[CustomSection]:
+    async def get_all_custom_sections(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[CustomSection]:
         """Retrieve all custom sections for a user"""
-        query = select(CustomSection).where(CustomSection.user_id == user_id)
+        query = paginate(
+            select(CustomSection).where(CustomSection.user_id == user_id),
+            CustomSection,
+            skip,
+            limit,
+            cursor,
+        )
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
@@ -50,27 +63,10 @@ class CustomSectionOperations:
         self, section_id: UUID, user_id: UUID, payload: CustomSectionUpdateSchema
     ) -> Optional[CustomSection]:
         """Update existing custom section"""
-        custom_section = await self.get_custom_section_by_id(section_id, user_id)
-        if not custom_section:
-            return None
-
-        if payload.section_title is not None:
-            custom_section.section_title = payload.section_title
-
-        if payload.content is not None:
-            custom_section.content = payload.content
-
-        await self.db.commit()
-        await self.db.refresh(custom_section)
-        return custom_section
+        return await self._update_returning(
+            payload, user_id, self._owned(section_id, user_id)
+        )
 
     async def delete_custom_section(self, section_id: UUID, user_id: UUID) -> bool:
         """Delete custom section"""
-        custom_section = await self.get_custom_section_by_id(section_id, user_id)
-
-        if not custom_section:
-            return False
-
-        await self.db.delete(custom_section)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(user_id, self._owned(section_id, user_id))
@@ -2,18 +2,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import Experience
 from schemas.user_input_schemas.experience_schemas import (
     ExperienceCreateSchema,
     ExperienceUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class ExperienceOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class ExperienceOperations(SectionOperations[Experience]):
+    model = Experience
 
     async def create_experience(
         self, payload: ExperienceCreateSchema, user_id: UUID
@@ -37,20 +39,23 @@ class ExperienceOperations:
             is_active=payload.is_active,
         )
         self.db.add(experience)
-        await self.db.commit()
-        await self.db.refresh(experience)
+        await self._commit_changes(user_id)
         return experience
 
     async def get_all_experiences(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Experience]:
         """Retrieve all experiences for a user"""
-        query = (
-            select(Experience)
-            .where(Experience.user_id == user_id)
-            .order_by(Experience.display_order)
-            .offset(skip)
-            .limit(limit)
+        query = paginate(
+            select(Experience).where(Experience.user_id == user_id),
+            Experience,
+            skip,
+            limit,
+            cursor,
         )
         result = await self.db.execute(query)
         experiences = result.scalars().all()
@@ -71,47 +76,12 @@ class ExperienceOperations:
         self, experience_id: UUID, user_id: UUID, payload: ExperienceUpdateSchema
     ) -> Optional[Experience]:
         """Update existing experience"""
-        experience = await self.get_experience_by_id(experience_id, user_id)
-
-        if not experience:
-            return None
-
-        if payload.job_title is not None:
-            experience.job_title = payload.job_title
-        if payload.company_name is not None:
-            experience.company_name = payload.company_name
-        if payload.location is not None:
-            experience.location = payload.location
-        if payload.employment_type is not None:
-            experience.employment_type = payload.employment_type
-        if payload.start_date is not None:
-            experience.start_date = payload.start_date
-        if payload.end_date is not None:
-            experience.end_date = payload.end_date
-        if payload.is_current is not None:
-            experience.is_current = payload.is_current
-        if payload.description is not None:
-            experience.description = payload.description
-        if payload.achievements is not None:
-            experience.achievements = payload.achievements
-        if payload.technologies_used is not None:
-            experience.technologies_used = payload.technologies_used
-        if payload.display_order is not None:
-            experience.display_order = payload.display_order
-        if payload.is_active is not None:
-            experience.is_active = payload.is_active
-
-        await self.db.commit()
-        await self.db.refresh(experience)
-        return experience
+        return await self._update_returning(
+            payload, user_id, self._owned(experience_id, user_id)
+        )
 
     async def delete_experience(self, experience_id: UUID, user_id: UUID) -> bool:
         """Delete experience by ID"""
-        experience = await self.get_experience_by_id(experience_id, user_id)
-
-        if not experience:
-            return False
-
-        await self.db.delete(experience)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(
+            user_id, self._owned(experience_id, user_id)
+        )
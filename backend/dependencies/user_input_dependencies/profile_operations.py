@@ -0,0 +1,121 @@
+from typing import Any, Optional, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Text, case, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from models import (
+    Base,
+    Certification,
+    CustomSection,
+    Education,
+    Experience,
+    Project,
+    Publication,
+    TechnicalSkill,
+    User,
+)
+from schemas.user_input_schemas.profile_schemas import ProfileResponseSchema
+
+# Timestamps rendered the way Pydantic serializes UTC datetimes
+TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS"Z"'
+TIMESTAMP_FORMAT_MICROSECONDS = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+
+
+def _json_value(column: Any) -> Any:
+    if not isinstance(column.type, DateTime):
+        return column
+    utc = func.timezone("UTC", column)
+    return case(
+        (
+            func.date_trunc("second", column) == column,
+            func.to_char(utc, TIMESTAMP_FORMAT),
+        ),
+        else_=func.to_char(utc, TIMESTAMP_FORMAT_MICROSECONDS),
+    )
+
+
+def _json_object(schema: Type[BaseModel], model: Type[Base]) -> Any:
+    """Build a json_build_object with the response schema's fields, in order"""
+    columns = model.__table__.columns
+    pairs = []
+    for field in schema.model_fields:
+        pairs.extend([literal_column(f"'{field}'"), _json_value(columns[field])])
+    return func.json_build_object(*pairs)
+
+
+def _section_json(name: str) -> Any:
+    """Correlated subquery returning one profile section as JSON"""
+    relationship = getattr(User, name).property
+    model = relationship.mapper.class_
+    schema = ProfileResponseSchema.section_schema(name)
+    json_object = _json_object(schema, model)
+
+    if not relationship.uselist:
+        return (
+            select(json_object)
+            .where(model.user_id == User.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(json_object, model.display_order, model.id)
+                ),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(model.user_id == User.id, model.is_active)
+        .scalar_subquery()
+    )
+
+
+class ProfileOperations:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_profile(self, user_id: UUID) -> Optional[User]:
+        """Retrieve the user with every active profile section loaded.
+
+        One-to-one sections are joined to the user row and each list section
+        is loaded with one extra query, ordered by display_order, then id.
+        """
+        query = (
+            select(User)
+            .where(User.id == user_id)
+            .options(
+                joinedload(User.personal_info),
+                joinedload(User.summary),
+                selectinload(User.education.and_(Education.is_active)),
+                selectinload(User.experiences.and_(Experience.is_active)),
+                selectinload(User.projects.and_(Project.is_active)),
+                selectinload(User.technical_skills.and_(TechnicalSkill.is_active)),
+                selectinload(User.publications.and_(Publication.is_active)),
+                selectinload(User.certifications.and_(Certification.is_active)),
+                selectinload(User.custom_sections.and_(CustomSection.is_active)),
+            )
+            # The user is already in the session from authentication
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        return result.unique().scalar_one_or_none()
+
+    async def get_profile_json(self, user_id: UUID) -> Optional[str]:
+        """Build the profile document in Postgres, in ProfileResponseSchema shape.
+
+        Same content as get_profile, but assembled with json_build_object and
+        json_agg in a single statement so no ORM objects are hydrated.
+        """
+        pairs = []
+        for name in ProfileResponseSchema.model_fields:
+            pairs.extend([literal_column(f"'{name}'"), _section_json(name)])
+        query = select(cast(func.json_build_object(*pairs), Text)).where(
+            User.id == user_id
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
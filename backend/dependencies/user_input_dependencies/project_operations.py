@@ -2,20 +2,24 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import Project
 from schemas.user_input_schemas.project_schemas import (
     ProjectCreateSchema,
     ProjectUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class ProjectOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class ProjectOperations(SectionOperations[Project]):
+    model = Project
 
-    async def create_project(self, user_id, payload: ProjectCreateSchema) -> Project:
+    async def create_project(
+        self, payload: ProjectCreateSchema, user_id: UUID
+    ) -> Project:
         """Create project in the database"""
         project = Project(
             user_id=user_id,
@@ -34,20 +38,23 @@ class ProjectOperations:
             is_active=payload.is_active,
         )
         self.db.add(project)
-        await self.db.commit()
-        await self.db.refresh(project)
+        await self._commit_changes(user_id)
         return project
 
     async def get_all_projects(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Project]:
         """Retrieve all projects for a user"""
-        query = (
-            select(Project)
-            .where(Project.user_id == user_id)
-            .order_by(Project.display_order)
-            .offset(skip)
-            .limit(limit)
+        query = paginate(
+            select(Project).where(Project.user_id == user_id),
+            Project,
+            skip,
+            limit,
+            cursor,
         )
         result = await self.db.execute(query)
         projects = result.scalars().all()
@@ -68,45 +75,10 @@ class ProjectOperations:
         self, project_id: UUID, user_id: UUID, payload: ProjectUpdateSchema
     ) -> Optional[Project]:
         """Update existing project"""
-        project = await self.get_project_by_id(project_id, user_id)
-
-        if not project:
-            return None
-
-        if payload.project_name is not None:
-            project.project_name = payload.project_name
-        if payload.description is not None:
-            project.description = payload.description
-        if payload.highlights is not None:
-            project.highlights = payload.highlights
-        if payload.project_url is not None:
-            project.project_url = payload.project_url
-        if payload.github_url is not None:
-            project.github_url = payload.github_url
-        if payload.start_date is not None:
-            project.start_date = payload.start_date
-        if payload.end_date is not None:
-            project.end_date = payload.end_date
-        if payload.technologies_used is not None:
-            project.technologies_used = payload.technologies_used
-        if payload.is_featured is not None:
-            project.is_featured = payload.is_featured
-        if payload.display_order is not None:
-            project.display_order = payload.display_order
-        if payload.is_active is not None:
-            project.is_active = payload.is_active
-
-        await self.db.commit()
-        await self.db.refresh(project)
-        return project
+        return await self._update_returning(
+            payload, user_id, self._owned(project_id, user_id)
+        )
 
     async def delete_project(self, project_id: UUID, user_id: UUID) -> bool:
         """Delete project by ID"""
-        project = await self.get_project_by_id(project_id, user_id)
-
-        if not project:
-            return False
-
-        await self.db.delete(project)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(user_id, self._owned(project_id, user_id))
@@ -2,18 +2,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import Publication
 from schemas.user_input_schemas.publication_schemas import (
     PublicationCreateSchema,
     PublicationUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class PublicationOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class PublicationOperations(SectionOperations[Publication]):
+    model = Publication
 
     async def create_publication(
         self, payload: PublicationCreateSchema, user_id: UUID
@@ -33,20 +35,23 @@ class PublicationOperations:
             is_active=payload.is_active,
         )
         self.db.add(publication)
-        await self.db.commit()
-        await self.db.refresh(publication)
+        await self._commit_changes(user_id)
         return publication
 
     async def get_all_publications(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Publication]:
         """Retrieve all publications for a user"""
-        query = (
-            select(Publication)
-            .where(Publication.user_id == user_id)
-            .order_by(Publication.display_order)
-            .offset(skip)
-            .limit(limit)
+        query = paginate(
+            select(Publication).where(Publication.user_id == user_id),
+            Publication,
+            skip,
+            limit,
+            cursor,
         )
         result = await self.db.execute(query)
         publications = result.scalars().all()
@@ -70,41 +75,12 @@ class PublicationOperations:
         user_id: UUID,
     ) -> Optional[Publication]:
         """Update existing publication"""
-        publication = await self.get_publication_by_id(publication_id, user_id)
-
-        if not publication:
-            return None
-
-        if payload.title is not None:
-            publication.title = payload.title
-        if payload.authors is not None:
-            publication.authors = payload.authors
-        if payload.publication_venue is not None:
-            publication.publication_venue = payload.publication_venue
-        if payload.publication_date is not None:
-            publication.publication_date = payload.publication_date
-        if payload.doi is not None:
-            publication.doi = payload.doi
-        if payload.url is not None:
-            publication.url = payload.url
-        if payload.description is not None:
-            publication.description = payload.description
-        if payload.display_order is not None:
-            publication.display_order = payload.display_order
-        if payload.is_active is not None:
-            publication.is_active = payload.is_active
-
-        await self.db.commit()
-        await self.db.refresh(publication)
-        return publication
+        return await self._update_returning(
+            payload, user_id, self._owned(publication_id, user_id)
+        )
 
     async def delete_publication(self, publication_id: UUID, user_id: UUID) -> bool:
         """Delete publication by ID"""
-        publication = await self.get_publication_by_id(publication_id, user_id)
-
-        if not publication:
-            return False
-
-        await self.db.delete(publication)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(
+            user_id, self._owned(publication_id, user_id)
+        )
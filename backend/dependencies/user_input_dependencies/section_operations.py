@@ -0,0 +1,339 @@
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Uuid,
+    column,
+    delete,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Base, User
+from utils.invalidation import notify
+from utils.profile_cache import profile_cache
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+# Ownership columns are never written from a request payload
+PROTECTED_COLUMNS = frozenset({"id", "user_id"})
+
+
+def create_values(model: Type[Base], payload: BaseModel) -> Dict[str, Any]:
+    """Columns to write for a new entry from a create payload"""
+    columns = model.__table__.columns
+    return {
+        name: value
+        for name, value in payload.model_dump().items()
+        if name in columns and name not in PROTECTED_COLUMNS
+    }
+
+
+def update_values(model: Type[Base], payload: BaseModel) -> Dict[str, Any]:
+    """Columns to write for a partial update.
+
+    Only fields the client sent are written. Fields sent as null are skipped,
+    so a partial update never clears a column.
+    """
+    columns = model.__table__.columns
+    return {
+        name: value
+        for name, value in payload.model_dump(exclude_unset=True).items()
+        if value is not None and name in columns and name not in PROTECTED_COLUMNS
+    }
+
+
+async def bump_profile_version(db: AsyncSession, user_id: UUID) -> int:
+    """Increment the user's profile version within the current transaction.
+
+    The new version is also published to the other workers, on commit.
+    """
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        # A profile change is not an account change, keep users.updated_at
+        .values(profile_version=User.profile_version + 1, updated_at=User.updated_at)
+        .returning(
+            User.profile_version, notify("profile", User.id, User.profile_version)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one()
+
+
+class SectionOperations(Generic[ModelT]):
+    """Shared single-statement writes for the profile section operations.
+
+    Updates and deletes are one UPDATE/DELETE ... RETURNING scoped to the
+    owning user instead of a SELECT followed by a flush and a refresh. Every
+    write bumps the user's profile version in the same transaction and drops
+    the user's cached profile responses.
+    """
+
+    model: Type[ModelT]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _commit_changes(self, user_id: UUID, changed: bool = True) -> None:
+        """Commit, bumping the user's profile version if anything was written"""
+        if not changed:
+            await self.db.commit()
+            return
+
+        await bump_profile_version(self.db, user_id)
+        await self.db.commit()
+        await profile_cache.invalidate(user_id)
+
+    def _owned(self, item_id: UUID, user_id: UUID) -> List[ColumnElement[bool]]:
+        table = self.model.__table__
+        return [table.c.id == item_id, table.c.user_id == user_id]
+
+    def _owned_by(self, user_id: UUID) -> List[ColumnElement[bool]]:
+        return [self.model.__table__.c.user_id == user_id]
+
+    async def _insert_unless_exists(self, values: Dict[str, Any]) -> Optional[ModelT]:
+        """Insert the user's only entry of a one-to-one section.
+
+        One INSERT ... ON CONFLICT (user_id) DO NOTHING RETURNING, so
+        concurrent creates cannot both succeed. Returns None when the user
+        already has an entry.
+        """
+        table = self.model.__table__
+        query = (
+            pg_insert(self.model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[table.c.user_id])
+            .returning(self.model)
+        )
+        result = await self.db.scalars(query)
+        item = result.one_or_none()
+        await self._commit_changes(values["user_id"], item is not None)
+        return item
+
+    async def _update_returning(
+        self, payload: BaseModel, user_id: UUID, criteria: List[ColumnElement[bool]]
+    ) -> Optional[ModelT]:
+        """Apply a partial update and return the updated row, or None"""
+        values = update_values(self.model, payload)
+        if not values:
+            result = await self.db.execute(select(self.model).where(*criteria))
+            return result.scalar_one_or_none()
+
+        query = (
+            update(self.model)
+            .where(*criteria)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        item = result.scalar_one_or_none()
+        await self._commit_changes(user_id, item is not None)
+        return item
+
+    async def _delete_returning(
+        self, user_id: UUID, criteria: List[ColumnElement[bool]]
+    ) -> bool:
+        """Delete the matching row. Returns False if there was none"""
+        table = self.model.__table__
+        query = delete(self.model).where(*criteria).returning(table.c.id)
+        result = await self.db.execute(query)
+        deleted = result.scalar_one_or_none() is not None
+        await self._commit_changes(user_id, deleted)
+        return deleted
+
+    async def create_many(
+        self, payloads: Sequence[BaseModel], user_id: UUID
+    ) -> List[ModelT]:
+        """Insert several entries with one multi-row INSERT ... RETURNING"""
+        rows = [
+            {**create_values(self.model, payload), "user_id": user_id}
+            for payload in payloads
+        ]
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.db.scalars(query, rows)
+        items = list(result.all())
+        await self._commit_changes(user_id, bool(items))
+        return items
+
+    async def update_many(
+        self,
+        changes: Sequence[Tuple[UUID, BaseModel]],
+        user_id: UUID,
+        atomic: bool = True,
+    ) -> Tuple[Dict[UUID, ModelT], List[UUID]]:
+        """Apply partial updates to several entries of a user in one transaction.
+
+        Returns the updated entries by ID and the IDs the user does not own.
+        With `atomic`, nothing is written when any ID is missing.
+        """
+        table = self.model.__table__
+        ids = {item_id for item_id, _ in changes}
+        owned = set(
+            await self.db.scalars(
+                select(table.c.id)
+                .where(table.c.id.in_(ids), table.c.user_id == user_id)
+                .with_for_update()
+            )
+        )
+        missing = [item_id for item_id, _ in changes if item_id not in owned]
+        if missing and atomic:
+            await self.db.rollback()
+            return {}, missing
+
+        rows = [
+            {"id": item_id, **values}
+            for item_id, payload in changes
+            if item_id in owned and (values := update_values(self.model, payload))
+        ]
+        if rows:
+            # ORM bulk UPDATE by primary key, sent as one executemany
+            await self.db.execute(update(self.model), rows)
+
+        result = await self.db.execute(
+            select(table.c.id, self.model)
+            .where(table.c.id.in_(owned))
+            .execution_options(populate_existing=True)
+        )
+        updated: Dict[UUID, ModelT] = {item_id: item for item_id, item in result}
+        await self._commit_changes(user_id, bool(rows))
+        return updated, missing
+
+    async def delete_many(
+        self, ids: Sequence[UUID], user_id: UUID, atomic: bool = True
+    ) -> Tuple[Set[UUID], List[UUID]]:
+        """Delete several entries of a user with one DELETE ... RETURNING.
+
+        Returns the deleted IDs and the IDs the user does not own. With
+        `atomic`, nothing is deleted when any ID is missing.
+        """
+        table = self.model.__table__
+        query = (
+            delete(self.model)
+            .where(table.c.id.in_(ids), table.c.user_id == user_id)
+            .returning(table.c.id)
+        )
+        deleted = set(await self.db.scalars(query))
+        missing = [item_id for item_id in ids if item_id not in deleted]
+        if missing and atomic:
+            await self.db.rollback()
+            return set(), missing
+
+        await self._commit_changes(user_id, bool(deleted))
+        return deleted, missing
+
+    async def sync(
+        self, items: Sequence[BaseModel], user_id: UUID
+    ) -> Tuple[Dict[str, List[UUID]], List[UUID]]:
+        """Make the user's entries match `items`, in that order.
+
+        Items with an `id` update the stored entry, items without one are
+        created, and stored entries not in `items` are deleted. The position
+        of an item becomes its display order. Only changed columns are
+        written, so an unchanged list writes nothing.
+
+        Returns the IDs per kind of change and the item IDs the user does
+        not own. Nothing is written when any ID is missing.
+        """
+        table = self.model.__table__
+        result = await self.db.execute(
+            select(table.c.id, self.model)
+            .where(table.c.user_id == user_id)
+            .with_for_update()
+        )
+        stored: Dict[UUID, ModelT] = {item_id: item for item_id, item in result}
+        changes: Dict[str, List[UUID]] = {
+            "created": [],
+            "updated": [],
+            "deleted": [],
+            "unchanged": [],
+        }
+
+        new_rows = []
+        updated_rows = []
+        missing = []
+        for position, item in enumerate(items):
+            values = {**create_values(self.model, item), "display_order": position}
+            item_id = getattr(item, "id", None)
+            if item_id is None:
+                new_rows.append({**values, "user_id": user_id})
+            elif item_id not in stored:
+                missing.append(item_id)
+            else:
+                current = stored.pop(item_id)
+                diff = {
+                    name: value
+                    for name, value in values.items()
+                    if getattr(current, name) != value
+                }
+                if diff:
+                    updated_rows.append({"id": item_id, **diff})
+                    changes["updated"].append(item_id)
+                else:
+                    changes["unchanged"].append(item_id)
+
+        if missing:
+            await self.db.rollback()
+            return changes, missing
+
+        # Entries left in `stored` are not in the requested list
+        if stored:
+            await self.db.execute(delete(self.model).where(table.c.id.in_(stored)))
+            changes["deleted"] = list(stored)
+        if updated_rows:
+            await self.db.execute(update(self.model), updated_rows)
+        if new_rows:
+            created = await self.db.scalars(
+                insert(self.model).returning(table.c.id, sort_by_parameter_order=True),
+                new_rows,
+            )
+            changes["created"] = list(created)
+
+        await self._commit_changes(user_id, bool(stored or updated_rows or new_rows))
+        return changes, missing
+
+    async def reorder(self, ids: Sequence[UUID], user_id: UUID) -> List[UUID]:
+        """Set the display order of the user's entries to their position in `ids`.
+
+        All positions are written by one UPDATE ... FROM (VALUES ...). Returns
+        the IDs the user does not own; nothing is written when there are any.
+        """
+        table = self.model.__table__
+        positions = values(
+            column("id", Uuid()), column("display_order", Integer()), name="positions"
+        ).data([(item_id, position) for position, item_id in enumerate(ids)])
+        query = (
+            update(self.model)
+            .where(table.c.id == positions.c.id, table.c.user_id == user_id)
+            .values(display_order=positions.c.display_order)
+            .returning(table.c.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(query)
+        reordered = set(result.scalars().all())
+        missing = [item_id for item_id in ids if item_id not in reordered]
+        if missing:
+            await self.db.rollback()
+            return missing
+
+        await self._commit_changes(user_id)
+        return missing
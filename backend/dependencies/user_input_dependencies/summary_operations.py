@@ -2,8 +2,10 @@ from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import Summary
 from schemas.user_input_schemas.summary_schemas import (
     SummaryCreateSchema,
@@ -11,24 +13,21 @@ from schemas.user_input_schemas.summary_schemas import (
 )
 
 
-class SummaryOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class SummaryOperations(SectionOperations[Summary]):
+    model = Summary
 
     async def create_summary(
         self, payload: SummaryCreateSchema, user_id: UUID
-    ) -> Summary:
-        """Create a summary in the database"""
-        summary = Summary(
-            user_id=user_id,
-            summary_text=payload.summary_text,
-            summary_enhanced=None,  # Placeholder for AI enhancement
-            is_ai_generated=False,
+    ) -> Optional[Summary]:
+        """Create a summary unless the user already has one"""
+        return await self._insert_unless_exists(
+            {
+                "user_id": user_id,
+                "summary_text": payload.summary_text,
+                "summary_enhanced": None,  # Placeholder for AI enhancement
+                "is_ai_generated": False,
+            }
         )
-        self.db.add(summary)
-        await self.db.commit()
-        await self.db.refresh(summary)
-        return summary
 
     async def get_summary_by_id(
         self, summary_id: UUID, user_id: UUID
@@ -52,52 +51,20 @@ class SummaryOperations:
         self, summary_id: UUID, user_id: UUID, payload: SummaryUpdateSchema
     ) -> Optional[Summary]:
         """Update existing summary"""
-        summary = await self.get_summary_by_id(summary_id, user_id)
-
-        if not summary:
-            return None
-
-        if payload.summary_text is not None:
-            summary.summary_text = payload.summary_text
-
-        await self.db.commit()
-        await self.db.refresh(summary)
-        return summary
+        return await self._update_returning(
+            payload, user_id, self._owned(summary_id, user_id)
+        )
 
     async def update_summary_by_user(
         self, user_id: UUID, payload: SummaryUpdateSchema
     ) -> Optional[Summary]:
         """Update existing summary for a user"""
-        summary = await self.get_summary_by_user_id(user_id)
-
-        if not summary:
-            return None
-
-        if payload.summary_text is not None:
-            summary.summary_text = payload.summary_text
-
-        await self.db.commit()
-        await self.db.refresh(summary)
-        return summary
+        return await self._update_returning(payload, user_id, self._owned_by(user_id))
 
     async def delete_summary(self, summary_id: UUID, user_id: UUID) -> bool:
         """Delete summary by ID"""
-        summary = await self.get_summary_by_id(summary_id, user_id)
-
-        if not summary:
-            return False
-
-        await self.db.delete(summary)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(user_id, self._owned(summary_id, user_id))
 
     async def delete_summary_by_user(self, user_id: UUID) -> bool:
         """Delete summary by User ID"""
-        summary = await self.get_summary_by_user_id(user_id)
-
-        if not summary:
-            return False
-
-        await self.db.delete(summary)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(user_id, self._owned_by(user_id))
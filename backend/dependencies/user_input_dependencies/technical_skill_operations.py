@@ -2,18 +2,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
 from models import TechnicalSkill
 from schemas.user_input_schemas.technical_skill_schemas import (
     TechnicalSkillCreateSchema,
     TechnicalSkillUpdateSchema,
 )
+from utils.pagination import Cursor, paginate
 
 
-class TechnicalSkillOperations:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+class TechnicalSkillOperations(SectionOperations[TechnicalSkill]):
+    model = TechnicalSkill
 
     async def create_technical_skill(
         self, payload: TechnicalSkillCreateSchema, user_id: UUID
@@ -27,20 +29,23 @@ class TechnicalSkillOperations:
             is_active=payload.is_active,
         )
         self.db.add(technical_skill)
-        await self.db.commit()
-        await self.db.refresh(technical_skill)
+        await self._commit_changes(user_id)
         return technical_skill
 
     async def get_all_technical_skills(
-        self, user_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[TechnicalSkill]:
         """Retrieve all technical skills for a user"""
-        query = (
-            select(TechnicalSkill)
-            .where(TechnicalSkill.user_id == user_id)
-            .order_by(TechnicalSkill.display_order)
-            .offset(skip)
-            .limit(limit)
+        query = paginate(
+            select(TechnicalSkill).where(TechnicalSkill.user_id == user_id),
+            TechnicalSkill,
+            skip,
+            limit,
+            cursor,
         )
         result = await self.db.execute(query)
         skills = result.scalars().all()
@@ -61,31 +66,10 @@ class TechnicalSkillOperations:
         self, skill_id: UUID, user_id: UUID, payload: TechnicalSkillUpdateSchema
     ) -> Optional[TechnicalSkill]:
         """Update existing technical skill"""
-        skill = await self.get_technical_skill_by_id(skill_id, user_id)
-
-        if not skill:
-            return None
-
-        if payload.category is not None:
-            skill.category = payload.category
-        if payload.skills is not None:
-            skill.skills = payload.skills
-        if payload.display_order is not None:
-            skill.display_order = payload.display_order
-        if payload.is_active is not None:
-            skill.is_active = payload.is_active
-
-        await self.db.commit()
-        await self.db.refresh(skill)
-        return skill
+        return await self._update_returning(
+            payload, user_id, self._owned(skill_id, user_id)
+        )
 
     async def delete_technical_skill(self, skill_id: UUID, user_id: UUID) -> bool:
         """Delete technical skill by ID"""
-        skill = await self.get_technical_skill_by_id(skill_id, user_id)
-
-        if not skill:
-            return False
-
-        await self.db.delete(skill)
-        await self.db.commit()
-        return True
+        return await self._delete_returning(user_id, self._owned(skill_id, user_id))
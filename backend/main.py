@@ -1,10 +1,10 @@
 from contextlib import asynccontextmanager
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 from uuid import uuid4
 
 from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -19,6 +19,7 @@ from routes.user_input_routes.custom_section_routes import (
 from routes.user_input_routes.education_routes import router as education_routes
 from routes.user_input_routes.experience_routes import router as experience_routes
 from routes.user_input_routes.personal_info_routes import router as personal_info_routes
+from routes.user_input_routes.profile_routes import router as profile_routes
 from routes.user_input_routes.project_routes import router as project_routes
 from routes.user_input_routes.publication_routes import router as publication_routes
 from routes.user_input_routes.summary_routes import router as summary_routes
@@ -28,19 +29,57 @@ from routes.user_input_routes.technical_skill_routes import (
 from routes.user_input_routes.user_routes import router as user_routes
 from schemas.common import ErrorResponseSchema
 from settings import settings
+from utils.cache import CacheBackend, TieredBackend, cache
 from utils.constants import API_RATE_LIMIT
+from utils.etag import ETAG_HEADER, PROFILE_VERSION_HEADER
+from utils.invalidation import invalidation_listener
 from utils.logger import RequestContextVar, get_logger, request_ctx_var
+from utils.metrics import metrics_registry
+from utils.pagination import NEXT_CURSOR_HEADER
+from utils.resp_cache import RespBackend
+from utils.shm_cache import SharedMemoryBackend
 
 logger = get_logger()
 
 
+def shared_cache_backend() -> Optional[CacheBackend]:
+    """Cache tier shared by the workers, as configured in the settings"""
+    if settings.CACHE_SHARED_BACKEND == "shared_memory":
+        return SharedMemoryBackend(
+            settings.CACHE_SHARED_MEMORY_PATH,
+            settings.CACHE_SHARED_MEMORY_SLOTS,
+            settings.CACHE_SHARED_MEMORY_SLOT_BYTES,
+        )
+    if settings.CACHE_SHARED_BACKEND == "resp":
+        return RespBackend.from_url(
+            settings.CACHE_RESP_URL, max_ttl=settings.CACHE_RESP_TTL_SECONDS
+        )
+    return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize db pool
     if not sessionmanager.session_factory:
         sessionmanager.init_db()
+    # Share cached values with the other workers
+    memory_backend = cache.backend
+    shared_backend = shared_cache_backend()
+    if shared_backend is not None:
+        cache.backend = TieredBackend(
+            memory_backend,
+            shared_backend,
+            local_ttl=settings.CACHE_SHARED_LOCAL_TTL_SECONDS or None,
+        )
+    # Apply cache invalidations from the other workers
+    if settings.CACHE_INVALIDATION_ENABLED:
+        invalidation_listener.start()
 
     yield
+    await invalidation_listener.stop()
+    if shared_backend is not None:
+        cache.backend = memory_backend
+        await shared_backend.close()
     await sessionmanager.close()
 
 
@@ -61,6 +100,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, PROFILE_VERSION_HEADER],
 )
 
 
@@ -103,6 +143,7 @@ async def logging_middleware(
 app.include_router(cv_parser_routes, prefix="/api/cv_parser", tags=["CV parser"])
 app.include_router(auth_routes, prefix="/api/auth", tags=["Auth"])
 app.include_router(user_routes, prefix="/api/users", tags=["User Management"])
+app.include_router(profile_routes, prefix="/api/profile", tags=["Profile"])
 app.include_router(
     personal_info_routes, prefix="/api/personal-info", tags=["Personal Info"]
 )
@@ -128,3 +169,8 @@ app.include_router(
 @limiter.limit(API_RATE_LIMIT)
 async def healthz(request: Request) -> str:
     return "ok!"
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics() -> str:
+    return metrics_registry.render()
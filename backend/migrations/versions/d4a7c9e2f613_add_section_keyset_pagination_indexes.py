@@ -0,0 +1,54 @@
+"""add_section_keyset_pagination_indexes
+
+Revision ID: d4a7c9e2f613
+Revises: c81f3a6d5e29
+Create Date: 2026-10-19 16:18:35.904127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a7c9e2f613"
+down_revision: Union[str, Sequence[str], None] = "c81f3a6d5e29"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SECTION_TABLES = (
+    "education",
+    "experiences",
+    "projects",
+    "technical_skills",
+    "publications",
+    "certifications",
+    "custom_sections",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so section tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        for table in SECTION_TABLES:
+            op.create_index(
+                f"ix_{table}_user_id_display_order_id",
+                table,
+                ["user_id", "display_order", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in SECTION_TABLES:
+            op.drop_index(
+                f"ix_{table}_user_id_display_order_id",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,48 @@
+"""add_user_id_indexes_to_profile_tables
+
+Revision ID: e9b3f5a1c748
+Revises: d4a7c9e2f613
+Create Date: 2026-10-19 16:52:09.318422
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9b3f5a1c748"
+down_revision: Union[str, Sequence[str], None] = "d4a7c9e2f613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Section tables with list queries got (user_id, display_order, id) indexes in
+# d4a7c9e2f613; these are only ever looked up by user_id.
+USER_ID_TABLES = ("personal_info", "summaries", "resumes")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        for table in USER_ID_TABLES:
+            op.create_index(
+                op.f(f"ix_{table}_user_id"),
+                table,
+                ["user_id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in USER_ID_TABLES:
+            op.drop_index(
+                op.f(f"ix_{table}_user_id"),
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,84 @@
+"""make_one_to_one_user_id_unique
+
+Revision ID: f2c6a8d4b391
+Revises: e9b3f5a1c748
+Create Date: 2026-10-19 18:07:41.552093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.exc import IntegrityError
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c6a8d4b391"
+down_revision: Union[str, Sequence[str], None] = "e9b3f5a1c748"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables holding at most one row per user, upserted with ON CONFLICT (user_id)
+ONE_TO_ONE_TABLES = ("personal_info", "summaries")
+
+# The code still deployed may insert a duplicate while the unique index is
+# built, which fails the build; duplicates are deleted again before a retry
+BUILD_ATTEMPTS = 5
+
+
+def _delete_duplicates(table: str) -> None:
+    """Keep each user's newest row"""
+    op.execute(
+        f"""
+        DELETE FROM {table} AS stale
+        USING {table} AS kept
+        WHERE stale.user_id = kept.user_id
+          AND (stale.updated_at, stale.id) < (kept.updated_at, kept.id)
+        """
+    )
+
+
+def _replace_index(table: str, unique: bool) -> None:
+    """Swap ix_<table>_user_id for one of the given uniqueness.
+
+    The new index is built under a temporary name, so the table keeps an
+    index on user_id until it is valid; a failed concurrent build leaves
+    an invalid index behind, which is dropped before the next attempt.
+    """
+    index = f"ix_{table}_user_id"
+    new_index = f"{index}_new"
+    for attempt in range(BUILD_ATTEMPTS):
+        op.drop_index(
+            new_index, table_name=table, postgresql_concurrently=True, if_exists=True
+        )
+        if unique:
+            _delete_duplicates(table)
+        try:
+            op.create_index(
+                new_index,
+                table,
+                ["user_id"],
+                unique=unique,
+                postgresql_concurrently=True,
+            )
+            break
+        except IntegrityError:
+            if attempt == BUILD_ATTEMPTS - 1:
+                raise
+    op.drop_index(index, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.execute(f"ALTER INDEX {new_index} RENAME TO {index}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Each statement commits on its own, so the tables stay writable and
+    # every DELETE is visible to the index build that follows it
+    with op.get_context().autocommit_block():
+        for table in ONE_TO_ONE_TABLES:
+            _replace_index(table, unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in ONE_TO_ONE_TABLES:
+            _replace_index(table, unique=False)
@@ -1,13 +1,16 @@
 import uuid
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Date,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -21,7 +24,9 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all models."""
 
-    pass
+    # Fetch generated columns with INSERT/UPDATE ... RETURNING on flush, so
+    # new objects are complete without a refresh
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class User(Base):
@@ -38,6 +43,10 @@ class User(Base):
         String(255), unique=True, nullable=False, index=True
     )
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
+    # Bumped in the same transaction as every write to the user's profile
+    profile_version: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), nullable=False
     )
@@ -56,25 +65,46 @@ class User(Base):
         "Summary", back_populates="user", uselist=False, cascade="all, delete-orphan"
     )
     education: Mapped[List["Education"]] = relationship(
-        "Education", back_populates="user", cascade="all, delete-orphan"
+        "Education",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[Education.display_order, Education.id]",
     )
     experiences: Mapped[List["Experience"]] = relationship(
-        "Experience", back_populates="user", cascade="all, delete-orphan"
+        "Experience",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[Experience.display_order, Experience.id]",
     )
     projects: Mapped[List["Project"]] = relationship(
-        "Project", back_populates="user", cascade="all, delete-orphan"
+        "Project",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[Project.display_order, Project.id]",
     )
     technical_skills: Mapped[List["TechnicalSkill"]] = relationship(
-        "TechnicalSkill", back_populates="user", cascade="all, delete-orphan"
+        "TechnicalSkill",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[TechnicalSkill.display_order, TechnicalSkill.id]",
     )
     publications: Mapped[List["Publication"]] = relationship(
-        "Publication", back_populates="user", cascade="all, delete-orphan"
+        "Publication",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[Publication.display_order, Publication.id]",
     )
     certifications: Mapped[List["Certification"]] = relationship(
-        "Certification", back_populates="user", cascade="all, delete-orphan"
+        "Certification",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[Certification.display_order, Certification.id]",
     )
     custom_sections: Mapped[List["CustomSection"]] = relationship(
-        "CustomSection", back_populates="user", cascade="all, delete-orphan"
+        "CustomSection",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        order_by="[CustomSection.display_order, CustomSection.id]",
     )
     resumes: Mapped[List["Resume"]] = relationship(
         "Resume", back_populates="user", cascade="all, delete-orphan"
@@ -119,7 +149,11 @@ class PersonalInfo(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True,
     )
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -153,7 +187,11 @@ class Summary(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True,
     )
 
     # User's original input
@@ -189,6 +227,12 @@ class Education(Base):
     """Education Model - Stores academic background"""
 
     __tablename__ = "education"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_education_user_id_display_order_id", "user_id", "display_order", "id"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -237,6 +281,12 @@ class Experience(Base):
     """Experience Model - Stores work history with AI enhancement"""
 
     __tablename__ = "experiences"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_experiences_user_id_display_order_id", "user_id", "display_order", "id"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -289,6 +339,10 @@ class Project(Base):
     """Project Model - Stores portfolio projects with AI enhancement"""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index("ix_projects_user_id_display_order_id", "user_id", "display_order", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -340,6 +394,15 @@ class TechnicalSkill(Base):
     """TechnicalSkill Model - Stores grouped technical skills"""
 
     __tablename__ = "technical_skills"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_technical_skills_user_id_display_order_id",
+            "user_id",
+            "display_order",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -371,6 +434,12 @@ class Publication(Base):
     """Publication Model - Stores research papers and publications"""
 
     __tablename__ = "publications"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_publications_user_id_display_order_id", "user_id", "display_order", "id"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -417,6 +486,15 @@ class Certification(Base):
     """Certification Model - Stores professional certifications"""
 
     __tablename__ = "certifications"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_certifications_user_id_display_order_id",
+            "user_id",
+            "display_order",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -463,6 +541,15 @@ class CustomSection(Base):
     """CustomSection Model - Stores flexible user-defined sections with AI enhancement"""
 
     __tablename__ = "custom_sections"
+    __table_args__ = (
+        # Keyset pagination of a user's entries
+        Index(
+            "ix_custom_sections_user_id_display_order_id",
+            "user_id",
+            "display_order",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -509,7 +596,10 @@ class Resume(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     job_description: Mapped[str] = mapped_column(Text, nullable=False)
     company_name: Mapped[Optional[str]] = mapped_column(String(255))
@@ -539,3 +629,72 @@ class Resume(Base):
 
     def __repr__(self):
         return f"<Resume: {self.id} for User {self.user_id}>"
+
+
+class CVParseRun(Base):
+    """CVParseRun Model - Stores stage timings and token usage of each CV parse"""
+
+    __tablename__ = "cv_parse_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    file_name: Mapped[Optional[str]] = mapped_column(String(255))
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    # SHA-256 of the uploaded file, to spot repeated uploads
+    file_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    model: Mapped[str] = mapped_column(String(50), nullable=False)
+    routing_reason: Mapped[Optional[str]] = mapped_column(String(50))
+    escalated: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="success", nullable=False)
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Token usage
+    input_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    prompt_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completion_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Stage name -> duration in milliseconds
+    stage_timings: Mapped[Dict[str, float]] = mapped_column(JSON, nullable=False)
+    total_ms: Mapped[float] = mapped_column(Float, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CVParseRun: {self.id} for User {self.user_id}>"
+
+
+class CVImportPreview(Base):
+    """CVImportPreview Model - Holds a parsed CV until the user commits the import"""
+
+    __tablename__ = "cv_import_previews"
+
+    # The id doubles as the preview token handed to the client
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    file_name: Mapped[Optional[str]] = mapped_column(String(255))
+    parsed_data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CVImportPreview: {self.id} for User {self.user_id}>"
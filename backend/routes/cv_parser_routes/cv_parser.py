@@ -1,196 +1,385 @@
-from datetime import date
-from typing import Optional
+import asyncio
+import hashlib
+import json
+from contextlib import nullcontext
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
+from db import db_session, get_db
 from dependencies.auth_dependencies.auth import get_current_user
-from models import (
-    Education,
-    Experience,
-    PersonalInfo,
-    Project,
-    TechnicalSkill,
-    User,
+from dependencies.cv_parser_dependencies.cv_parser_operations import (
+    CVParserOperations,
+)
+from models import User
+from schemas.cv_parser_schemas.cv_parser import (
+    CVImportPreviewResponseSchema,
+    CVImportResponseSchema,
+    CVParseRunResponseSchema,
+    ParsedCVSchema,
 )
-from services.cv_parser import CVParserService
+from services.cv_parser import CVParserService, ProgressCallback
 from utils.logger import get_logger
+from utils.single_flight import SingleFlight
+from utils.timing import StageTimer
 
 router = APIRouter()
 logger = get_logger()
 
+# Duplicate uploads of the same CV by the same user share one parse and import;
+# the parse has its own session, so it outlives the upload that started it
+cv_parse_flights = SingleFlight(detach=True)
+# Progress callbacks of the uploads waiting on each shared parse
+cv_parse_listeners: Dict[Hashable, List[ProgressCallback]] = {}
 
-def parse_date(date_str: Optional[str]) -> Optional[date]:
-    """Helper to parse YYYY-MM-DD string to date object."""
-    if not date_str:
-        return None
+
+async def _record_parse_run(
+    ops: CVParserOperations,
+    user: User,
+    file_name: Optional[str],
+    file_size: int,
+    file_hash: str,
+    parser_service: CVParserService,
+    timer: StageTimer,
+    error_message: Optional[str] = None,
+) -> None:
+    parser_service.record_metrics(timer)
     try:
-        return date.fromisoformat(date_str)
-    except ValueError:
-        return None
+        await ops.record_parse_run(
+            user_id=user.id,
+            file_name=file_name,
+            file_size=file_size,
+            file_hash=file_hash,
+            model=parser_service.routed_model,
+            timer=timer,
+            routing_reason=parser_service.routing_reason,
+            escalated=parser_service.escalated,
+            input_tokens=parser_service.input_tokens,
+            prompt_tokens=parser_service.prompt_tokens,
+            completion_tokens=parser_service.completion_tokens,
+            error_message=error_message,
+        )
+    except Exception as e:
+        await ops.db.rollback()
+        logger.error(
+            "Error recording CV parse run:",
+            extra={"error": str(e), "user_id": user.id},
+        )
 
 
-@router.post("/upload_cv/")
-async def upload_cv(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
+async def _read_upload(file: UploadFile, user: User, timer: StageTimer) -> bytes:
     if file.content_type != "application/pdf":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF files are supported",
         )
 
-    logger.info(
-        "CV uploaded:", extra={"file_name": file.filename, "user_id": current_user.id}
-    )
+    logger.info("CV uploaded:", extra={"file_name": file.filename, "user_id": user.id})
 
-    try:
-        contents = await file.read()
-        parser_service = CVParserService()
-        parsed_data = await parser_service.parse_cv(contents)
-        logger.info("Parsed Content from resume", extra={"Resume data": parsed_data})
-        #  Personal Info
-        p_info_data = parsed_data.get("personal_info")
-        if p_info_data:
-            result = await db.execute(
-                select(PersonalInfo).where(PersonalInfo.user_id == current_user.id)
-            )
-            personal_info = result.scalar_one_or_none()
+    with timer.stage("read"):
+        return await file.read()
 
-            if personal_info:
-                personal_info.full_name = (
-                    p_info_data.get("full_name") or personal_info.full_name
-                )
-                personal_info.email = p_info_data.get("email") or personal_info.email
-                personal_info.phone = p_info_data.get("phone") or personal_info.phone
-                personal_info.location = (
-                    p_info_data.get("location") or personal_info.location
-                )
-                personal_info.linkedin_url = (
-                    p_info_data.get("linkedin_url") or personal_info.linkedin_url
-                )
-                personal_info.github_url = (
-                    p_info_data.get("github_url") or personal_info.github_url
-                )
-                personal_info.portfolio_url = (
-                    p_info_data.get("portfolio_url") or personal_info.portfolio_url
-                )
-                personal_info.website_url = (
-                    p_info_data.get("website_url") or personal_info.website_url
-                )
-                personal_info.professional_title = (
-                    p_info_data.get("professional_title")
-                    or personal_info.professional_title
+
+async def _parse_upload(
+    contents: bytes,
+    file_name: Optional[str],
+    current_user: User,
+    timer: StageTimer,
+    action: str,
+    save: Callable[[CVParserOperations, Dict[str, Any]], Awaitable[Any]],
+    on_progress: Optional[ProgressCallback] = None,
+) -> Any:
+    """Parse an uploaded CV, store the result with `save` and time every stage.
+
+    Concurrent uploads of the same file by the same user for the same action
+    await the in-flight parse and return its result. The parse has its own
+    session and keeps running while any of these uploads waits for it, so a
+    client going away does not fail the others. Progress events go to every
+    waiting upload.
+    """
+    file_hash = hashlib.sha256(contents).hexdigest()
+    key = (action, current_user.id, file_hash)
+
+    def publish(event: str, data: Dict[str, Any]) -> None:
+        for listener in list(cv_parse_listeners.get(key, ())):
+            listener(event, data)
+
+    async def parse_and_save() -> Tuple[Any, Dict[str, float]]:
+        parse_timer = timer.copy()
+        parser_service = CVParserService()
+        async with db_session() as db:
+            ops = CVParserOperations(db)
+            try:
+                parsed_data = await parser_service.parse_cv(
+                    contents,
+                    timer=parse_timer,
+                    # Streaming uploads may join a parse started without one
+                    on_progress=publish,
                 )
-            else:
-                # Create new
-                personal_info = PersonalInfo(
-                    user_id=current_user.id,
-                    full_name=p_info_data.get("full_name")
-                    or f"{current_user.first_name} {current_user.last_name}",
-                    email=p_info_data.get("email") or current_user.email,
-                    phone=p_info_data.get("phone"),
-                    location=p_info_data.get("location"),
-                    linkedin_url=p_info_data.get("linkedin_url"),
-                    github_url=p_info_data.get("github_url"),
-                    portfolio_url=p_info_data.get("portfolio_url"),
-                    website_url=p_info_data.get("website_url"),
-                    professional_title=p_info_data.get("professional_title"),
+                logger.info(
+                    "Parsed Content from resume", extra={"Resume data": parsed_data}
                 )
-                db.add(personal_info)
-
-        #  Education
-        education_list = parsed_data.get("education", [])
-        if education_list:
-            for edu in education_list:
-                new_edu = Education(
-                    user_id=current_user.id,
-                    institution_name=edu.get("institution_name")
-                    or "Unknown Institution",
-                    degree=edu.get("degree") or "Unknown Degree",
-                    field_of_study=edu.get("field_of_study"),
-                    start_date=parse_date(edu.get("start_date")),
-                    end_date=parse_date(edu.get("end_date")),
-                    is_current=edu.get("is_current", False),
-                    grade=edu.get("grade"),
-                    location=edu.get("location"),
-                    description=edu.get("description"),
+
+                with parse_timer.stage("db"):
+                    saved = await save(ops, parsed_data)
+
+            except Exception as e:
+                await db.rollback()
+                logger.error(
+                    "Error processing CV upload:",
+                    extra={"error": str(e), "user_id": current_user.id},
                 )
-                db.add(new_edu)
-
-        # Experiences
-        experience_list = parsed_data.get("experiences", [])
-        if experience_list:
-            for exp in experience_list:
-                new_exp = Experience(
-                    user_id=current_user.id,
-                    job_title=exp.get("job_title") or "Unknown Title",
-                    company_name=exp.get("company_name") or "Unknown Company",
-                    location=exp.get("location"),
-                    employment_type=exp.get("employment_type"),
-                    start_date=parse_date(exp.get("start_date"))
-                    or date.today(),  # valid start_date
-                    end_date=parse_date(exp.get("end_date")),
-                    is_current=exp.get("is_current", False),
-                    description=exp.get("description"),
-                    achievements=exp.get("achievements"),
-                    technologies_used=exp.get("technologies_used"),
+                await _record_parse_run(
+                    ops,
+                    current_user,
+                    file_name,
+                    len(contents),
+                    file_hash,
+                    parser_service,
+                    parse_timer,
+                    error_message=str(e),
                 )
-                db.add(new_exp)
-
-        #  Projects
-        project_list = parsed_data.get("projects", [])
-        if project_list:
-            for proj in project_list:
-                new_proj = Project(
-                    user_id=current_user.id,
-                    project_name=proj.get("project_name") or "Unknown Project",
-                    description=proj.get("description") or "",
-                    highlights=proj.get("highlights"),
-                    project_url=proj.get("project_url"),
-                    github_url=proj.get("github_url"),
-                    start_date=parse_date(proj.get("start_date")),
-                    end_date=parse_date(proj.get("end_date")),
-                    technologies_used=proj.get("technologies_used"),
-                    is_featured=proj.get("is_featured", False),
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Error processing CV: {str(e)}",
                 )
-                db.add(new_proj)
-
-        # Skills
-        skills_list = parsed_data.get("skills", [])
-        if skills_list:
-            new_skill_group = TechnicalSkill(
-                user_id=current_user.id,
-                category="Imported Skills",
-                skills=skills_list,
-                display_order=0,
+
+            await _record_parse_run(
+                ops,
+                current_user,
+                file_name,
+                len(contents),
+                file_hash,
+                parser_service,
+                parse_timer,
             )
-            db.add(new_skill_group)
+        return saved, parse_timer.stages
 
-        await db.commit()
+    joining = cv_parse_flights.in_flight(key)
+    if joining:
+        logger.info(
+            "Joining in-flight CV parse",
+            extra={"file_hash": file_hash, "user_id": current_user.id},
+        )
+    listeners = cv_parse_listeners.setdefault(key, [])
+    if on_progress:
+        listeners.append(on_progress)
+    try:
+        with timer.stage("wait") if joining else nullcontext():
+            (saved, stages), shared = await cv_parse_flights.do(key, parse_and_save)
+    finally:
+        if on_progress:
+            listeners.remove(on_progress)
+        if not listeners and cv_parse_listeners.get(key) is listeners:
+            del cv_parse_listeners[key]
+    if not shared:
+        # The parse stages of the upload that started it
+        timer.stages.update(stages)
+    return saved
 
-        return {
-            "message": "CV parsed and saved successfully",
-            "parsed_summary": {
-                "personal_info": bool(p_info_data),
-                "education_count": len(education_list),
-                "experience_count": len(experience_list),
-                "project_count": len(project_list),
-                "skills_count": len(skills_list),
-            },
-        }
 
-    except Exception as e:
-        await db.rollback()
-        logger.error(
-            "Error processing CV upload:",
-            extra={"error": str(e), "user_id": current_user.id},
-        )
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/upload_cv/")
+async def upload_cv(
+    response: Response,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    timer = StageTimer()
+    contents = await _read_upload(file, current_user, timer)
+    parsed_summary = await _parse_upload(
+        contents,
+        file.filename,
+        current_user,
+        timer,
+        "import",
+        lambda ops, parsed_data: ops.import_parsed_cv(current_user, parsed_data),
+    )
+    response.headers["Server-Timing"] = timer.server_timing_header()
+    return {
+        "message": "CV parsed and saved successfully",
+        "parsed_summary": parsed_summary,
+    }
+
+
+@router.post(
+    "/upload_cv/stream",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/event-stream": {}},
+            "description": "Server-sent progress events of the CV parse and import",
+        },
+    },
+)
+async def upload_cv_stream(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    """Upload a CV and stream progress events while it is parsed and saved.
+
+    Events: uploaded, extracted, llm_started, section (once per parsed
+    section, as soon as it is available), parsed, then saved or error.
+    """
+    timer = StageTimer()
+    contents = await _read_upload(file, current_user, timer)
+    queue: "asyncio.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = asyncio.Queue()
+
+    def publish(event: str, data: Dict[str, Any]) -> None:
+        queue.put_nowait((event, data))
+
+    async def parse_and_publish() -> None:
+        publish("uploaded", {"file_name": file.filename, "file_size": len(contents)})
+        try:
+            parsed_summary = await _parse_upload(
+                contents,
+                file.filename,
+                current_user,
+                timer,
+                "import",
+                lambda ops, parsed_data: ops.import_parsed_cv(
+                    current_user, parsed_data
+                ),
+                on_progress=publish,
+            )
+        except HTTPException as e:
+            publish("error", {"detail": e.detail})
+        else:
+            publish(
+                "saved",
+                {"parsed_summary": parsed_summary, "stage_timings": timer.stages},
+            )
+        finally:
+            queue.put_nowait(None)
+
+    async def events() -> AsyncIterator[str]:
+        task = asyncio.create_task(parse_and_publish())
+        try:
+            while (item := await queue.get()) is not None:
+                yield _format_sse(*item)
+        finally:
+            # The client went away before the import finished
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/preview_cv/",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {
+            "model": CVImportPreviewResponseSchema,
+            "description": "CV parsed and stored for review",
+        },
+    },
+)
+async def preview_cv(
+    response: Response,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    """Parse a CV without importing it and keep the result under a preview token"""
+    timer = StageTimer()
+    contents = await _read_upload(file, current_user, timer)
+    preview = await _parse_upload(
+        contents,
+        file.filename,
+        current_user,
+        timer,
+        "preview",
+        lambda ops, parsed_data: ops.create_import_preview(
+            current_user.id, file.filename, parsed_data
+        ),
+    )
+    response.headers["Server-Timing"] = timer.server_timing_header()
+    return CVImportPreviewResponseSchema(
+        preview_token=preview.id,
+        expires_at=preview.expires_at,
+        parsed_data=preview.parsed_data,
+    )
+
+
+@router.post(
+    "/preview_cv/{preview_token}/commit",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": CVImportResponseSchema,
+            "description": "Previewed CV saved successfully",
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "CV preview not found or expired"},
+    },
+)
+async def commit_cv_preview(
+    preview_token: UUID,
+    payload: Optional[ParsedCVSchema] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Import a previewed CV, optionally replaced by the user's edited version"""
+    ops = CVParserOperations(db)
+    parsed_data = payload.model_dump(mode="json") if payload else None
+    parsed_summary = await ops.commit_import_preview(
+        current_user, preview_token, parsed_data
+    )
+    if parsed_summary is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing CV: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CV preview not found or expired",
         )
+    return {
+        "message": "CV parsed and saved successfully",
+        "parsed_summary": parsed_summary,
+    }
+
+
+@router.get(
+    "/runs/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": List[CVParseRunResponseSchema],
+            "description": "CV parse timing records retrieved successfully",
+        },
+    },
+)
+async def get_parse_runs(
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get stage timings and token usage of the current user's CV parses"""
+    ops = CVParserOperations(db)
+    parse_runs = await ops.get_parse_runs(current_user.id, skip=skip, limit=limit)
+    return parse_runs
@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -9,12 +9,31 @@ from dependencies.auth_dependencies.auth import get_current_user
 from dependencies.user_input_dependencies.custom_section_operations import (
     CustomSectionOperations,
 )
-from schemas.common import ErrorResponseSchema
+from schemas.common import (
+    MAX_BATCH_SIZE,
+    BatchDeleteSchema,
+    BatchResponseSchema,
+    ErrorResponseSchema,
+    SectionReorderSchema,
+    SectionSyncResponseSchema,
+)
 from schemas.user_input_schemas.custom_section_schemas import (
+    CustomSectionBatchUpdateSchema,
     CustomSectionCreateSchema,
     CustomSectionResponseSchema,
+    CustomSectionSyncItemSchema,
     CustomSectionUpdateSchema,
 )
+from utils.batch import batch_results, raise_missing, reject_duplicate_ids
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.pagination import NEXT_CURSOR_HEADER_DOC, parse_cursor
+from utils.profile_cache import CachedResponse, json_page, profile_cache
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],
@@ -55,16 +74,203 @@ async def create_custom_section(
         status.HTTP_200_OK: {
             "model": List[CustomSectionResponseSchema],
             "description": "Custom sections retrieved successfully",
+            "headers": {**NEXT_CURSOR_HEADER_DOC, **ETAG_HEADER_DOC},
         },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
     },
 )
 async def get_all_custom_sections(
-    db: AsyncSession = Depends(get_db), current_user=Depends(get_current_user)
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
 ):
     """Get all custom sections for a user"""
     ops = CustomSectionOperations(db)
-    custom_sections = await ops.get_all_custom_sections(current_user.id)
-    return custom_sections
+    etag = make_etag(current_user.id, current_user.profile_version, request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
+
+    page_cursor = parse_cursor(cursor)
+
+    async def build() -> CachedResponse:
+        custom_sections = await ops.get_all_custom_sections(
+            current_user.id, skip=skip, limit=limit, cursor=page_cursor
+        )
+        return json_page(CustomSectionResponseSchema, custom_sections, limit)
+
+    page = await profile_cache.get_or_build(
+        current_user.id,
+        current_user.profile_version,
+        "custom_sections",
+        request.url.query,
+        build,
+    )
+    return page.to_response(etag, current_user.profile_version)
+
+
+@router.put(
+    "/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": SectionSyncResponseSchema,
+            "description": "Custom sections replaced by the requested list",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some custom sections not found, nothing was changed",
+        },
+    },
+)
+async def sync_custom_section(
+    payloads: List[CustomSectionSyncItemSchema] = Body(max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Replace all custom sections with the given ordered list"""
+    reject_duplicate_ids([payload.id for payload in payloads])
+    ops = CustomSectionOperations(db)
+    changes, missing = await ops.sync(payloads, current_user.id)
+    if missing:
+        raise_missing(missing, "Custom section")
+
+    return changes
+
+
+@router.post(
+    "/reorder",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {
+            "description": "Custom sections reordered successfully",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some custom sections not found, nothing was reordered",
+        },
+    },
+)
+async def reorder_custom_section(
+    payload: SectionReorderSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Set the display order of custom sections to their position in the list"""
+    reject_duplicate_ids(payload.ids)
+    ops = CustomSectionOperations(db)
+    missing = await ops.reorder(payload.ids, current_user.id)
+    if missing:
+        raise_missing(missing, "Custom section")
+
+    return None
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {
+            "model": BatchResponseSchema[CustomSectionResponseSchema],
+            "description": "Batch of custom sections created successfully",
+        },
+    },
+)
+async def batch_create_custom_section(
+    payloads: List[CustomSectionCreateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create several custom sections in one transaction"""
+    ops = CustomSectionOperations(db)
+    created = await ops.create_many(payloads, current_user.id)
+    items = {item.id: item for item in created}
+    return batch_results(
+        list(items),
+        items,
+        status.HTTP_201_CREATED,
+        "Custom section",
+        CustomSectionResponseSchema,
+    )
+
+
+@router.put(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema[CustomSectionResponseSchema],
+            "description": "Batch of custom sections updated",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some custom sections not found, nothing was updated",
+        },
+    },
+)
+async def batch_update_custom_section(
+    payloads: List[CustomSectionBatchUpdateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Update several custom sections; all or nothing unless `atomic` is false"""
+    ops = CustomSectionOperations(db)
+    updated, missing = await ops.update_many(
+        [(payload.id, payload) for payload in payloads], current_user.id, atomic
+    )
+    if missing and atomic:
+        raise_missing(missing, "Custom section")
+
+    return batch_results(
+        [payload.id for payload in payloads],
+        updated,
+        status.HTTP_200_OK,
+        "Custom section",
+        CustomSectionResponseSchema,
+    )
+
+
+@router.post(
+    "/batch/delete",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema,
+            "description": "Batch of custom sections deleted",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some custom sections not found, nothing was deleted",
+        },
+    },
+)
+async def batch_delete_custom_section(
+    payload: BatchDeleteSchema,
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Delete several custom sections; all or nothing unless `atomic` is false"""
+    ops = CustomSectionOperations(db)
+    deleted, missing = await ops.delete_many(payload.ids, current_user.id, atomic)
+    if missing and atomic:
+        raise_missing(missing, "Custom section")
+
+    return batch_results(
+        payload.ids,
+        dict.fromkeys(deleted),
+        status.HTTP_204_NO_CONTENT,
+        "Custom section",
+    )
 
 
 @router.get(
@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -9,12 +9,31 @@ from dependencies.auth_dependencies.auth import get_current_user
 from dependencies.user_input_dependencies.education_operations import (
     EducationOperations,
 )
-from schemas.common import ErrorResponseSchema
+from schemas.common import (
+    MAX_BATCH_SIZE,
+    BatchDeleteSchema,
+    BatchResponseSchema,
+    ErrorResponseSchema,
+    SectionReorderSchema,
+    SectionSyncResponseSchema,
+)
 from schemas.user_input_schemas.education_schemas import (
+    EducationBatchUpdateSchema,
     EducationCreateSchema,
     EducationResponseSchema,
+    EducationSyncItemSchema,
     EducationUpdateSchema,
 )
+from utils.batch import batch_results, raise_missing, reject_duplicate_ids
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.pagination import NEXT_CURSOR_HEADER_DOC, parse_cursor
+from utils.profile_cache import CachedResponse, json_page, profile_cache
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],
@@ -59,21 +78,203 @@ async def create_education(
         status.HTTP_200_OK: {
             "model": List[EducationResponseSchema],
             "description": "List of education entries retrieved successfully",
+            "headers": {**NEXT_CURSOR_HEADER_DOC, **ETAG_HEADER_DOC},
         },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
     },
 )
 async def get_all_education(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get all education entries for a user"""
     ops = EducationOperations(db)
-    education_list = await ops.get_all_education(
-        user_id=current_user.id, skip=skip, limit=limit
+    etag = make_etag(current_user.id, current_user.profile_version, request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
+
+    page_cursor = parse_cursor(cursor)
+
+    async def build() -> CachedResponse:
+        education_list = await ops.get_all_education(
+            user_id=current_user.id, skip=skip, limit=limit, cursor=page_cursor
+        )
+        return json_page(EducationResponseSchema, education_list, limit)
+
+    page = await profile_cache.get_or_build(
+        current_user.id,
+        current_user.profile_version,
+        "education",
+        request.url.query,
+        build,
+    )
+    return page.to_response(etag, current_user.profile_version)
+
+
+@router.put(
+    "/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": SectionSyncResponseSchema,
+            "description": "Education entries replaced by the requested list",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some education entries not found, nothing was changed",
+        },
+    },
+)
+async def sync_education(
+    payloads: List[EducationSyncItemSchema] = Body(max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Replace all education entries with the given ordered list"""
+    reject_duplicate_ids([payload.id for payload in payloads])
+    ops = EducationOperations(db)
+    changes, missing = await ops.sync(payloads, current_user.id)
+    if missing:
+        raise_missing(missing, "Education")
+
+    return changes
+
+
+@router.post(
+    "/reorder",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {
+            "description": "Education entries reordered successfully",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some education entries not found, nothing was reordered",
+        },
+    },
+)
+async def reorder_education(
+    payload: SectionReorderSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Set the display order of education entries to their position in the list"""
+    reject_duplicate_ids(payload.ids)
+    ops = EducationOperations(db)
+    missing = await ops.reorder(payload.ids, current_user.id)
+    if missing:
+        raise_missing(missing, "Education")
+
+    return None
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {
+            "model": BatchResponseSchema[EducationResponseSchema],
+            "description": "Batch of education entries created successfully",
+        },
+    },
+)
+async def batch_create_education(
+    payloads: List[EducationCreateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create several education entries in one transaction"""
+    ops = EducationOperations(db)
+    created = await ops.create_many(payloads, current_user.id)
+    items = {item.id: item for item in created}
+    return batch_results(
+        list(items),
+        items,
+        status.HTTP_201_CREATED,
+        "Education",
+        EducationResponseSchema,
+    )
+
+
+@router.put(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema[EducationResponseSchema],
+            "description": "Batch of education entries updated",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some education entries not found, nothing was updated",
+        },
+    },
+)
+async def batch_update_education(
+    payloads: List[EducationBatchUpdateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Update several education entries; all or nothing unless `atomic` is false"""
+    ops = EducationOperations(db)
+    updated, missing = await ops.update_many(
+        [(payload.id, payload) for payload in payloads], current_user.id, atomic
+    )
+    if missing and atomic:
+        raise_missing(missing, "Education")
+
+    return batch_results(
+        [payload.id for payload in payloads],
+        updated,
+        status.HTTP_200_OK,
+        "Education",
+        EducationResponseSchema,
+    )
+
+
+@router.post(
+    "/batch/delete",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema,
+            "description": "Batch of education entries deleted",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some education entries not found, nothing was deleted",
+        },
+    },
+)
+async def batch_delete_education(
+    payload: BatchDeleteSchema,
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Delete several education entries; all or nothing unless `atomic` is false"""
+    ops = EducationOperations(db)
+    deleted, missing = await ops.delete_many(payload.ids, current_user.id, atomic)
+    if missing and atomic:
+        raise_missing(missing, "Education")
+
+    return batch_results(
+        payload.ids,
+        dict.fromkeys(deleted),
+        status.HTTP_204_NO_CONTENT,
+        "Education",
     )
-    return education_list
 
 
 @router.get(
@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -9,12 +9,31 @@ from dependencies.auth_dependencies.auth import get_current_user
 from dependencies.user_input_dependencies.experience_operations import (
     ExperienceOperations,
 )
-from schemas.common import ErrorResponseSchema
+from schemas.common import (
+    MAX_BATCH_SIZE,
+    BatchDeleteSchema,
+    BatchResponseSchema,
+    ErrorResponseSchema,
+    SectionReorderSchema,
+    SectionSyncResponseSchema,
+)
 from schemas.user_input_schemas.experience_schemas import (
+    ExperienceBatchUpdateSchema,
     ExperienceCreateSchema,
     ExperienceResponseSchema,
+    ExperienceSyncItemSchema,
     ExperienceUpdateSchema,
 )
+from utils.batch import batch_results, raise_missing, reject_duplicate_ids
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.pagination import NEXT_CURSOR_HEADER_DOC, parse_cursor
+from utils.profile_cache import CachedResponse, json_page, profile_cache
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],
@@ -55,21 +74,203 @@ async def create_experience(
         status.HTTP_200_OK: {
             "model": List[ExperienceResponseSchema],
             "description": "List of experience entries retrieved successfully",
+            "headers": {**NEXT_CURSOR_HEADER_DOC, **ETAG_HEADER_DOC},
         },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
     },
 )
 async def get_all_experience(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get all experience entries for a user"""
     ops = ExperienceOperations(db)
-    experience_list = await ops.get_all_experiences(
-        current_user.id, skip=skip, limit=limit
+    etag = make_etag(current_user.id, current_user.profile_version, request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
+
+    page_cursor = parse_cursor(cursor)
+
+    async def build() -> CachedResponse:
+        experience_list = await ops.get_all_experiences(
+            current_user.id, skip=skip, limit=limit, cursor=page_cursor
+        )
+        return json_page(ExperienceResponseSchema, experience_list, limit)
+
+    page = await profile_cache.get_or_build(
+        current_user.id,
+        current_user.profile_version,
+        "experiences",
+        request.url.query,
+        build,
+    )
+    return page.to_response(etag, current_user.profile_version)
+
+
+@router.put(
+    "/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": SectionSyncResponseSchema,
+            "description": "Experiences replaced by the requested list",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some experiences not found, nothing was changed",
+        },
+    },
+)
+async def sync_experience(
+    payloads: List[ExperienceSyncItemSchema] = Body(max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Replace all experiences with the given ordered list"""
+    reject_duplicate_ids([payload.id for payload in payloads])
+    ops = ExperienceOperations(db)
+    changes, missing = await ops.sync(payloads, current_user.id)
+    if missing:
+        raise_missing(missing, "Experience")
+
+    return changes
+
+
+@router.post(
+    "/reorder",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {
+            "description": "Experiences reordered successfully",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "The same id appears more than once",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some experiences not found, nothing was reordered",
+        },
+    },
+)
+async def reorder_experience(
+    payload: SectionReorderSchema,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Set the display order of experiences to their position in the list"""
+    reject_duplicate_ids(payload.ids)
+    ops = ExperienceOperations(db)
+    missing = await ops.reorder(payload.ids, current_user.id)
+    if missing:
+        raise_missing(missing, "Experience")
+
+    return None
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {
+            "model": BatchResponseSchema[ExperienceResponseSchema],
+            "description": "Batch of experiences created successfully",
+        },
+    },
+)
+async def batch_create_experience(
+    payloads: List[ExperienceCreateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create several experiences in one transaction"""
+    ops = ExperienceOperations(db)
+    created = await ops.create_many(payloads, current_user.id)
+    items = {item.id: item for item in created}
+    return batch_results(
+        list(items),
+        items,
+        status.HTTP_201_CREATED,
+        "Experience",
+        ExperienceResponseSchema,
+    )
+
+
+@router.put(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema[ExperienceResponseSchema],
+            "description": "Batch of experiences updated",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some experiences not found, nothing was updated",
+        },
+    },
+)
+async def batch_update_experience(
+    payloads: List[ExperienceBatchUpdateSchema] = Body(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    ),
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Update several experiences; all or nothing unless `atomic` is false"""
+    ops = ExperienceOperations(db)
+    updated, missing = await ops.update_many(
+        [(payload.id, payload) for payload in payloads], current_user.id, atomic
+    )
+    if missing and atomic:
+        raise_missing(missing, "Experience")
+
+    return batch_results(
+        [payload.id for payload in payloads],
+        updated,
+        status.HTTP_200_OK,
+        "Experience",
+        ExperienceResponseSchema,
+    )
+
+
+@router.post(
+    "/batch/delete",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": BatchResponseSchema,
+            "description": "Batch of experiences deleted",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Some experiences not found, nothing was deleted",
+        },
+    },
+)
+async def batch_delete_experience(
+    payload: BatchDeleteSchema,
+    atomic: bool = True,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Delete several experiences; all or nothing unless `atomic` is false"""
+    ops = ExperienceOperations(db)
+    deleted, missing = await ops.delete_many(payload.ids, current_user.id, atomic)
+    if missing and atomic:
+        raise_missing(missing, "Experience")
+
+    return batch_results(
+        payload.ids,
+        dict.fromkeys(deleted),
+        status.HTTP_204_NO_CONTENT,
+        "Experience",
     )
-    return experience_list
 
 
 @router.get(
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -12,6 +14,14 @@ from schemas.user_input_schemas.personal_info_schemas import (
     PersonalInfoResponseSchema,
     PersonalInfoUpdateSchema,
 )
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.profile_cache import CachedResponse, json_entry, profile_cache
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],
@@ -44,16 +54,14 @@ async def create_personal_info(
 ):
     """Create personal info for a user"""
     info_ops = PersonalInfoOperations(db)
+    personal_info = await info_ops.create_personal_info(info_payload, current_user.id)
 
-    # Check for existing
-    existing = await info_ops.get_personal_info_by_user_id(current_user.id)
-    if existing:
+    if not personal_info:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Personal Info already exists for this user. Use PUT to update.",
         )
 
-    personal_info = await info_ops.create_personal_info(info_payload, current_user.id)
     return personal_info
 
 
@@ -64,27 +72,42 @@ async def create_personal_info(
         status.HTTP_200_OK: {
             "model": PersonalInfoResponseSchema,
             "description": "Personal info retrieved successfully",
+            "headers": ETAG_HEADER_DOC,
         },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
         status.HTTP_404_NOT_FOUND: {
             "description": "Personal info not found",
         },
     },
 )
 async def get_my_personal_info(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get personal info for current user"""
     info_ops = PersonalInfoOperations(db)
-    personal_info = await info_ops.get_personal_info_by_user_id(current_user.id)
+    etag = make_etag(current_user.id, current_user.profile_version)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
+
+    async def build() -> Optional[CachedResponse]:
+        personal_info = await info_ops.get_personal_info_by_user_id(current_user.id)
+        if not personal_info:
+            return None
+        return json_entry(PersonalInfoResponseSchema, personal_info)
+
+    cached = await profile_cache.get_or_build(
+        current_user.id, current_user.profile_version, "personal_info", "", build
+    )
 
-    if not personal_info:
+    if not cached:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Personal info not found",
         )
 
-    return personal_info
+    return cached.to_response(etag, current_user.profile_version)
 
 
 @router.put(
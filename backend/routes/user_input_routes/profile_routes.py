@@ -0,0 +1,76 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import get_db
+from dependencies.auth_dependencies.auth import get_current_user
+from dependencies.user_input_dependencies.profile_operations import ProfileOperations
+from schemas.common import ErrorResponseSchema
+from schemas.user_input_schemas.profile_schemas import ProfileResponseSchema
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.profile_cache import CachedResponse, profile_cache
+
+router = APIRouter(
+    dependencies=[Depends(get_current_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {
+            "model": ErrorResponseSchema,
+            "description": "Forbidden Response",
+        }
+    },
+)
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "model": ProfileResponseSchema,
+            "description": "Profile retrieved successfully",
+            "headers": ETAG_HEADER_DOC,
+        },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
+        status.HTTP_404_NOT_FOUND: {
+            "description": "User not found",
+        },
+    },
+)
+async def get_my_profile(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Get every active section of the current user's profile in one request.
+
+    The document is assembled by Postgres and cached until the profile changes.
+    """
+    ops = ProfileOperations(db)
+    etag = make_etag(current_user.id, current_user.profile_version)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
+
+    async def build() -> Optional[CachedResponse]:
+        profile_json = await ops.get_profile_json(current_user.id)
+        if profile_json is None:
+            return None
+        return CachedResponse(profile_json.encode())
+
+    cached = await profile_cache.get_or_build(
+        current_user.id, current_user.profile_version, "profile", "", build
+    )
+
+    if cached is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    return cached.to_response(etag, current_user.profile_version)
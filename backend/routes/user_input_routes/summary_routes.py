@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -10,6 +12,14 @@ from schemas.user_input_schemas.summary_schemas import (
     SummaryResponseSchema,
     SummaryUpdateSchema,
 )
+from utils.etag import (
+    ETAG_HEADER_DOC,
+    NOT_MODIFIED_RESPONSE_DOC,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from utils.profile_cache import CachedResponse, json_entry, profile_cache
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],
@@ -42,14 +52,14 @@ async def create_summary(
 ):
     """Create a summary for the current user"""
     ops = SummaryOperations(db)
-    existing = await ops.get_summary_by_user_id(current_user.id)
-    if existing:
+    summary = await ops.create_summary(payload, user_id=current_user.id)
+
+    if not summary:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Summary already exists for this user. Use PUT to update.",
         )
 
-    summary = await ops.create_summary(payload, user_id=current_user.id)
     return summary
 
 
@@ -60,27 +70,42 @@ async def create_summary(
         status.HTTP_200_OK: {
             "model": SummaryResponseSchema,
             "description": "Summary retrieved successfully",
+            "headers": ETAG_HEADER_DOC,
         },
+        status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE_DOC,
         status.HTTP_404_NOT_FOUND: {
             "description": "Summary not found",
         },
     },
 )
 async def get_my_summary(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get current user's summary"""
     ops = SummaryOperations(db)
-    summary = await ops.get_summary_by_user_id(current_user.id)
+    etag = make_etag(current_user.id, current_user.profile_version)
+    if is_not_modified(request, etag):
+        return not_modified(etag, current_user.profile_version)
 
-    if not summary:
+    async def build() -> Optional[CachedResponse]:
+        summary = await ops.get_summary_by_user_id(current_user.id)
+        if not summary:
+            return None
+        return json_entry(SummaryResponseSchema, summary)
+
+    cached = await profile_cache.get_or_build(
+        current_user.id, current_user.profile_version, "summary", "", build
+    )
+
+    if not cached:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Summary not found",
         )
 
-    return summary
+    return cached.to_response(etag, current_user.profile_version)
 
 
 @router.put(
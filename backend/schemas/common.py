@@ -1,7 +1,13 @@
 from datetime import datetime
-from typing import Optional
+from typing import Generic, List, Optional, TypeVar
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# Items accepted by one batch request
+MAX_BATCH_SIZE = 100
+
+ItemT = TypeVar("ItemT")
 
 
 class ErrorResponseSchema(BaseModel):
@@ -28,3 +34,40 @@ class EnhancementMetadataSchema(BaseModel):
 
     enhancement_prompt_used: Optional[str] = None
     last_enhanced_at: Optional[datetime] = None
+
+
+class BatchDeleteSchema(BaseModel):
+    """IDs of the entries to delete in one batch"""
+
+    ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class SectionReorderSchema(BaseModel):
+    """IDs of a section's entries in their new display order"""
+
+    ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchItemResultSchema(BaseModel, Generic[ItemT]):
+    """Outcome of one item of a batch request, in request order"""
+
+    index: int
+    id: UUID
+    status_code: int
+    item: Optional[ItemT] = None
+    detail: Optional[str] = None
+
+
+class BatchResponseSchema(BaseModel, Generic[ItemT]):
+    """Per-item results of a batch request"""
+
+    results: List[BatchItemResultSchema[ItemT]]
+
+
+class SectionSyncResponseSchema(BaseModel):
+    """Changes applied to bring a section list to the requested state"""
+
+    created: List[UUID]
+    updated: List[UUID]
+    deleted: List[UUID]
+    unchanged: List[UUID]
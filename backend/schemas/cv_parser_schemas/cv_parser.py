@@ -0,0 +1,120 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CVParseRunResponseSchema(BaseModel):
+    """Schema for CV parse timing records"""
+
+    id: UUID
+    user_id: UUID
+    file_name: Optional[str] = None
+    file_size: int
+    file_hash: Optional[str] = None
+    model: str
+    routing_reason: Optional[str] = None
+    escalated: bool
+    status: str
+    error_message: Optional[str] = None
+    input_tokens: int
+    prompt_tokens: int
+    completion_tokens: int
+    stage_timings: Dict[str, float]
+    total_ms: float
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ParsedPersonalInfoSchema(BaseModel):
+    """Personal info as returned by the CV parser"""
+
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    linkedin_url: Optional[str] = None
+    github_url: Optional[str] = None
+    portfolio_url: Optional[str] = None
+    website_url: Optional[str] = None
+    professional_title: Optional[str] = None
+
+
+class ParsedEducationSchema(BaseModel):
+    """Education entry as returned by the CV parser"""
+
+    institution_name: str
+    degree: str
+    field_of_study: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_current: bool = False
+    grade: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ParsedExperienceSchema(BaseModel):
+    """Experience entry as returned by the CV parser"""
+
+    job_title: str
+    company_name: str
+    location: Optional[str] = None
+    employment_type: Optional[str] = None
+    start_date: date
+    end_date: Optional[date] = None
+    is_current: bool = False
+    description: Optional[str] = None
+    achievements: Optional[List[str]] = None
+    technologies_used: Optional[List[str]] = None
+
+
+class ParsedProjectSchema(BaseModel):
+    """Project entry as returned by the CV parser"""
+
+    project_name: str
+    description: Optional[str] = None
+    highlights: Optional[List[str]] = None
+    project_url: Optional[str] = None
+    github_url: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    technologies_used: Optional[List[str]] = None
+    is_featured: bool = False
+
+
+class ParsedCVSchema(BaseModel):
+    """Full CV parser output, in the shape consumed by the CV import"""
+
+    personal_info: Optional[ParsedPersonalInfoSchema] = None
+    education: List[ParsedEducationSchema] = []
+    experiences: List[ParsedExperienceSchema] = []
+    projects: List[ParsedProjectSchema] = []
+    skills: List[str] = []
+
+
+class CVImportPreviewResponseSchema(BaseModel):
+    """Schema for a parsed CV awaiting review before import"""
+
+    preview_token: UUID
+    expires_at: datetime
+    parsed_data: Dict[str, Any]
+
+
+class CVImportSummarySchema(BaseModel):
+    """Schema for the counts of imported CV entries"""
+
+    personal_info: bool
+    education_count: int
+    experience_count: int
+    project_count: int
+    skills_count: int
+
+
+class CVImportResponseSchema(BaseModel):
+    """Schema for a completed CV import"""
+
+    message: str
+    parsed_summary: CVImportSummarySchema
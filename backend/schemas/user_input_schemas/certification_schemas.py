@@ -25,6 +25,12 @@ class CertificationCreateSchema(CertificationBaseSchema, ContentBaseSchema):
     pass
 
 
+class CertificationSyncItemSchema(CertificationCreateSchema):
+    """Schema for one certification of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class CertificationUpdateSchema(BaseModel):
     """Schema for updating certification - all fields optional"""
 
@@ -39,6 +45,12 @@ class CertificationUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class CertificationBatchUpdateSchema(CertificationUpdateSchema):
+    """Schema for updating one certification of a batch"""
+
+    id: UUID
+
+
 class CertificationResponseSchema(
     CertificationBaseSchema,
     ContentBaseSchema,
@@ -19,6 +19,12 @@ class CustomSectionCreateSchema(CustomSectionBaseSchema, ContentBaseSchema):
     pass
 
 
+class CustomSectionSyncItemSchema(CustomSectionCreateSchema):
+    """Schema for one custom section of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class CustomSectionUpdateSchema(BaseModel):
     """Schema for updating custom section - all fields optional"""
 
@@ -28,6 +34,12 @@ class CustomSectionUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class CustomSectionBatchUpdateSchema(CustomSectionUpdateSchema):
+    """Schema for updating one custom section of a batch"""
+
+    id: UUID
+
+
 class CustomSectionResponseSchema(
     CustomSectionBaseSchema,
     ContentBaseSchema,
@@ -28,6 +28,12 @@ class EducationCreateSchema(EducationBaseSchema, ContentBaseSchema):
     pass
 
 
+class EducationSyncItemSchema(EducationCreateSchema):
+    """Schema for one education entry of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class EducationUpdateSchema(BaseModel):
     """Schema for updating education - all fields optional"""
 
@@ -46,6 +52,13 @@ class EducationUpdateSchema(BaseModel):
     user_id: Optional[UUID]
 
 
+class EducationBatchUpdateSchema(EducationUpdateSchema):
+    """Schema for updating one education entry of a batch"""
+
+    id: UUID
+    user_id: Optional[UUID] = None
+
+
 class EducationResponseSchema(
     EducationBaseSchema, ContentBaseSchema, TimestampSchema, EnhancementMetadataSchema
 ):
@@ -28,6 +28,12 @@ class ExperienceCreateSchema(ExperienceBaseSchema, ContentBaseSchema):
     pass
 
 
+class ExperienceSyncItemSchema(ExperienceCreateSchema):
+    """Schema for one experience of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class ExperienceUpdateSchema(BaseModel):
     """Schema for updating experience - all fields optional"""
 
@@ -45,6 +51,12 @@ class ExperienceUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class ExperienceBatchUpdateSchema(ExperienceUpdateSchema):
+    """Schema for updating one experience of a batch"""
+
+    id: UUID
+
+
 class ExperienceResponseSchema(
     ExperienceBaseSchema, ContentBaseSchema, TimestampSchema, EnhancementMetadataSchema
 ):
@@ -0,0 +1,47 @@
+from typing import List, Optional, Type, get_args
+
+from pydantic import BaseModel, ConfigDict
+
+from schemas.user_input_schemas.certification_schemas import (
+    CertificationResponseSchema,
+)
+from schemas.user_input_schemas.custom_section_schemas import (
+    CustomSectionResponseSchema,
+)
+from schemas.user_input_schemas.education_schemas import EducationResponseSchema
+from schemas.user_input_schemas.experience_schemas import ExperienceResponseSchema
+from schemas.user_input_schemas.personal_info_schemas import (
+    PersonalInfoResponseSchema,
+)
+from schemas.user_input_schemas.project_schemas import ProjectResponseSchema
+from schemas.user_input_schemas.publication_schemas import PublicationResponseSchema
+from schemas.user_input_schemas.summary_schemas import SummaryResponseSchema
+from schemas.user_input_schemas.technical_skill_schemas import (
+    TechnicalSkillResponseSchema,
+)
+
+
+class ProfileResponseSchema(BaseModel):
+    """Schema for the full profile of a user, with active entries only"""
+
+    personal_info: Optional[PersonalInfoResponseSchema] = None
+    summary: Optional[SummaryResponseSchema] = None
+    education: List[EducationResponseSchema] = []
+    experiences: List[ExperienceResponseSchema] = []
+    projects: List[ProjectResponseSchema] = []
+    technical_skills: List[TechnicalSkillResponseSchema] = []
+    publications: List[PublicationResponseSchema] = []
+    certifications: List[CertificationResponseSchema] = []
+    custom_sections: List[CustomSectionResponseSchema] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def section_schema(cls, name: str) -> Type[BaseModel]:
+        """Return the response schema of a single entry of a section"""
+        annotation = cls.model_fields[name].annotation
+        return next(
+            arg
+            for arg in get_args(annotation)
+            if isinstance(arg, type) and issubclass(arg, BaseModel)
+        )
@@ -27,6 +27,12 @@ class ProjectCreateSchema(ProjectBaseSchema, ContentBaseSchema):
     pass
 
 
+class ProjectSyncItemSchema(ProjectCreateSchema):
+    """Schema for one project of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class ProjectUpdateSchema(BaseModel):
     """Schema for updating project - all fields optional"""
 
@@ -43,6 +49,12 @@ class ProjectUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class ProjectBatchUpdateSchema(ProjectUpdateSchema):
+    """Schema for updating one project of a batch"""
+
+    id: UUID
+
+
 class ProjectResponseSchema(
     ProjectBaseSchema, ContentBaseSchema, TimestampSchema, EnhancementMetadataSchema
 ):
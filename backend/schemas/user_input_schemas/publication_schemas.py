@@ -25,6 +25,12 @@ class PublicationCreateSchema(PublicationBaseSchema, ContentBaseSchema):
     pass
 
 
+class PublicationSyncItemSchema(PublicationCreateSchema):
+    """Schema for one publication of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class PublicationUpdateSchema(BaseModel):
     """Schema for updating publication - all fields optional"""
 
@@ -39,6 +45,12 @@ class PublicationUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class PublicationBatchUpdateSchema(PublicationUpdateSchema):
+    """Schema for updating one publication of a batch"""
+
+    id: UUID
+
+
 class PublicationResponseSchema(
     PublicationBaseSchema, ContentBaseSchema, TimestampSchema, EnhancementMetadataSchema
 ):
@@ -19,6 +19,12 @@ class TechnicalSkillCreateSchema(TechnicalSkillBaseSchema, ContentBaseSchema):
     pass
 
 
+class TechnicalSkillSyncItemSchema(TechnicalSkillCreateSchema):
+    """Schema for one technical skill of the full list; new ones have no id"""
+
+    id: Optional[UUID] = None
+
+
 class TechnicalSkillUpdateSchema(BaseModel):
     """Schema for updating technical skill - all fields optional"""
 
@@ -28,6 +34,12 @@ class TechnicalSkillUpdateSchema(BaseModel):
     is_active: Optional[bool] = None
 
 
+class TechnicalSkillBatchUpdateSchema(TechnicalSkillUpdateSchema):
+    """Schema for updating one technical skill of a batch"""
+
+    id: UUID
+
+
 class TechnicalSkillResponseSchema(
     TechnicalSkillBaseSchema, ContentBaseSchema, TimestampSchema
 ):
@@ -0,0 +1,250 @@
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from services.cv_sections import heading
+
+# Matches this close to the top of the CV are treated as the candidate's own
+HEADER_LINES = 8
+# personal_info.phone is a String(20) column
+MAX_PHONE_LENGTH = 20
+
+_EMAIL = re.compile(
+    r"(?<![\w.+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"
+)
+_LINKEDIN = re.compile(
+    r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/([A-Za-z0-9_%-]+)/?",
+    re.IGNORECASE,
+)
+_GITHUB = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9][A-Za-z0-9-]{0,38})(/[\w.-]+)?/?",
+    re.IGNORECASE,
+)
+_URL = re.compile(
+    r"(?:https?://|www\.)[^\s<>()\"',;|]+"
+    r"|(?<![@\w.-])[a-z0-9-]+(?:\.[a-z0-9-]+)*\.(?:com|dev|io|me|net|org|app|site|tech|xyz)"
+    r"(?:/[^\s<>()\"',;|]*)?(?![\w.-])",
+    re.IGNORECASE,
+)
+_PHONE = re.compile(r"(?<![\w+])\+?\(?\d[\d\s().-]{5,22}\d(?![\w-])")
+# Labels that mark a line as the candidate's contact details, not part of a URL
+_CONTACT_LABEL = re.compile(
+    r"(?<![\w./-])(?:phone|tel|mobile|mob|cell|contact|linkedin|github|website"
+    r"|portfolio)(?![\w/-]|\.\w)",
+    re.IGNORECASE,
+)
+# Sections whose contacts are someone else's, and sections of the candidate's own
+_REFERENCES_HEADING = re.compile(r"^(?:references|referees)$")
+_CONTACT_HEADING = re.compile(r"^contact")
+# Employment dates such as 2019 - 2021, 2019-01 - 2021-03 or 01.2019 - 03.2021
+_DATE = r"(?:(?:19|20)\d{2}(?:[-/.]\d{1,2})?|\d{1,2}[-/.](?:19|20)\d{2})"
+_DATE_RANGE = re.compile(rf"^{_DATE}\s*[-–]\s*{_DATE}$")
+_ISO_DATE = re.compile(r"^\d{4}[-/.]\d{1,2}[-/.]\d{1,2}$")
+
+# GitHub paths that are not user profiles
+_GITHUB_RESERVED = {"orgs", "features", "topics", "sponsors", "about", "pricing"}
+# Technology names that look like bare domains in skills lists
+_TECH_NAMES = {"socket.io", "asp.net", "ado.net", "vb.net", "dot.net", "p5.js"}
+
+
+class ContactMatch(BaseModel):
+    """A contact value found in the CV text"""
+
+    value: str
+    high_confidence: bool
+
+
+class ContactExtractor:
+    """Rule-based extraction of contact fields from CV text"""
+
+    def extract(self, text: str) -> Dict[str, ContactMatch]:
+        lines = text.splitlines()
+        own = _own_lines(lines)
+        header = "\n".join(
+            line for index, line in enumerate(lines[:HEADER_LINES]) if own[index]
+        )
+        contacts: Dict[str, ContactMatch] = {}
+
+        email = self._extract_email(text, header)
+        if email:
+            contacts["email"] = email
+
+        linkedin = self._extract_linkedin(lines, own)
+        if linkedin:
+            contacts["linkedin_url"] = linkedin
+
+        github = self._extract_github(lines, own)
+        if github:
+            contacts["github_url"] = github
+
+        website = self._extract_website(text, own)
+        if website:
+            contacts["website_url"] = website
+
+        phone = self._extract_phone(lines, own)
+        if phone:
+            contacts["phone"] = phone
+
+        return contacts
+
+    def _extract_email(self, text: str, header: str) -> Optional[ContactMatch]:
+        emails = _unique(match.lower() for match in _EMAIL.findall(text))
+        if not emails:
+            return None
+        # Only an address in the header is surely the candidate's own; one
+        # further down may be a referee's
+        header_emails = [e for e in emails if e in header.lower()]
+        if header_emails:
+            return ContactMatch(value=header_emails[0], high_confidence=True)
+        return ContactMatch(value=emails[0], high_confidence=False)
+
+    def _extract_linkedin(
+        self, lines: List[str], own: List[bool]
+    ) -> Optional[ContactMatch]:
+        handles: Dict[str, int] = {}
+        for index, line in enumerate(lines):
+            for match in _LINKEDIN.finditer(line):
+                handles.setdefault(match.group(1), index)
+        handle = _pick(handles, own)
+        if handle is None:
+            return None
+        return ContactMatch(
+            value=f"https://www.linkedin.com/in/{handle.value}",
+            high_confidence=handle.high_confidence,
+        )
+
+    def _extract_github(
+        self, lines: List[str], own: List[bool]
+    ) -> Optional[ContactMatch]:
+        profiles: Dict[str, int] = {}
+        owners: List[str] = []
+        for index, line in enumerate(lines):
+            for match in _GITHUB.finditer(line):
+                owner = match.group(1)
+                if owner.lower() in _GITHUB_RESERVED:
+                    continue
+                owners.append(owner)
+                if not match.group(2):
+                    profiles.setdefault(owner, index)
+
+        profile = _pick(profiles, own)
+        if profile is not None:
+            return ContactMatch(
+                value=f"https://github.com/{profile.value}",
+                high_confidence=profile.high_confidence,
+            )
+
+        # Only repository links: the owner that appears most is likely the candidate
+        if owners:
+            owner = Counter(owners).most_common(1)[0][0]
+            return ContactMatch(
+                value=f"https://github.com/{owner}", high_confidence=False
+            )
+        return None
+
+    def _extract_website(self, text: str, own: List[bool]) -> Optional[ContactMatch]:
+        stripped = _EMAIL.sub(" ", _GITHUB.sub(" ", _LINKEDIN.sub(" ", text)))
+        # First line of each URL; the substitutions never remove a line break
+        found: Dict[str, int] = {}
+        for index, line in enumerate(stripped.splitlines()):
+            for match in _URL.findall(line):
+                url = match.rstrip("./")
+                bare = not url.lower().startswith(("http://", "https://", "www."))
+                # Bare domains are only trusted in the header, where skills
+                # such as Socket.io are rare
+                if bare and (index >= HEADER_LINES or url.lower() in _TECH_NAMES):
+                    continue
+                found.setdefault(url, index)
+        match = _pick(found, own)
+        if match is None:
+            return None
+        url = match.value
+        return ContactMatch(
+            value=url if url.lower().startswith("http") else f"https://{url}",
+            high_confidence=match.high_confidence,
+        )
+
+    def _extract_phone(
+        self, lines: List[str], own: List[bool]
+    ) -> Optional[ContactMatch]:
+        fallback: Optional[ContactMatch] = None
+        for index, line in enumerate(lines):
+            for match in _PHONE.finditer(line):
+                candidate = " ".join(match.group(0).split())
+                if not self._looks_like_phone(candidate):
+                    continue
+                if own[index]:
+                    return ContactMatch(value=candidate, high_confidence=True)
+                if fallback is None:
+                    fallback = ContactMatch(value=candidate, high_confidence=False)
+        return fallback
+
+    @staticmethod
+    def _looks_like_phone(candidate: str) -> bool:
+        digits = re.sub(r"\D", "", candidate)
+        if not 7 <= len(digits) <= 15 or len(candidate) > MAX_PHONE_LENGTH:
+            return False
+        if _DATE_RANGE.match(candidate) or _ISO_DATE.match(candidate):
+            return False
+        # Bare digit runs without any separator are usually IDs, not numbers
+        return candidate.startswith("+") or not candidate.isdigit()
+
+
+def merge_contacts(
+    personal_info: Optional[Dict[str, Any]], contacts: Dict[str, ContactMatch]
+) -> Dict[str, Any]:
+    """Merge extracted contacts into model output.
+
+    High-confidence matches override the model, others only fill gaps.
+    """
+    merged = dict(personal_info or {})
+    for field, match in contacts.items():
+        if match.high_confidence or not merged.get(field):
+            merged[field] = match.value
+    return merged
+
+
+def _own_lines(lines: List[str]) -> List[bool]:
+    """Whether each line holds the candidate's own contacts.
+
+    Those are in the header, in a contact section or labelled, and never
+    under a References heading, where they belong to referees.
+    """
+    own: List[bool] = []
+    section: Optional[str] = None
+    for index, line in enumerate(lines):
+        section = heading(line) or section
+        if section is not None and _REFERENCES_HEADING.match(section):
+            own.append(False)
+            continue
+        own.append(
+            index < HEADER_LINES
+            or (section is not None and bool(_CONTACT_HEADING.match(section)))
+            or bool(_CONTACT_LABEL.search(line))
+        )
+    return own
+
+
+def _pick(found: Dict[str, int], own: List[bool]) -> Optional[ContactMatch]:
+    """Pick among values keyed to the line they first appear on.
+
+    A value is only high confidence if it is the one value on the
+    candidate's own lines; otherwise the first value fills a gap.
+    """
+    own_values = [value for value, index in found.items() if own[index]]
+    if len(own_values) == 1:
+        return ContactMatch(value=own_values[0], high_confidence=True)
+    if own_values:
+        return ContactMatch(value=own_values[0], high_confidence=False)
+    if found:
+        return ContactMatch(value=next(iter(found)), high_confidence=False)
+    return None
+
+
+def _unique(values) -> List[str]:
+    seen: Dict[str, None] = {}
+    for value in values:
+        seen.setdefault(value, None)
+    return list(seen)
@@ -1,65 +1,393 @@
+import asyncio
 import json
 from io import BytesIO
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 
 from openai import AsyncOpenAI
 from PyPDF2 import PdfReader
 
+from services.contact_extractor import ContactExtractor, merge_contacts
+from services.cv_sections import HEADER_KEY, OTHER_KEY, split_sections
+from services.cv_validator import validate_sections
+from services.model_router import ModelRouter
+from services.text_normalizer import NormalizedText, TextNormalizer
 from settings import settings
+from utils.json_stream import JSONObjectStream
 from utils.logger import get_logger
+from utils.metrics import metrics_registry
+from utils.timing import StageTimer
 
 logger = get_logger()
 
+# Fewer detected sections than this are not worth splitting into requests
+MIN_SPLIT_SECTIONS = 2
+
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+cv_parse_seconds = metrics_registry.histogram(
+    "cv_parse_duration_seconds",
+    "Total duration of CV parses by routed model",
+    label_names=["model", "escalated"],
+)
+cv_parse_stage_seconds = metrics_registry.histogram(
+    "cv_parse_stage_duration_seconds",
+    "Duration of CV parse pipeline stages",
+    label_names=["stage", "model"],
+)
+cv_parse_tokens = metrics_registry.histogram(
+    "cv_parse_tokens",
+    "Tokens used per CV parse",
+    label_names=["kind", "model"],
+    buckets=TOKEN_BUCKETS,
+)
+
+# Receives progress events of a parse as (event name, event data)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+PERSONAL_INFO_FIELDS = [
+    "full_name",
+    "email",
+    "phone",
+    "location",
+    "linkedin_url",
+    "github_url",
+    "portfolio_url",
+    "website_url",
+    "professional_title",
+]
+
+
+SECTION_SCHEMAS = {
+    "education": "List of { institution_name, degree, field_of_study, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), is_current (bool), grade, location, description }",
+    "experiences": "List of { job_title, company_name, location, employment_type, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), is_current (bool), description, achievements (list of strings), technologies_used (list of strings) }",
+    "projects": "List of { project_name, description, highlights (list of strings), project_url, github_url, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), technologies_used (list of strings), is_featured (bool) }",
+    "skills": "List of strings (Extract all technical skills found)",
+}
+
+
+def build_system_prompt(
+    personal_info_fields: List[str], sections: Optional[List[str]] = None
+) -> str:
+    """Build the extraction prompt for the given personal_info fields and sections"""
+    if sections is None:
+        sections = list(SECTION_SCHEMAS)
+
+    keys = []
+    if personal_info_fields:
+        keys.append(f"- personal_info: {{ {', '.join(personal_info_fields)} }}")
+    keys.extend(f"- {section}: {SECTION_SCHEMAS[section]}" for section in sections)
+    key_lines = "\n        ".join(keys)
+
+    return f"""
+        You are an expert resume parser. Your job is to extract structured information from a resume text.
+        Return the output in strict JSON format.
+
+        The JSON structure must match the following keys exactly:
+        {key_lines}
+
+        If a date is not explicit, try to infer it or leave null.
+        If a field is missing, use null.
+        """
+
+
+def build_repair_prompt(section: str, errors: List[str]) -> str:
+    """Build a focused prompt that re-extracts one section that failed validation"""
+    return f"""
+        You are an expert resume parser. A previous extraction of the "{section}" section of this resume was invalid:
+        {"; ".join(errors)}
+
+        Extract only this section. Return the output in strict JSON format with the single key:
+        - {section}: {SECTION_SCHEMAS[section]}
+
+        Dates must be YYYY-MM-DD. If only a month or year is given, use the first day of that month or year.
+        If a field is missing, use null.
+        """
+
 
 class CVParserService:
     def __init__(self):
         self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = "gpt-4o"
+        self.model = settings.CV_PARSER_MODEL
+        self.router = ModelRouter(
+            small_model=settings.CV_PARSER_SMALL_MODEL,
+            large_model=settings.CV_PARSER_MODEL,
+            max_tokens=settings.CV_PARSER_SMALL_MODEL_MAX_TOKENS,
+            max_pages=settings.CV_PARSER_SMALL_MODEL_MAX_PAGES,
+        )
+        self.contact_extractor = ContactExtractor()
+        self.normalizer = TextNormalizer(
+            model=self.model, token_budget=settings.CV_PARSER_MAX_INPUT_TOKENS
+        )
+        # Routing and usage of the last parse, for timing records and metrics
+        self.routed_model = self.model
+        self.routing_reason: Optional[str] = None
+        self.escalated = False
+        self.input_tokens = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.on_progress: Optional[ProgressCallback] = None
 
-    def _extract_text_from_pdf(self, file_content: bytes) -> str:
+    def _emit(self, event: str, **data: Any) -> None:
+        if self.on_progress:
+            self.on_progress(event, data)
+
+    def _extract_pages_from_pdf(self, file_content: bytes) -> List[str]:
         try:
             reader = PdfReader(BytesIO(file_content))
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return [page.extract_text() or "" for page in reader.pages]
         except Exception as e:
             logger.error("Error extracting text from PDF:", extra={"error": str(e)})
             raise ValueError("Could not extract text from the provided PDF file.")
 
-    async def parse_cv(self, file_content: bytes) -> Dict[str, Any]:
-        text_content = self._extract_text_from_pdf(file_content)
+    def _normalize_text(self, pages: List[str]) -> NormalizedText:
+        normalized = self.normalizer.normalize(pages)
+        logger.info(
+            "CV text normalized",
+            extra={
+                "original_tokens": normalized.original_tokens,
+                "tokens": normalized.tokens,
+                "reduction_ratio": normalized.reduction_ratio,
+                "truncated": normalized.truncated,
+            },
+        )
+        return normalized
 
-        system_prompt = """
-        You are an expert resume parser. Your job is to extract structured information from a resume text.
-        Return the output in strict JSON format.
-        
-        The JSON structure must match the following keys exactly:
-        - personal_info: { full_name, email, phone, location, linkedin_url, github_url, portfolio_url, website_url, professional_title }
-        - education: List of { institution_name, degree, field_of_study, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), is_current (bool), grade, location, description }
-        - experiences: List of { job_title, company_name, location, employment_type, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), is_current (bool), description, achievements (list of strings), technologies_used (list of strings) }
-        - projects: List of { project_name, description, highlights (list of strings), project_url, github_url, start_date (YYYY-MM-DD), end_date (YYYY-MM-DD), technologies_used (list of strings), is_featured (bool) }
-        - skills: List of strings (Extract all technical skills found)
-        
-        If a date is not explicit, try to infer it or leave null.
-        If a field is missing, use null.
+    def _should_split(self, normalized: NormalizedText) -> bool:
+        return (
+            settings.CV_PARSER_SPLIT_SECTIONS
+            and normalized.tokens >= settings.CV_PARSER_SPLIT_MIN_TOKENS
+        )
+
+    async def _complete_json(self, system_prompt: str, text: str) -> Dict[str, Any]:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            response_format={"type": "json_object"},
+        )
+
+        if response.usage:
+            self.prompt_tokens += response.usage.prompt_tokens
+            self.completion_tokens += response.usage.completion_tokens
+
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty response from OpenAI")
+
+        return json.loads(content)
+
+    async def _stream_json(self, system_prompt: str, text: str) -> Dict[str, Any]:
+        """Like _complete_json, but emits each top-level section as soon as it closes"""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        parser = JSONObjectStream()
+        async for chunk in stream:
+            if chunk.usage:
+                self.prompt_tokens += chunk.usage.prompt_tokens
+                self.completion_tokens += chunk.usage.completion_tokens
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            for key, value in parser.feed(chunk.choices[0].delta.content):
+                self._emit("section", name=key, data=value)
+
+        if not parser.text:
+            raise ValueError("Empty response from OpenAI")
+
+        return json.loads(parser.text)
+
+    async def _complete_and_emit(self, system_prompt: str, text: str) -> Dict[str, Any]:
+        result = await self._complete_json(system_prompt, text)
+        for key, value in result.items():
+            self._emit("section", name=key, data=value)
+        return result
+
+    async def _parse_sections(
+        self,
+        sections: Dict[str, str],
+        detected: List[str],
+        personal_info_fields: List[str],
+    ) -> Dict[str, Any]:
+        """Extract each detected section with its own concurrent request.
+
+        Personal info and any sections without a detected heading are
+        extracted from the remaining text in one more request.
         """
+        requests = [
+            self._complete_and_emit(build_system_prompt([], [key]), sections[key])
+            for key in detected
+        ]
+        remaining = [key for key in SECTION_SCHEMAS if key not in detected]
+        if personal_info_fields or remaining:
+            rest_text = "\n\n".join(
+                sections.get(key, "") for key in (HEADER_KEY, OTHER_KEY)
+            ).strip()
+            requests.append(
+                self._complete_and_emit(
+                    build_system_prompt(personal_info_fields, remaining), rest_text
+                )
+            )
+
+        parsed_data: Dict[str, Any] = {}
+        for result in await asyncio.gather(*requests):
+            for key, value in result.items():
+                if value or key not in parsed_data:
+                    parsed_data[key] = value
+        return parsed_data
+
+    async def _repair_sections(
+        self,
+        parsed_data: Dict[str, Any],
+        failures: Dict[str, List[str]],
+        sections: Dict[str, str],
+        text: str,
+    ) -> Dict[str, Any]:
+        """Re-extract only the sections that failed validation and merge them back"""
+        logger.info("Re-parsing invalid CV sections", extra={"failures": failures})
+        failing = list(failures)
+        results = await asyncio.gather(
+            *(
+                self._complete_json(
+                    build_repair_prompt(section, failures[section]),
+                    sections.get(section) or text,
+                )
+                for section in failing
+            ),
+            return_exceptions=True,
+        )
+
+        for section, result in zip(failing, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Error re-parsing CV section:",
+                    extra={"section": section, "error": str(result)},
+                )
+                continue
+            repaired = result.get(section)
+            if repaired and not validate_sections({section: repaired}, {}):
+                parsed_data[section] = repaired
+                self._emit("section", name=section, data=repaired)
+            else:
+                logger.warning(
+                    "Re-parsed CV section is still invalid",
+                    extra={"section": section},
+                )
+        return parsed_data
+
+    def record_metrics(self, timer: StageTimer) -> None:
+        """Add the stage durations and token usage of the last parse to metrics"""
+        model = self.routed_model
+        cv_parse_seconds.observe(
+            timer.total_ms / 1000, model=model, escalated=str(self.escalated).lower()
+        )
+        for stage, duration_ms in timer.stages.items():
+            cv_parse_stage_seconds.observe(duration_ms / 1000, stage=stage, model=model)
+        cv_parse_tokens.observe(self.input_tokens, kind="input", model=model)
+        cv_parse_tokens.observe(self.prompt_tokens, kind="prompt", model=model)
+        cv_parse_tokens.observe(self.completion_tokens, kind="completion", model=model)
+
+    async def parse_cv(
+        self,
+        file_content: bytes,
+        timer: Optional[StageTimer] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Parse a PDF CV into structured data.
+
+        When `on_progress` is given it receives an event as each stage
+        finishes, and each parsed section as soon as it is available.
+        """
+        timer = timer or StageTimer()
+        self.on_progress = on_progress
+        with timer.stage("extract"):
+            pages = self._extract_pages_from_pdf(file_content)
+
+        with timer.stage("normalize"):
+            normalized = self._normalize_text(pages)
+            text_content = normalized.text
+            self.input_tokens = normalized.tokens
+
+            contacts = self.contact_extractor.extract(text_content)
+            known_fields = {
+                field for field, match in contacts.items() if match.high_confidence
+            }
+            personal_info_fields = [
+                field for field in PERSONAL_INFO_FIELDS if field not in known_fields
+            ]
+
+        self._emit("extracted", pages=len(pages), tokens=normalized.tokens)
+
+        sections = split_sections(text_content)
+        route = self.router.route(normalized, sections, len(pages))
+        self.model = self.routed_model = route.model
+        self.routing_reason = route.reason
+        logger.info(
+            "CV parse model routed",
+            extra={
+                "model": route.model,
+                "reason": route.reason,
+                "tokens": normalized.tokens,
+                "pages": len(pages),
+            },
+        )
 
         try:
-            response = await self.client.chat.completions.create(
+            detected = (
+                [key for key in SECTION_SCHEMAS if key in sections]
+                if self._should_split(normalized)
+                else []
+            )
+            split = len(detected) >= MIN_SPLIT_SECTIONS
+            self._emit(
+                "llm_started",
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text_content},
-                ],
-                response_format={"type": "json_object"},
+                sections=detected if split else list(SECTION_SCHEMAS),
             )
+            with timer.stage("llm"):
+                if split:
+                    logger.info("Parsing CV by sections", extra={"sections": detected})
+                    parsed_data = await self._parse_sections(
+                        sections, detected, personal_info_fields
+                    )
+                else:
+                    complete = (
+                        self._stream_json if self.on_progress else self._complete_json
+                    )
+                    parsed_data = await complete(
+                        build_system_prompt(personal_info_fields), text_content
+                    )
 
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI")
+            # The small model escalates its failing sections to the large model
+            escalate = self.model != self.router.large_model
+            if escalate or settings.CV_PARSER_REPAIR_SECTIONS:
+                failures = validate_sections(parsed_data, sections)
+                if failures:
+                    if escalate:
+                        logger.info(
+                            "Escalating CV parse to the large model",
+                            extra={"from": self.model, "failures": list(failures)},
+                        )
+                        self.model = self.router.large_model
+                        self.escalated = True
+                    with timer.stage("escalate" if escalate else "repair"):
+                        parsed_data = await self._repair_sections(
+                            parsed_data, failures, sections, text_content
+                        )
 
-            parsed_data = json.loads(content)
+            parsed_data["personal_info"] = merge_contacts(
+                parsed_data.get("personal_info"), contacts
+            )
+            self._emit("parsed", data=parsed_data)
             return parsed_data
 
         except Exception as e:
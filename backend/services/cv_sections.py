@@ -0,0 +1,77 @@
+import re
+from typing import Dict, List, Optional, Pattern
+
+# Sections that get their own extraction call, keyed by the parsed_data key
+SECTION_HEADINGS: Dict[str, Pattern[str]] = {
+    "experiences": re.compile(
+        r"^(?:work |professional |relevant )?(?:experience|employment(?: history)?"
+        r"|work history|career history)$"
+    ),
+    "education": re.compile(
+        r"^(?:education(?:al background)?|academic background|academics"
+        r"|education (?:and|&) training)$"
+    ),
+    "projects": re.compile(
+        r"^(?:(?:personal |selected |key |side |academic )?projects"
+        r"|project experience)$"
+    ),
+    "skills": re.compile(
+        r"^(?:(?:technical |core |key )?skills(?: (?:and|&) (?:tools|technologies))?"
+        r"|core competencies|technologies|tech stack|tools (?:and|&) technologies)$"
+    ),
+}
+
+# Headings that end a target section without starting a new one
+OTHER_HEADINGS = re.compile(
+    r"^(?:summary|professional summary|profile|about me|objective|certifications?"
+    r"|licenses (?:and|&) certifications|publications|awards|honors|languages"
+    r"|interests|hobbies|volunteering|volunteer experience|references|referees"
+    r"|achievements|courses|contact(?: details| information)?)$"
+)
+
+HEADER_KEY = "header"
+OTHER_KEY = "other"
+
+MAX_HEADING_LENGTH = 40
+
+
+def _heading_key(line: str) -> Optional[str]:
+    candidate = line.strip().strip(":").strip().lower()
+    if not candidate or len(candidate) > MAX_HEADING_LENGTH:
+        return None
+    for key, pattern in SECTION_HEADINGS.items():
+        if pattern.match(candidate):
+            return key
+    if OTHER_HEADINGS.match(candidate):
+        return OTHER_KEY
+    return None
+
+
+def heading(line: str) -> Optional[str]:
+    """The line lowercased and without colons, if it is a section heading"""
+    if _heading_key(line) is None:
+        return None
+    return line.strip().strip(":").strip().lower()
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split CV text into sections by detected headings.
+
+    Text before the first heading is returned under "header" and text under
+    unrecognised headings under "other". Repeated headings are concatenated.
+    """
+    chunks: Dict[str, List[str]] = {HEADER_KEY: []}
+    current = HEADER_KEY
+    for line in text.splitlines():
+        key = _heading_key(line)
+        if key is not None:
+            current = key
+            chunks.setdefault(current, [])
+            continue
+        chunks[current].append(line)
+
+    return {
+        key: body
+        for key, lines in chunks.items()
+        if (body := "\n".join(lines).strip()) or key == HEADER_KEY
+    }
@@ -0,0 +1,51 @@
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from schemas.cv_parser_schemas.cv_parser import (
+    ParsedEducationSchema,
+    ParsedExperienceSchema,
+    ParsedProjectSchema,
+)
+
+# Errors reported per section, enough for the repair prompt to act on
+MAX_ERRORS_PER_SECTION = 5
+
+SECTION_ADAPTERS: Dict[str, TypeAdapter] = {
+    "education": TypeAdapter(List[ParsedEducationSchema]),
+    "experiences": TypeAdapter(List[ParsedExperienceSchema]),
+    "projects": TypeAdapter(List[ParsedProjectSchema]),
+    "skills": TypeAdapter(List[str]),
+}
+
+
+def _format_error(error: ErrorDetails) -> str:
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def validate_sections(
+    parsed_data: Dict[str, Any], sections: Dict[str, str]
+) -> Dict[str, List[str]]:
+    """Validate parsed CV sections against the typed parser schemas.
+
+    A section fails when its entries do not validate, or when it came back
+    empty although a heading for it was found in the CV text. Returns the
+    failing sections with their errors.
+    """
+    failures: Dict[str, List[str]] = {}
+    for section, adapter in SECTION_ADAPTERS.items():
+        value = parsed_data.get(section)
+        if not value:
+            if sections.get(section):
+                failures[section] = ["section is empty but present in the CV"]
+            continue
+
+        try:
+            adapter.validate_python(value)
+        except ValidationError as e:
+            failures[section] = [
+                _format_error(error) for error in e.errors()[:MAX_ERRORS_PER_SECTION]
+            ]
+    return failures
@@ -0,0 +1,45 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+from services.cv_sections import SECTION_HEADINGS
+from services.text_normalizer import NormalizedText
+
+
+class ModelRoute(BaseModel):
+    """Model chosen for a CV parse and the signal that decided it"""
+
+    model: str
+    reason: str
+
+
+class ModelRouter:
+    """Pick the extraction model for a CV from its size and structure.
+
+    Short, well-structured CVs go to the small model. Long, multi-page,
+    truncated or heading-less CVs go to the large model, which copes better
+    with text that has to be interpreted as a whole.
+    """
+
+    def __init__(
+        self, small_model: str, large_model: str, max_tokens: int, max_pages: int
+    ):
+        self.small_model = small_model
+        self.large_model = large_model
+        self.max_tokens = max_tokens
+        self.max_pages = max_pages
+
+    def route(
+        self, normalized: NormalizedText, sections: Dict[str, str], page_count: int
+    ) -> ModelRoute:
+        if not self.small_model:
+            return ModelRoute(model=self.large_model, reason="routing_disabled")
+        if normalized.truncated:
+            return ModelRoute(model=self.large_model, reason="truncated")
+        if normalized.tokens > self.max_tokens:
+            return ModelRoute(model=self.large_model, reason="tokens")
+        if page_count > self.max_pages:
+            return ModelRoute(model=self.large_model, reason="pages")
+        if not any(section in sections for section in SECTION_HEADINGS):
+            return ModelRoute(model=self.large_model, reason="unstructured")
+        return ModelRoute(model=self.small_model, reason="small_document")
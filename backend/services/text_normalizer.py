@@ -0,0 +1,159 @@
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional
+
+import tiktoken
+from pydantic import BaseModel
+
+from utils.logger import get_logger
+
+logger = get_logger()
+
+# Rough characters-per-token ratio used when no tokenizer is available
+APPROX_CHARS_PER_TOKEN = 4
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\f\v\u00a0]+")
+_PAGE_NUMBER_LINE = re.compile(
+    r"^(?:page\s*)?-?\s*\d{1,3}\s*-?(?:\s*(?:of|/)\s*\d{1,3})?$", re.IGNORECASE
+)
+_HYPHENATED_END = re.compile(r"[A-Za-z]-$")
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0e-\x1f\x7f]")
+
+# Lines this close to the top or bottom of a page are header/footer candidates
+EDGE_LINES_PER_PAGE = 3
+
+
+class NormalizedText(BaseModel):
+    """Result of normalizing extracted CV text"""
+
+    text: str
+    original_tokens: int
+    tokens: int
+    truncated: bool = False
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of input tokens removed by normalization"""
+        if not self.original_tokens:
+            return 0.0
+        return round(1 - self.tokens / self.original_tokens, 4)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(
+            "Tokenizer unavailable, falling back to approximate token counts",
+            extra={"model": model, "error": str(e)},
+        )
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count tokens for a model, approximating when no tokenizer is available"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / APPROX_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut text down to at most max_tokens, preferring a line boundary"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        head = text[: max_tokens * APPROX_CHARS_PER_TOKEN]
+    else:
+        head = encoding.decode(
+            encoding.encode(text, disallowed_special=())[:max_tokens]
+        )
+
+    if len(head) < len(text) and "\n" in head:
+        head = head[: head.rfind("\n")]
+    return head.rstrip()
+
+
+class TextNormalizer:
+    """Cleans up PDF-extracted CV text before it is sent to the model.
+
+    Repeated headers/footers, page numbers, hyphenation artifacts and
+    whitespace runs are removed, then the text is cut to a token budget.
+    """
+
+    def __init__(self, model: str, token_budget: int):
+        self.model = model
+        self.token_budget = token_budget
+
+    def normalize(self, pages: List[str]) -> NormalizedText:
+        raw_text = "\n".join(pages)
+        original_tokens = count_tokens(raw_text, self.model)
+
+        page_lines = [self._clean_page(page) for page in pages]
+        lines = self._drop_repeated_lines(page_lines)
+        text = self._collapse_blank_lines(lines)
+
+        truncated = False
+        tokens = count_tokens(text, self.model)
+        if tokens > self.token_budget:
+            text = truncate_to_tokens(text, self.token_budget, self.model)
+            tokens = count_tokens(text, self.model)
+            truncated = True
+
+        return NormalizedText(
+            text=text,
+            original_tokens=original_tokens,
+            tokens=tokens,
+            truncated=truncated,
+        )
+
+    def _clean_page(self, page: str) -> List[str]:
+        lines: List[str] = []
+        for raw_line in _CONTROL_CHARS.sub("", page).splitlines():
+            line = _INLINE_WHITESPACE.sub(" ", raw_line).strip()
+            if _PAGE_NUMBER_LINE.match(line):
+                continue
+            # Re-join words split across lines, e.g. "develop-\nment"
+            if lines and _HYPHENATED_END.search(lines[-1]) and line[:1].islower():
+                lines[-1] = lines[-1][:-1] + line
+                continue
+            lines.append(line)
+        return lines
+
+    def _drop_repeated_lines(self, page_lines: List[List[str]]) -> List[str]:
+        """Keep only the first occurrence of headers/footers repeated on most pages"""
+        if len(page_lines) < 2:
+            return [line for lines in page_lines for line in lines]
+
+        page_counts: Counter[str] = Counter()
+        for lines in page_lines:
+            content = [line for line in lines if any(c.isalnum() for c in line)]
+            edges = content[:EDGE_LINES_PER_PAGE] + content[-EDGE_LINES_PER_PAGE:]
+            page_counts.update({line.lower() for line in edges})
+
+        threshold = max(2, math.ceil(len(page_lines) / 2))
+        boilerplate = {key for key, count in page_counts.items() if count >= threshold}
+
+        seen: set[str] = set()
+        result: List[str] = []
+        for lines in page_lines:
+            for line in lines:
+                key = line.lower()
+                if key in boilerplate:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                result.append(line)
+            result.append("")
+        return result
+
+    @staticmethod
+    def _collapse_blank_lines(lines: List[str]) -> str:
+        result: List[str] = []
+        for line in lines:
+            if not line and (not result or not result[-1]):
+                continue
+            result.append(line)
+        return "\n".join(result).strip()
@@ -20,6 +20,27 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
 
+    # Cache settings
+    # Per-worker bound on cached values; 0 disables the in-process cache
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+    # Expiry of entries stored without their own TTL; 0 keeps them until evicted
+    CACHE_DEFAULT_TTL_SECONDS: int = 0
+    # Tier shared by the workers: "", "shared_memory" or "resp"
+    CACHE_SHARED_BACKEND: str = ""
+    # Host-local shared memory file, suffixed with its layout; put it on /dev/shm
+    CACHE_SHARED_MEMORY_PATH: str = "/dev/shm/resume-builder-cache"
+    CACHE_SHARED_MEMORY_SLOTS: int = 4096
+    # Values larger than a slot are only cached per worker
+    CACHE_SHARED_MEMORY_SLOT_BYTES: int = 16 * 1024
+    # Redis-protocol server, e.g. redis://:password@localhost:6379/0
+    CACHE_RESP_URL: str = "redis://localhost:6379/0"
+    # Expiry of every entry in the Redis-protocol server; old keys are never deleted
+    CACHE_RESP_TTL_SECONDS: int = 24 * 60 * 60
+    # Seconds a worker keeps its copy of a shared hit
+    CACHE_SHARED_LOCAL_TTL_SECONDS: int = 60
+    # Listen for cache invalidations published by the other workers
+    CACHE_INVALIDATION_ENABLED: bool = True
+
     # JWT settings
     JWT_REFRESH_EXPIRATION_MINUTES: int = (
         15 * 24 * 60
@@ -29,6 +50,16 @@ class Settings(BaseSettings):
 
     # AI Settings
     OPENAI_API_KEY: str = ""
+    CV_PARSER_MODEL: str = "gpt-4o"
+    # Small CVs are parsed with this model; leave empty to always use CV_PARSER_MODEL
+    CV_PARSER_SMALL_MODEL: str = "gpt-4o-mini"
+    CV_PARSER_SMALL_MODEL_MAX_TOKENS: int = 1500
+    CV_PARSER_SMALL_MODEL_MAX_PAGES: int = 2
+    CV_PARSER_MAX_INPUT_TOKENS: int = 6000
+    CV_PARSER_SPLIT_SECTIONS: bool = True
+    CV_PARSER_SPLIT_MIN_TOKENS: int = 1500
+    CV_PARSER_REPAIR_SECTIONS: bool = True
+    CV_IMPORT_PREVIEW_EXPIRATION_MINUTES: int = 30
 
     # Gunicorn settings
     GUNICORN_WORKERS: int = 1
@@ -43,6 +74,39 @@ class Settings(BaseSettings):
             return int(v)
         raise ValueError("Debug must be 0 or 1")
 
+    @field_validator("CV_PARSER_MAX_INPUT_TOKENS", mode="before")
+    @classmethod
+    def validate_cv_parser_max_input_tokens(cls, v: str) -> int:
+        if int(v) > 0:
+            return int(v)
+        raise ValueError("CV_PARSER_MAX_INPUT_TOKENS must be a positive integer")
+
+    @field_validator(
+        "CACHE_MEMORY_MAX_BYTES",
+        "CACHE_DEFAULT_TTL_SECONDS",
+        "CACHE_SHARED_LOCAL_TTL_SECONDS",
+        mode="before",
+    )
+    @classmethod
+    def validate_cache_sizes(cls, v: str) -> int:
+        if int(v) >= 0:
+            return int(v)
+        raise ValueError("Cache sizes and TTLs must not be negative")
+
+    @field_validator("CACHE_RESP_TTL_SECONDS", mode="before")
+    @classmethod
+    def validate_cache_resp_ttl_seconds(cls, v: str) -> int:
+        if int(v) > 0:
+            return int(v)
+        raise ValueError("CACHE_RESP_TTL_SECONDS must be a positive integer")
+
+    @field_validator("CACHE_SHARED_BACKEND", mode="before")
+    @classmethod
+    def validate_cache_shared_backend(cls, v: str) -> str:
+        if v in ["", "shared_memory", "resp"]:
+            return v
+        raise ValueError('CACHE_SHARED_BACKEND must be "", "shared_memory" or "resp"')
+
     @field_validator("GUNICORN_WORKERS", mode="before")
     @classmethod
     def validate_gunicorn_workers(cls, v: str) -> int:
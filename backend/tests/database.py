@@ -0,0 +1,33 @@
+"""Helpers for tests that need the Postgres database from DB_URL.
+
+Those tests expect the migrations to be applied and are skipped when the
+database cannot be reached.
+"""
+
+import asyncio
+from functools import lru_cache
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from settings import settings
+
+
+@lru_cache
+def database_available() -> bool:
+    async def connect() -> bool:
+        engine = create_async_engine(settings.DB_URL, connect_args={"timeout": 2})
+        try:
+            async with engine.connect():
+                return True
+        except Exception:
+            return False
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(connect())
+
+
+requires_database = pytest.mark.skipif(
+    not database_available(), reason="database not available"
+)
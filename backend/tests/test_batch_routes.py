@@ -0,0 +1,128 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db import get_db
+from dependencies.auth_dependencies.auth import get_current_user
+from dependencies.user_input_dependencies.section_operations import (
+    SectionOperations,
+)
+from main import app
+from schemas.common import MAX_BATCH_SIZE
+
+client = TestClient(app)
+
+USER = SimpleNamespace(id=uuid.uuid4())
+NOW = datetime.now(UTC)
+
+
+def _project(project_id: uuid.UUID, name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=project_id,
+        user_id=USER.id,
+        project_name=name,
+        description="Side project",
+        highlights=None,
+        project_url=None,
+        github_url=None,
+        start_date=None,
+        end_date=None,
+        technologies_used=None,
+        is_featured=False,
+        display_order=0,
+        is_active=True,
+        description_enhanced=None,
+        highlights_enhanced=None,
+        enhancement_prompt_used=None,
+        last_enhanced_at=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+@pytest.fixture
+def authenticated():
+    async def fake_get_db():
+        yield None
+
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_user] = lambda: USER
+    yield
+    app.dependency_overrides.clear()
+
+
+def test_batch_create_returns_every_item_in_order(monkeypatch, authenticated):
+    async def fake_create_many(self, payloads, user_id):
+        return [_project(uuid.uuid4(), payload.project_name) for payload in payloads]
+
+    monkeypatch.setattr(SectionOperations, "create_many", fake_create_many)
+    response = client.post(
+        "/api/projects/batch",
+        json=[
+            {"project_name": name, "description": "Side project"}
+            for name in ("CLI", "API")
+        ],
+    )
+
+    assert response.status_code == 201
+    results = response.json()["results"]
+    assert [result["index"] for result in results] == [0, 1]
+    assert [result["status_code"] for result in results] == [201, 201]
+    assert [result["item"]["project_name"] for result in results] == ["CLI", "API"]
+
+
+def test_batch_update_reports_missing_items_unless_atomic(monkeypatch, authenticated):
+    found, missing = uuid.uuid4(), uuid.uuid4()
+    calls = []
+
+    async def fake_update_many(self, changes, user_id, atomic=True):
+        calls.append(atomic)
+        if atomic:
+            return {}, [missing]
+        return {found: _project(found, "Renamed")}, [missing]
+
+    monkeypatch.setattr(SectionOperations, "update_many", fake_update_many)
+    payload = [
+        {"id": str(found), "project_name": "Renamed"},
+        {"id": str(missing), "project_name": "Gone"},
+    ]
+
+    atomic = client.put("/api/projects/batch", json=payload)
+    best_effort = client.put("/api/projects/batch?atomic=false", json=payload)
+
+    assert calls == [True, False]
+    assert atomic.status_code == 404
+    assert str(missing) in atomic.json()["detail"]
+    assert best_effort.status_code == 200
+    first, second = best_effort.json()["results"]
+    assert first["status_code"] == 200
+    assert first["item"]["project_name"] == "Renamed"
+    assert second["status_code"] == 404
+    assert second["item"] is None
+
+
+def test_batch_delete_and_size_limit(monkeypatch, authenticated):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+
+    async def fake_delete_many(self, item_ids, user_id, atomic=True):
+        return set(item_ids), []
+
+    monkeypatch.setattr(SectionOperations, "delete_many", fake_delete_many)
+    response = client.post(
+        "/api/experiences/batch/delete", json={"ids": [str(i) for i in ids]}
+    )
+    too_many = client.post(
+        "/api/experiences/batch/delete",
+        json={"ids": [str(uuid.uuid4()) for _ in range(MAX_BATCH_SIZE + 1)]},
+    )
+    empty = client.post("/api/education/batch", json=[])
+
+    assert response.status_code == 200
+    assert [result["id"] for result in response.json()["results"]] == [
+        str(i) for i in ids
+    ]
+    assert too_many.status_code == 422
+    assert empty.status_code == 422
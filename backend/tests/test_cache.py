@@ -0,0 +1,189 @@
+import asyncio
+from functools import partial
+from typing import List, Optional
+
+import pytest
+
+from utils.cache import (
+    ENTRY_OVERHEAD_BYTES,
+    Cache,
+    CacheBackend,
+    MemoryBackend,
+    TieredBackend,
+)
+
+
+class _BrokenBackend(CacheBackend):
+    async def get(self, key: str) -> Optional[bytes]:
+        raise ConnectionError("down")
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        raise ConnectionError("down")
+
+    async def delete(self, key: str) -> None:
+        raise ConnectionError("down")
+
+
+def _value(size: int) -> bytes:
+    return b"x" * (size - ENTRY_OVERHEAD_BYTES)
+
+
+def test_memory_backend_evicts_least_recently_used_entries_by_size():
+    backend = MemoryBackend(max_bytes=1000)
+
+    async def scenario() -> None:
+        await backend.set("a", _value(400))
+        await backend.set("b", _value(400))
+        await backend.get("a")
+        await backend.set("c", _value(400))
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") is not None
+        await backend.set("huge", _value(1001))
+
+    asyncio.run(scenario())
+
+    assert backend.size == 800
+    assert backend.evictions == 1
+    assert len(backend) == 2
+
+
+def test_memory_backend_expires_entries(monkeypatch):
+    backend = MemoryBackend(max_bytes=10_000)
+    now = [100.0]
+    monkeypatch.setattr("utils.cache.time.monotonic", lambda: now[0])
+
+    async def scenario() -> List[Optional[bytes]]:
+        await backend.set("short", b"1", ttl=5)
+        await backend.set("forever", b"2")
+        now[0] += 5
+        return [await backend.get("short"), await backend.get("forever")]
+
+    assert asyncio.run(scenario()) == [None, b"2"]
+    assert len(backend) == 1
+
+
+def test_memory_backend_deletes_tagged_entries_together():
+    backend = MemoryBackend(max_bytes=10_000)
+
+    async def scenario() -> None:
+        await backend.set("alice:profile", _value(300), tag="alice")
+        await backend.set("alice:summary", _value(300), tag="alice")
+        await backend.set("bob:profile", _value(300), tag="bob")
+        await backend.delete_tag("alice")
+        assert await backend.get("bob:profile") is not None
+
+    asyncio.run(scenario())
+
+    assert len(backend) == 1
+    assert backend.size == 300
+
+
+def test_keys_carry_the_version():
+    assert Cache.key("profile", 1, "summary", version=3) == "profile:1:summary:v3"
+    assert Cache.key("parse", "abc") == "parse:abc"
+
+
+def test_get_or_compute_coalesces_concurrent_misses():
+    cache = Cache(MemoryBackend(max_bytes=10_000))
+    computed = []
+
+    async def compute() -> bytes:
+        computed.append(1)
+        await asyncio.sleep(0.01)
+        return b"value"
+
+    async def scenario() -> List[Optional[bytes]]:
+        first = await asyncio.gather(
+            *(cache.get_or_compute("key", compute) for _ in range(5))
+        )
+        return [*first, await cache.get_or_compute("key", compute)]
+
+    assert asyncio.run(scenario()) == [b"value"] * 6
+    assert len(computed) == 1
+    assert (cache.hits, cache.misses, cache.coalesced) == (1, 5, 4)
+    assert cache.hit_ratio == pytest.approx(1 / 6)
+
+
+def test_none_results_are_not_cached():
+    cache = Cache(MemoryBackend(max_bytes=10_000))
+
+    async def compute() -> None:
+        return None
+
+    assert asyncio.run(cache.get_or_compute("key", compute)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_backend_errors_degrade_to_misses():
+    cache = Cache(_BrokenBackend())
+
+    async def compute() -> bytes:
+        return b"value"
+
+    async def scenario() -> Optional[bytes]:
+        await cache.delete("key")
+        return await cache.get_or_compute("key", compute)
+
+    assert asyncio.run(scenario()) == b"value"
+    assert cache.misses == 1
+    assert cache.errors == 3
+
+
+def test_tiered_backend_fills_other_workers_from_the_shared_tier(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("utils.cache.time.monotonic", lambda: now[0])
+    shared = MemoryBackend(max_bytes=10_000)
+    worker_a = TieredBackend(MemoryBackend(max_bytes=10_000), shared, local_ttl=10)
+    worker_b = TieredBackend(MemoryBackend(max_bytes=10_000), shared, local_ttl=10)
+
+    async def scenario() -> None:
+        await worker_a.set("key", b"value", tag="user")
+        assert await worker_b.get("key") == b"value"
+        assert len(worker_b.local) == 1  # type: ignore[arg-type]
+
+        # The local copy expires; the shared entry does not
+        now[0] += 10
+        await shared.delete("key")
+        assert await worker_b.get("key") is None
+
+        await worker_a.delete_tag("user")
+        assert await worker_a.get("key") is None
+
+    asyncio.run(scenario())
+
+    assert worker_b.shared_hits == 1
+    assert worker_b.stats()["shared_entries"] == 0
+
+
+def test_reader_going_away_does_not_fail_coalesced_readers():
+    cache = Cache(MemoryBackend(max_bytes=10_000))
+    computed = []
+
+    async def compute(reader: str) -> bytes:
+        computed.append(reader)
+        await asyncio.sleep(0.01)
+        return reader.encode()
+
+    async def scenario() -> List[Optional[bytes]]:
+        first = asyncio.create_task(cache.get_or_compute("key", partial(compute, "a")))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.create_task(cache.get_or_compute("key", partial(compute, name)))
+            for name in ("b", "c")
+        ]
+        await asyncio.sleep(0)
+        first.cancel()
+        values = list(await asyncio.gather(*others))
+        return [*values, await cache.get("key")]
+
+    assert asyncio.run(scenario()) == [b"b", b"b", b"b"]
+    # The first computation is dropped; the next reader's is shared
+    assert computed == ["a", "b"]
+    assert cache.coalesced == 1
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from services.contact_extractor import ContactExtractor, ContactMatch, merge_contacts
+
+CORPUS = json.loads(
+    (Path(__file__).parent / "fixtures" / "contact_corpus.json").read_text()
+)
+
+
+@pytest.mark.parametrize("sample", CORPUS, ids=[s["name"] for s in CORPUS])
+def test_extract_contacts_from_corpus(sample):
+    contacts = ContactExtractor().extract(sample["text"])
+
+    assert {field: m.value for field, m in contacts.items()} == sample["expected"]
+    for field in sample.get("low_confidence", []):
+        assert not contacts[field].high_confidence
+
+
+def test_merge_contacts_prefers_high_confidence_matches():
+    parsed = {"full_name": "Jane Doe", "email": "wrong@example.com", "phone": "123"}
+    contacts = {
+        "email": ContactMatch(value="jane@example.com", high_confidence=True),
+        "phone": ContactMatch(value="+44 20 7946 0958", high_confidence=False),
+        "github_url": ContactMatch(
+            value="https://github.com/jane", high_confidence=False
+        ),
+    }
+
+    merged = merge_contacts(parsed, contacts)
+
+    assert merged["full_name"] == "Jane Doe"
+    assert merged["email"] == "jane@example.com"
+    assert merged["phone"] == "123"
+    assert merged["github_url"] == "https://github.com/jane"
+
+
+def test_model_phone_survives_a_referee_number():
+    text = (
+        "Luis Ortega\nluis.ortega@example.net\n\nReferences\n"
+        "Dr. Max Mustermann, max@uni.de, +49 30 901820"
+    )
+    parsed = {"email": "luis.ortega@example.net", "phone": "+44 20 7946 0000"}
+
+    merged = merge_contacts(parsed, ContactExtractor().extract(text))
+
+    assert merged["phone"] == "+44 20 7946 0000"
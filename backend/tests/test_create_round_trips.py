@@ -0,0 +1,87 @@
+"""Round trips of the create operations against the database.
+
+A create must be a single INSERT ... RETURNING: the generated id and
+timestamps come back with the insert instead of a refresh SELECT. The only
+other statement is the UPDATE ... RETURNING bumping the profile version.
+"""
+
+import asyncio
+import uuid
+from datetime import date
+from typing import List
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dependencies.user_input_dependencies.experience_operations import (
+    ExperienceOperations,
+)
+from dependencies.user_input_dependencies.summary_operations import SummaryOperations
+from models import User
+from schemas.user_input_schemas.experience_schemas import ExperienceCreateSchema
+from schemas.user_input_schemas.summary_schemas import SummaryCreateSchema
+from settings import settings
+from tests.database import requires_database
+
+pytestmark = requires_database
+
+
+async def _create_statements() -> List[List[str]]:
+    engine = create_async_engine(settings.DB_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            user_id = uuid.uuid4()
+            await connection.execute(
+                insert(User).values(
+                    id=user_id,
+                    first_name="Round",
+                    last_name="Trip",
+                    email=f"{user_id}@example.com",
+                    hashed_password="x",
+                )
+            )
+            # Commits inside the operations only release savepoints
+            session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            statements: List[str] = []
+
+            @event.listens_for(connection.sync_connection, "before_cursor_execute")
+            def record(conn, cursor, statement, parameters, context, executemany):
+                if not statement.startswith(("SAVEPOINT", "RELEASE")):
+                    statements.append(statement)
+
+            per_create = []
+            experience = await ExperienceOperations(session).create_experience(
+                ExperienceCreateSchema(
+                    job_title="Engineer",
+                    company_name="Acme",
+                    start_date=date(2020, 1, 1),
+                ),
+                user_id,
+            )
+            per_create.append(statements[:])
+            statements.clear()
+            summary = await SummaryOperations(session).create_summary(
+                SummaryCreateSchema(summary_text="Builds things"), user_id
+            )
+            per_create.append(statements[:])
+
+            assert experience.created_at is not None
+            assert summary is not None and summary.created_at is not None
+            await session.close()
+            await transaction.rollback()
+            return per_create
+    finally:
+        await engine.dispose()
+
+
+def test_create_is_an_insert_returning_and_a_version_bump():
+    for insert_statement, bump in asyncio.run(_create_statements()):
+        assert insert_statement.startswith("INSERT")
+        assert "RETURNING" in insert_statement
+        assert bump.startswith("UPDATE users SET profile_version")
+        assert "pg_notify" in bump
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db import get_db
+from dependencies.auth_dependencies.auth import get_current_user
+from dependencies.cv_parser_dependencies.cv_parser_operations import (
+    CVParserOperations,
+)
+from main import app
+from routes.cv_parser_routes import cv_parser as cv_parser_routes
+from services.cv_parser import CVParserService
+from settings import settings
+
+client = TestClient(app)
+
+USER = SimpleNamespace(id=uuid.uuid4(), first_name="Jane", last_name="Doe")
+PARSED_DATA = {"personal_info": {"full_name": "Jane Doe"}, "skills": ["Python"]}
+
+
+class FakeSession:
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def cv_parser(monkeypatch):
+    """Replace the LLM parse and database operations with in-memory fakes"""
+    store = {}
+    imported = []
+    llm_calls = []
+
+    async def fake_get_db():
+        yield FakeSession()
+
+    @asynccontextmanager
+    async def fake_db_session():
+        yield FakeSession()
+
+    async def fake_parse_cv(self, file_content, timer=None, on_progress=None):
+        llm_calls.append(file_content)
+        if on_progress:
+            on_progress("extracted", {"pages": 1, "tokens": 20})
+            for name, data in PARSED_DATA.items():
+                on_progress("section", {"name": name, "data": data})
+        return dict(PARSED_DATA)
+
+    async def fake_record_parse_run(self, **kwargs):
+        pass
+
+    async def fake_create_import_preview(self, user_id, file_name, parsed_data):
+        preview = SimpleNamespace(
+            id=uuid.uuid4(),
+            expires_at=datetime.now(UTC) + timedelta(minutes=30),
+            parsed_data=parsed_data,
+        )
+        store[preview.id] = parsed_data
+        return preview
+
+    async def fake_import_parsed_cv(self, user, parsed_data):
+        imported.append(parsed_data)
+        return {
+            "personal_info": bool(parsed_data.get("personal_info")),
+            "education_count": len(parsed_data.get("education", [])),
+            "experience_count": len(parsed_data.get("experiences", [])),
+            "project_count": len(parsed_data.get("projects", [])),
+            "skills_count": len(parsed_data.get("skills", [])),
+        }
+
+    async def fake_commit_import_preview(self, user, preview_token, parsed_data=None):
+        stored_data = store.pop(preview_token, None)
+        if stored_data is None:
+            return None
+        return await self.import_parsed_cv(user, parsed_data or stored_data)
+
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(CVParserService, "parse_cv", fake_parse_cv)
+    for name, fake in (
+        ("record_parse_run", fake_record_parse_run),
+        ("create_import_preview", fake_create_import_preview),
+        ("import_parsed_cv", fake_import_parsed_cv),
+        ("commit_import_preview", fake_commit_import_preview),
+    ):
+        monkeypatch.setattr(CVParserOperations, name, fake)
+    monkeypatch.setattr(cv_parser_routes, "db_session", fake_db_session)
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_user] = lambda: USER
+    yield SimpleNamespace(imported=imported, llm_calls=llm_calls)
+    app.dependency_overrides.clear()
+
+
+def _preview() -> dict:
+    response = client.post(
+        "/api/cv_parser/preview_cv/",
+        files={"file": ("cv.pdf", b"%PDF-1.4", "application/pdf")},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_commit_applies_edited_preview_without_reparsing(cv_parser):
+    preview = _preview()
+    assert preview["parsed_data"] == PARSED_DATA
+
+    response = client.post(
+        f"/api/cv_parser/preview_cv/{preview['preview_token']}/commit",
+        json={"skills": ["Python", "SQL"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["parsed_summary"]["skills_count"] == 2
+    assert cv_parser.imported[0]["skills"] == ["Python", "SQL"]
+    assert len(cv_parser.llm_calls) == 1
+
+
+def test_preview_token_can_only_be_committed_once(cv_parser):
+    preview = _preview()
+    commit_url = f"/api/cv_parser/preview_cv/{preview['preview_token']}/commit"
+
+    assert client.post(commit_url).status_code == 200
+    assert client.post(commit_url).status_code == 404
+    assert cv_parser.imported == [PARSED_DATA]
+
+
+def test_upload_stream_emits_progress_then_saved(cv_parser):
+    response = client.post(
+        "/api/cv_parser/upload_cv/stream",
+        files={"file": ("cv.pdf", b"%PDF-1.4", "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), block.split("\n")[1])
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == [
+        "uploaded",
+        "extracted",
+        "section",
+        "section",
+        "saved",
+    ]
+    assert json.loads(events[-1][1].removeprefix("data: "))["parsed_summary"] == {
+        "personal_info": True,
+        "education_count": 0,
+        "experience_count": 0,
+        "project_count": 0,
+        "skills_count": 1,
+    }
+
+
+def test_cancelled_upload_does_not_fail_its_duplicate(cv_parser, monkeypatch):
+    release = asyncio.Event()
+    events = []
+
+    async def slow_parse_cv(self, file_content, timer=None, on_progress=None):
+        cv_parser.llm_calls.append(file_content)
+        await release.wait()
+        if on_progress:
+            on_progress("section", {"name": "skills", "data": ["Python"]})
+        return dict(PARSED_DATA)
+
+    monkeypatch.setattr(CVParserService, "parse_cv", slow_parse_cv)
+
+    def upload(on_progress=None):
+        return cv_parser_routes._parse_upload(
+            b"%PDF-1.4",
+            "cv.pdf",
+            USER,
+            cv_parser_routes.StageTimer(),
+            "import",
+            lambda ops, parsed_data: ops.import_parsed_cv(USER, parsed_data),
+            on_progress=on_progress,
+        )
+
+    async def scenario():
+        first = asyncio.create_task(upload(lambda *event: events.append(event)))
+        await asyncio.sleep(0)
+        duplicate = asyncio.create_task(upload(lambda *event: events.append(event)))
+        await asyncio.sleep(0)
+
+        # The first client goes away while both wait on the parse
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await duplicate, first.cancelled()
+
+    summary, first_cancelled = asyncio.run(scenario())
+
+    assert first_cancelled
+    assert summary["skills_count"] == 1
+    assert len(cv_parser.llm_calls) == 1
+    assert cv_parser.imported == [PARSED_DATA]
+    # Progress reaches the remaining upload only
+    assert events == [("section", {"name": "skills", "data": ["Python"]})]
+    assert not cv_parser_routes.cv_parse_listeners
+
+
+def test_streaming_upload_joining_a_parse_gets_its_progress(cv_parser, monkeypatch):
+    release = asyncio.Event()
+    events = []
+
+    async def slow_parse_cv(self, file_content, timer=None, on_progress=None):
+        cv_parser.llm_calls.append(file_content)
+        await release.wait()
+        if on_progress:
+            on_progress("section", {"name": "skills", "data": ["Python"]})
+        return dict(PARSED_DATA)
+
+    monkeypatch.setattr(CVParserService, "parse_cv", slow_parse_cv)
+
+    def upload(on_progress=None):
+        return cv_parser_routes._parse_upload(
+            b"%PDF-1.4",
+            "cv.pdf",
+            USER,
+            cv_parser_routes.StageTimer(),
+            "import",
+            lambda ops, parsed_data: ops.import_parsed_cv(USER, parsed_data),
+            on_progress=on_progress,
+        )
+
+    async def scenario():
+        # A plain upload starts the parse, a streaming one joins it
+        plain = asyncio.create_task(upload())
+        await asyncio.sleep(0)
+        streaming = asyncio.create_task(upload(lambda *event: events.append(event)))
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(plain, streaming)
+
+    asyncio.run(scenario())
+
+    assert len(cv_parser.llm_calls) == 1
+    assert events == [("section", {"name": "skills", "data": ["Python"]})]
@@ -0,0 +1,57 @@
+import asyncio
+
+from services.cv_parser import CVParserService
+from services.cv_sections import split_sections
+from settings import settings
+
+CV_TEXT = """Jane Doe
+jane@example.com
+Summary
+Backend engineer.
+WORK EXPERIENCE
+Backend Engineer, Acme 2019 - 2023
+Education:
+BSc Computer Science
+Technical Skills
+Python, SQL
+Projects
+Ledger - double-entry bookkeeping
+Languages
+English"""
+
+
+def test_split_sections_detects_headings():
+    sections = split_sections(CV_TEXT)
+
+    assert sections["header"] == "Jane Doe\njane@example.com"
+    assert sections["experiences"] == "Backend Engineer, Acme 2019 - 2023"
+    assert sections["education"] == "BSc Computer Science"
+    assert sections["skills"] == "Python, SQL"
+    assert sections["projects"] == "Ledger - double-entry bookkeeping"
+    assert sections["other"] == "Backend engineer.\nEnglish"
+
+
+def test_parse_sections_issues_one_request_per_section(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    service = CVParserService()
+    calls = []
+
+    async def fake_complete_json(system_prompt, text):
+        calls.append(text)
+        if text.startswith("Backend Engineer"):
+            return {"experiences": [{"job_title": "Backend Engineer"}]}
+        if text.startswith("Python"):
+            return {"skills": ["Python", "SQL"]}
+        return {"personal_info": {"full_name": "Jane Doe"}, "projects": []}
+
+    service._complete_json = fake_complete_json  # type: ignore[method-assign]
+    sections = split_sections(CV_TEXT)
+    parsed = asyncio.run(
+        service._parse_sections(sections, ["experiences", "skills"], ["full_name"])
+    )
+
+    assert len(calls) == 3
+    assert parsed["experiences"] == [{"job_title": "Backend Engineer"}]
+    assert parsed["skills"] == ["Python", "SQL"]
+    assert parsed["personal_info"] == {"full_name": "Jane Doe"}
+    assert parsed["projects"] == []
@@ -0,0 +1,76 @@
+import asyncio
+
+from services.cv_parser import CVParserService
+from services.cv_validator import validate_sections
+from settings import settings
+
+SECTIONS = {
+    "header": "Jane Doe",
+    "experiences": "Backend Engineer, Acme 2019 - 2023",
+    "skills": "Python, SQL",
+}
+
+
+def test_validate_sections_reports_invalid_and_missing_sections():
+    parsed_data = {
+        "experiences": [
+            {
+                "job_title": "Backend Engineer",
+                "company_name": "Acme",
+                "start_date": "2019",
+            }
+        ],
+        "skills": [],
+        "education": [],
+    }
+
+    failures = validate_sections(parsed_data, SECTIONS)
+
+    assert set(failures) == {"experiences", "skills"}
+    assert failures["experiences"][0].startswith("0.start_date")
+    assert "education" not in failures
+
+
+def test_repair_sections_only_reparses_failing_sections(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    service = CVParserService()
+    calls = []
+
+    async def fake_complete_json(system_prompt, text):
+        calls.append(text)
+        if text == SECTIONS["experiences"]:
+            return {
+                "experiences": [
+                    {
+                        "job_title": "Backend Engineer",
+                        "company_name": "Acme",
+                        "start_date": "2019-01-01",
+                    }
+                ]
+            }
+        return {"skills": []}
+
+    monkeypatch.setattr(service, "_complete_json", fake_complete_json)
+    parsed_data = {
+        "personal_info": {"full_name": "Jane Doe"},
+        "experiences": [
+            {
+                "job_title": "Backend Engineer",
+                "company_name": "Acme",
+                "start_date": "2019",
+            }
+        ],
+        "skills": [],
+        "education": [],
+    }
+
+    failures = validate_sections(parsed_data, SECTIONS)
+    repaired = asyncio.run(
+        service._repair_sections(parsed_data, failures, SECTIONS, "Jane Doe\nfull text")
+    )
+
+    assert sorted(calls) == sorted([SECTIONS["experiences"], SECTIONS["skills"]])
+    assert repaired["experiences"][0]["start_date"] == "2019-01-01"
+    # An empty re-parse does not replace the original section
+    assert repaired["skills"] == []
+    assert repaired["personal_info"] == {"full_name": "Jane Doe"}
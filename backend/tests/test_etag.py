@@ -0,0 +1,23 @@
+from starlette.requests import Request
+
+from utils.etag import is_not_modified, make_etag
+
+
+def _request(if_none_match: str) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def test_etag_changes_with_its_parts():
+    assert make_etag(1, "limit=10") == make_etag(1, "limit=10")
+    assert make_etag(1, "limit=10") != make_etag(2, "limit=10")
+    assert make_etag(1, "limit=10") != make_etag(1, "limit=20")
+
+
+def test_if_none_match_is_compared_weakly():
+    etag = make_etag(1)
+    strong = etag.removeprefix("W/")
+
+    assert is_not_modified(_request(f'"other", {strong}'), etag)
+    assert is_not_modified(_request("*"), etag)
+    assert not is_not_modified(_request(make_etag(2)), etag)
@@ -0,0 +1,203 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+from typing import Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from settings import settings
+from tests.database import requires_database
+from utils.invalidation import (
+    INVALIDATION_CHANNEL,
+    Invalidation,
+    InvalidationListener,
+    listener_dsn,
+    notify,
+)
+
+# Workers listening in the multi-process test, and the lag each must stay under
+WORKERS = 3
+MAX_LAG_SECONDS = 1.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.listeners: dict = {}
+        self.termination_listeners: List[Callable] = []
+        self.closed = False
+
+    def add_termination_listener(self, callback: Callable) -> None:
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel: str, callback: Callable) -> None:
+        self.listeners[channel] = callback
+
+    async def fetchval(self, query: str) -> int:
+        return 1
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def terminate(self) -> None:
+        self.closed = True
+
+    def send(self, payload: str) -> None:
+        self.listeners[INVALIDATION_CHANNEL](self, 1, INVALIDATION_CHANNEL, payload)
+
+    def drop(self) -> None:
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+async def _eventually(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 1
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.005)
+
+
+def _payload(user_id: uuid.UUID, kind: str = "profile", version: int = 1) -> str:
+    return f"{user_id}:{kind}:{version}:{time.time()}"
+
+
+def test_invalidations_are_dispatched_by_kind():
+    user_id = uuid.uuid4()
+    listener = InvalidationListener()
+    profiles: List[Invalidation] = []
+
+    async def record(invalidation: Invalidation) -> None:
+        profiles.append(invalidation)
+
+    async def fail(invalidation: Invalidation) -> None:
+        raise RuntimeError("handler failed")
+
+    async def forget(invalidation: Invalidation) -> None:
+        profiles.clear()
+
+    async def scenario() -> None:
+        listener.subscribe("profile", fail)
+        listener.subscribe("profile", record)
+        listener.subscribe("principal", forget)
+        listener.dispatch(_payload(user_id, version=7))
+        listener.dispatch("garbage")
+        await _eventually(lambda: bool(profiles))
+
+    asyncio.run(scenario())
+
+    [invalidation] = profiles
+    assert (invalidation.user_id, invalidation.kind, invalidation.version) == (
+        user_id,
+        "profile",
+        7,
+    )
+
+
+def test_listener_reconnects_and_resets_caches():
+    user_id = uuid.uuid4()
+    connections: List[_FakeConnection] = []
+    received: List[Invalidation] = []
+    resets: List[int] = []
+
+    async def connect() -> _FakeConnection:
+        if not connections and not resets:
+            resets.append(0)
+            raise OSError("connection refused")
+        connection = _FakeConnection()
+        connections.append(connection)
+        return connection
+
+    async def receive(invalidation: Invalidation) -> None:
+        received.append(invalidation)
+
+    async def reset() -> None:
+        resets.append(1)
+
+    async def scenario() -> None:
+        listener = InvalidationListener(connect, retry_delay=0.01)
+        listener.subscribe("profile", receive)
+        listener.on_reconnect(reset)
+        listener.start()
+        await _eventually(listener.connected.is_set)
+        connections[0].send(_payload(user_id, version=1))
+        await _eventually(lambda: len(received) == 1)
+
+        connections[0].drop()
+        await _eventually(lambda: len(connections) == 2)
+        await _eventually(listener.connected.is_set)
+        connections[1].send(_payload(user_id, version=2))
+        await _eventually(lambda: len(received) == 2)
+
+        await listener.stop()
+
+    asyncio.run(scenario())
+
+    assert [invalidation.version for invalidation in received] == [1, 2]
+    # The refused attempt, then a reset on each of the two connections
+    assert resets == [0, 1, 1]
+    assert connections[1].closed
+
+
+def test_notification_is_sent_from_the_returning_clause():
+    sql = str(select(notify("profile", "id", 3)))
+
+    assert "pg_notify" in sql
+    assert "clock_timestamp()" in sql
+    assert listener_dsn("postgresql+asyncpg://u:p@db:5432/cv") == (
+        "postgresql://u:p@db:5432/cv"
+    )
+
+
+def _listen_in_worker(ready, received, user_id: uuid.UUID) -> None:
+    async def listen() -> None:
+        listener = InvalidationListener()
+        applied = asyncio.Event()
+
+        async def apply(invalidation: Invalidation) -> None:
+            if invalidation.user_id == user_id:
+                received.put((os.getpid(), time.time() - invalidation.sent_at))
+                applied.set()
+
+        listener.subscribe("profile", apply)
+        listener.start()
+        await asyncio.wait_for(listener.connected.wait(), timeout=10)
+        ready.release()
+        await asyncio.wait_for(applied.wait(), timeout=10)
+        await listener.stop()
+
+    asyncio.run(listen())
+
+
+@requires_database
+def test_invalidation_reaches_every_worker_quickly():
+    user_id = uuid.uuid4()
+    context = multiprocessing.get_context("spawn")
+    ready = context.Semaphore(0)
+    received = context.Queue()
+    workers = [
+        context.Process(target=_listen_in_worker, args=(ready, received, user_id))
+        for _ in range(WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    for _ in workers:
+        assert ready.acquire(timeout=30)
+
+    async def publish() -> None:
+        engine = create_async_engine(settings.DB_URL)
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(select(notify("profile", str(user_id), 1)))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(publish())
+    lags = dict(received.get(timeout=10) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=10)
+
+    assert len(lags) == WORKERS
+    assert max(lags.values()) < MAX_LAG_SECONDS
@@ -0,0 +1,25 @@
+from utils.json_stream import JSONObjectStream
+
+DOCUMENT = (
+    '{"personal_info": {"full_name": "Jane \\"JD\\" Doe, PhD"}, '
+    '"skills": ["C++", "Bash [scripting]"], "education": []}'
+)
+
+
+def test_members_are_returned_as_soon_as_they_close():
+    stream = JSONObjectStream()
+    members = []
+    seen_before_end = []
+    for i in range(0, len(DOCUMENT), 7):
+        completed = stream.feed(DOCUMENT[i : i + 7])
+        members.extend(completed)
+        if completed and i + 7 < len(DOCUMENT):
+            seen_before_end.extend(key for key, _ in completed)
+
+    assert members == [
+        ("personal_info", {"full_name": 'Jane "JD" Doe, PhD'}),
+        ("skills", ["C++", "Bash [scripting]"]),
+        ("education", []),
+    ]
+    assert seen_before_end == ["personal_info", "skills"]
+    assert stream.text == DOCUMENT
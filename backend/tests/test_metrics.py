@@ -0,0 +1,43 @@
+from fastapi.testclient import TestClient
+
+from main import app
+from utils.metrics import Histogram, metrics_registry
+from utils.timing import StageTimer
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("stage_seconds", "Stage duration", ["stage"], (0.1, 1.0))
+    histogram.observe(0.05, stage="llm")
+    histogram.observe(0.5, stage="llm")
+    histogram.observe(3.0, stage="llm")
+
+    lines = histogram.render()
+
+    assert 'stage_seconds_bucket{stage="llm",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{stage="llm",le="1"} 2' in lines
+    assert 'stage_seconds_bucket{stage="llm",le="+Inf"} 3' in lines
+    assert 'stage_seconds_count{stage="llm"} 3' in lines
+
+
+def test_stage_timer_formats_server_timing_header():
+    timer = StageTimer()
+    with timer.stage("extract"):
+        pass
+    with timer.stage("llm"):
+        pass
+
+    header = timer.server_timing_header()
+
+    assert header.startswith("extract;dur=")
+    assert ", llm;dur=" in header
+    assert ", total;dur=" in header
+
+
+def test_metrics_endpoint_exposes_cv_parse_histograms():
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.text == metrics_registry.render()
+    assert "# TYPE cv_parse_stage_duration_seconds histogram" in response.text
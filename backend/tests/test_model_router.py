@@ -0,0 +1,77 @@
+import asyncio
+
+from services.cv_parser import CVParserService
+from services.cv_sections import split_sections
+from services.model_router import ModelRouter
+from services.text_normalizer import NormalizedText
+from settings import settings
+
+STRUCTURED_TEXT = "Jane Doe\nExperience\nBackend Engineer, Acme\nSkills\nPython"
+
+router = ModelRouter(
+    small_model="gpt-4o-mini", large_model="gpt-4o", max_tokens=1500, max_pages=2
+)
+
+
+def _normalized(text: str, tokens: int, truncated: bool = False) -> NormalizedText:
+    return NormalizedText(
+        text=text, original_tokens=tokens, tokens=tokens, truncated=truncated
+    )
+
+
+def test_small_structured_cv_routes_to_small_model():
+    route = router.route(
+        _normalized(STRUCTURED_TEXT, 400), split_sections(STRUCTURED_TEXT), 1
+    )
+
+    assert route.model == "gpt-4o-mini"
+    assert route.reason == "small_document"
+
+
+def test_large_or_unstructured_cv_routes_to_large_model():
+    sections = split_sections(STRUCTURED_TEXT)
+
+    assert router.route(_normalized(STRUCTURED_TEXT, 4000), sections, 1).reason == (
+        "tokens"
+    )
+    assert router.route(_normalized(STRUCTURED_TEXT, 400), sections, 3).reason == (
+        "pages"
+    )
+    assert (
+        router.route(_normalized(STRUCTURED_TEXT, 400, True), sections, 1).reason
+        == "truncated"
+    )
+    unstructured = "Jane Doe\nBackend Engineer at Acme since 2019"
+    route = router.route(
+        _normalized(unstructured, 100), split_sections(unstructured), 1
+    )
+    assert route.model == "gpt-4o"
+    assert route.reason == "unstructured"
+
+
+def test_parse_cv_escalates_failing_sections_to_large_model(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    service = CVParserService()
+    calls = []
+
+    async def fake_complete_json(system_prompt, text):
+        calls.append(service.model)
+        experience = {"job_title": "Backend Engineer", "company_name": "Acme"}
+        if service.model == service.router.large_model:
+            return {"experiences": [{**experience, "start_date": "2019-01-01"}]}
+        return {
+            "personal_info": {"full_name": "Jane Doe"},
+            "experiences": [{**experience, "start_date": "2019"}],
+            "skills": ["Python"],
+        }
+
+    monkeypatch.setattr(service, "_extract_pages_from_pdf", lambda _: [STRUCTURED_TEXT])
+    monkeypatch.setattr(service, "_complete_json", fake_complete_json)
+
+    parsed = asyncio.run(service.parse_cv(b"%PDF"))
+
+    assert calls == [service.router.small_model, service.router.large_model]
+    assert service.routed_model == service.router.small_model
+    assert service.escalated
+    assert parsed["experiences"][0]["start_date"] == "2019-01-01"
+    assert parsed["skills"] == ["Python"]
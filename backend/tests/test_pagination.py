@@ -0,0 +1,59 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from models import Experience
+from utils.pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    parse_cursor,
+    set_next_cursor,
+)
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    item_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(3, item_id)) == (3, item_id)
+    with pytest.raises(HTTPException) as error:
+        parse_cursor("not-a-cursor")
+    assert error.value.status_code == 400
+
+
+def test_paginate_uses_keyset_after_cursor_and_clamps_limit():
+    query = select(Experience).where(Experience.user_id == uuid.uuid4())
+
+    keyset = paginate(query, Experience, 0, 10_000, (2, uuid.uuid4()))
+    sql = str(
+        keyset.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert "(experiences.display_order, experiences.id) >" in sql
+    assert "ORDER BY experiences.display_order, experiences.id" in sql
+    assert f"LIMIT {MAX_PAGE_SIZE}" in sql
+    assert "OFFSET" not in sql
+    assert "OFFSET 20" in str(
+        paginate(query, Experience, 20, 10, None).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_next_cursor_is_set_only_for_full_pages():
+    items = [Experience(id=uuid.uuid4(), display_order=order) for order in (0, 1)]
+
+    full_page = Response()
+    set_next_cursor(full_page, items, limit=2)
+    last_page = Response()
+    set_next_cursor(last_page, items, limit=3)
+
+    assert decode_cursor(full_page.headers[NEXT_CURSOR_HEADER]) == (1, items[-1].id)
+    assert NEXT_CURSOR_HEADER not in last_page.headers
@@ -0,0 +1,174 @@
+import asyncio
+import uuid
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db import get_db
+from dependencies.auth_dependencies.auth import get_current_user
+from dependencies.user_input_dependencies.experience_operations import (
+    ExperienceOperations,
+)
+from main import app
+from models import Experience
+from utils.cache import Cache, MemoryBackend, TieredBackend
+from utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from utils.profile_cache import CachedResponse, ProfileCache, profile_cache
+
+client = TestClient(app)
+
+
+def _profile_cache() -> ProfileCache:
+    return ProfileCache(Cache(MemoryBackend(max_bytes=10_000)))
+
+
+def test_responses_round_trip_through_bytes():
+    page = CachedResponse(b'[{"id": 1}]', ((NEXT_CURSOR_HEADER, "abc"),))
+    entry = CachedResponse(b'{\n"summary": null}')
+
+    assert CachedResponse.decode(page.encode()) == page
+    assert CachedResponse.decode(entry.encode()) == entry
+
+
+def test_reads_are_built_once_per_profile_version():
+    user_id = uuid.uuid4()
+    cache = _profile_cache()
+    built = []
+
+    async def build() -> CachedResponse:
+        built.append(1)
+        return CachedResponse(b"[]")
+
+    async def read(version: int) -> CachedResponse:
+        return await cache.get_or_build(user_id, version, "projects", "", build)
+
+    asyncio.run(read(1))
+    asyncio.run(read(1))
+    asyncio.run(read(2))
+
+    assert len(built) == 2
+    assert cache.cache.hits == 1
+    assert cache.cache.hit_ratio == pytest.approx(1 / 3)
+
+    asyncio.run(cache.invalidate(user_id))
+    assert cache.cache.stats()["entries"] == 0
+
+
+def test_missing_entries_are_not_cached():
+    cache = _profile_cache()
+
+    async def build() -> None:
+        return None
+
+    result = asyncio.run(cache.get_or_build(uuid.uuid4(), 1, "summary", "", build))
+
+    assert result is None
+    assert cache.cache.stats()["entries"] == 0
+
+
+def test_shared_tier_fills_other_workers():
+    user_id = uuid.uuid4()
+    shared = MemoryBackend(max_bytes=10_000)
+    worker_a = ProfileCache(Cache(TieredBackend(MemoryBackend(10_000), shared)))
+    backend_b = TieredBackend(MemoryBackend(10_000), shared)
+    worker_b = ProfileCache(Cache(backend_b))
+    page = CachedResponse(b'[{"id": 1}]', ((NEXT_CURSOR_HEADER, "abc"),))
+
+    async def build() -> CachedResponse:
+        return page
+
+    async def not_built() -> CachedResponse:
+        raise AssertionError("served by the shared tier")
+
+    asyncio.run(worker_a.get_or_build(user_id, 3, "projects", "limit=1", build))
+    result = asyncio.run(
+        worker_b.get_or_build(user_id, 3, "projects", "limit=1", not_built)
+    )
+
+    assert result == page
+    assert backend_b.shared_hits == 1
+
+
+def _experience(user_id: uuid.UUID, display_order: int) -> Experience:
+    now = datetime.now(UTC)
+    return Experience(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        job_title="Engineer",
+        company_name="Acme",
+        start_date=date(2020, 1, 1),
+        is_current=False,
+        display_order=display_order,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_section_pages_are_served_from_the_cache(monkeypatch):
+    user = SimpleNamespace(id=uuid.uuid4(), profile_version=5)
+    experiences = [_experience(user.id, order) for order in (0, 1)]
+    queried = []
+
+    async def fake_get_db():
+        yield None
+
+    async def fake_get_all_experiences(self, user_id, skip, limit, cursor):
+        queried.append(user_id)
+        return experiences
+
+    monkeypatch.setattr(
+        ExperienceOperations, "get_all_experiences", fake_get_all_experiences
+    )
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    asyncio.run(profile_cache.clear())
+    try:
+        first = client.get("/api/experiences/?limit=2")
+        second = client.get("/api/experiences/?limit=2")
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(profile_cache.clear())
+
+    assert queried == [user.id]
+    assert second.content == first.content
+    assert [item["id"] for item in second.json()] == [
+        str(item.id) for item in experiences
+    ]
+    assert second.headers[NEXT_CURSOR_HEADER] == encode_cursor(1, experiences[1].id)
+    assert second.headers["x-profile-version"] == "5"
+
+
+class _VersionSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one=lambda: 2)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_profile_writes_drop_the_users_cached_responses():
+    user_id = uuid.uuid4()
+    ops = ExperienceOperations(_VersionSession())  # type: ignore[arg-type]
+
+    async def build() -> CachedResponse:
+        return CachedResponse(b"[]")
+
+    async def cached_after_commit(changed: bool) -> bool:
+        await profile_cache.clear()
+        await profile_cache.get_or_build(user_id, 1, "experiences", "", build)
+        await ops._commit_changes(user_id, changed=changed)
+        return (
+            await profile_cache.cache.backend.get(
+                Cache.key("profile", user_id, "experiences", "", version=1)
+            )
+            is not None
+        )
+
+    assert asyncio.run(cached_after_commit(changed=False))
+    assert not asyncio.run(cached_after_commit(changed=True))
@@ -0,0 +1,99 @@
+"""Contract between the Postgres-built profile and the Pydantic response schemas.
+
+Everything is written inside a transaction that is rolled back.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import UTC, date, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dependencies.user_input_dependencies.profile_operations import ProfileOperations
+from models import Experience, PersonalInfo, Summary, TechnicalSkill, User
+from schemas.user_input_schemas.profile_schemas import ProfileResponseSchema
+from settings import settings
+from tests.database import requires_database
+
+pytestmark = requires_database
+
+
+def _profile_rows(user_id: uuid.UUID):
+    yield PersonalInfo(
+        user_id=user_id,
+        full_name='Jane "JD" Doe',
+        email="jane@example.com",
+        location="Zürich\nSwitzerland",
+    )
+    yield Summary(
+        user_id=user_id,
+        summary_text="Backend engineer",
+        last_enhanced_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+    # Ties on display_order are broken by id, as in the list endpoints
+    for display_order, is_active, number in (
+        (1, True, 2),
+        (0, True, 3),
+        (2, False, 4),
+        (1, True, 1),
+    ):
+        yield Experience(
+            id=uuid.UUID(int=number),
+            user_id=user_id,
+            job_title=f"Engineer {display_order}-{number}",
+            company_name="Acme",
+            start_date=date(2019, 1, 1),
+            achievements=["Shipped v2", "Cut p95 by 40%"],
+            display_order=display_order,
+            is_active=is_active,
+        )
+    yield TechnicalSkill(
+        user_id=user_id, category="Languages", skills=["Python", "SQL"]
+    )
+
+
+async def _build_profiles():
+    engine = create_async_engine(settings.DB_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection, expire_on_commit=False)
+            user = User(
+                first_name="Jane",
+                last_name="Doe",
+                email=f"{uuid.uuid4()}@example.com",
+                hashed_password="x",
+            )
+            session.add(user)
+            await session.flush()
+            session.add_all(list(_profile_rows(user.id)))
+            await session.flush()
+
+            ops = ProfileOperations(session)
+            profile_json = await ops.get_profile_json(user.id)
+            profile = await ops.get_profile(user.id)
+            expected = ProfileResponseSchema.model_validate(profile).model_dump_json()
+
+            await session.close()
+            await transaction.rollback()
+            return profile_json, expected
+    finally:
+        await engine.dispose()
+
+
+def test_postgres_profile_matches_response_schema():
+    profile_json, expected = asyncio.run(_build_profiles())
+
+    # Postgres spaces its JSON differently; every value must serialize the same
+    assert json.loads(profile_json) == json.loads(expected)
+    assert (
+        ProfileResponseSchema.model_validate_json(profile_json).model_dump_json()
+        == expected
+    )
+    experiences = json.loads(profile_json)["experiences"]
+    assert [experience["job_title"] for experience in experiences] == [
+        "Engineer 0-3",
+        "Engineer 1-1",
+        "Engineer 1-2",
+    ]
@@ -0,0 +1,147 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from db import get_db
+from dependencies.auth_dependencies.auth import get_current_user
+from dependencies.user_input_dependencies.profile_operations import ProfileOperations
+from main import app
+from models import User
+from schemas.user_input_schemas.profile_schemas import ProfileResponseSchema
+from utils.profile_cache import profile_cache
+
+client = TestClient(app)
+
+USER = SimpleNamespace(id=uuid.uuid4(), profile_version=0)
+NOW = datetime.now(UTC)
+
+
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    asyncio.run(profile_cache.clear())
+    yield
+    asyncio.run(profile_cache.clear())
+
+
+def _skill_group(category: str, display_order: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=USER.id,
+        category=category,
+        skills=["Python"],
+        display_order=display_order,
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def test_profile_returns_all_sections_in_one_request(monkeypatch):
+    requested = []
+
+    async def fake_get_db():
+        yield None
+
+    async def fake_get_profile_json(self, user_id):
+        requested.append(user_id)
+        profile = SimpleNamespace(
+            personal_info=None,
+            summary=SimpleNamespace(
+                id=uuid.uuid4(),
+                user_id=USER.id,
+                summary_text="Backend engineer",
+                summary_enhanced=None,
+                is_ai_generated=False,
+                enhancement_prompt_used=None,
+                last_enhanced_at=None,
+                created_at=NOW,
+                updated_at=NOW,
+            ),
+            education=[],
+            experiences=[],
+            projects=[],
+            technical_skills=[
+                _skill_group("Languages", 0),
+                _skill_group("Tools", 1),
+            ],
+            publications=[],
+            certifications=[],
+            custom_sections=[],
+        )
+        return ProfileResponseSchema.model_validate(profile).model_dump_json()
+
+    monkeypatch.setattr(ProfileOperations, "get_profile_json", fake_get_profile_json)
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_user] = lambda: USER
+    try:
+        response = client.get("/api/profile/")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert requested == [USER.id]
+    profile = response.json()
+    assert profile["personal_info"] is None
+    assert profile["summary"]["summary_text"] == "Backend engineer"
+    assert [group["category"] for group in profile["technical_skills"]] == [
+        "Languages",
+        "Tools",
+    ]
+    assert set(profile) == {
+        "personal_info",
+        "summary",
+        "education",
+        "experiences",
+        "projects",
+        "technical_skills",
+        "publications",
+        "certifications",
+        "custom_sections",
+    }
+
+
+def test_profile_is_not_rebuilt_while_its_etag_matches(monkeypatch):
+    user = SimpleNamespace(id=USER.id, profile_version=1)
+    built = []
+
+    async def fake_get_db():
+        yield None
+
+    async def fake_get_profile_json(self, user_id):
+        built.append(user_id)
+        return "{}"
+
+    monkeypatch.setattr(ProfileOperations, "get_profile_json", fake_get_profile_json)
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
+        first = client.get("/api/profile/")
+        etag = first.headers["etag"]
+        unchanged = client.get("/api/profile/", headers={"If-None-Match": etag})
+        user.profile_version = 2
+        changed = client.get("/api/profile/", headers={"If-None-Match": etag})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+    assert unchanged.headers["x-profile-version"] == "1"
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert built == [USER.id, USER.id]
+
+
+def test_every_profile_field_maps_to_a_column():
+    """The Postgres-built profile reads each schema field from a column"""
+    for name in ProfileResponseSchema.model_fields:
+        model = getattr(User, name).property.mapper.class_
+        schema = ProfileResponseSchema.section_schema(name)
+        assert set(schema.model_fields) <= set(model.__table__.columns.keys()), name
@@ -0,0 +1,196 @@
+"""EXPLAIN the queries of the section operations against a seeded dataset.
+
+Every per-user read must be served by an index rather than a sequential
+scan. Everything is written inside a transaction that is rolled back.
+"""
+
+import asyncio
+import uuid
+from datetime import date
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import JSON, Boolean, Date, Integer, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dependencies.user_input_dependencies.certification_operations import (
+    CertificationOperations,
+)
+from dependencies.user_input_dependencies.custom_section_operations import (
+    CustomSectionOperations,
+)
+from dependencies.user_input_dependencies.education_operations import (
+    EducationOperations,
+)
+from dependencies.user_input_dependencies.experience_operations import (
+    ExperienceOperations,
+)
+from dependencies.user_input_dependencies.personal_info_operations import (
+    PersonalInfoOperations,
+)
+from dependencies.user_input_dependencies.project_operations import ProjectOperations
+from dependencies.user_input_dependencies.publication_operations import (
+    PublicationOperations,
+)
+from dependencies.user_input_dependencies.summary_operations import SummaryOperations
+from dependencies.user_input_dependencies.technical_skill_operations import (
+    TechnicalSkillOperations,
+)
+from models import (
+    Certification,
+    CustomSection,
+    Education,
+    Experience,
+    PersonalInfo,
+    Project,
+    Publication,
+    Resume,
+    Summary,
+    TechnicalSkill,
+    User,
+)
+from settings import settings
+from tests.database import requires_database
+
+pytestmark = requires_database
+
+SEED_USERS = 500
+ROWS_PER_USER = 8
+
+SECTIONS = {
+    Education: ("get_all_education", "get_education_by_id", EducationOperations),
+    Experience: ("get_all_experiences", "get_experience_by_id", ExperienceOperations),
+    Project: ("get_all_projects", "get_project_by_id", ProjectOperations),
+    TechnicalSkill: (
+        "get_all_technical_skills",
+        "get_technical_skill_by_id",
+        TechnicalSkillOperations,
+    ),
+    Publication: (
+        "get_all_publications",
+        "get_publication_by_id",
+        PublicationOperations,
+    ),
+    Certification: (
+        "get_all_certifications",
+        "get_certification_by_id",
+        CertificationOperations,
+    ),
+    CustomSection: (
+        "get_all_custom_sections",
+        "get_custom_section_by_id",
+        CustomSectionOperations,
+    ),
+}
+ONE_PER_USER = (PersonalInfo, Summary, Resume)
+
+
+def _required_values(model: Any) -> Dict[str, Any]:
+    """Placeholder values for the NOT NULL columns without a default"""
+    values: Dict[str, Any] = {}
+    for column in model.__table__.columns:
+        if column.nullable or column.default is not None or column.primary_key:
+            continue
+        if column.name == "user_id":
+            continue
+        if isinstance(column.type, Date):
+            values[column.name] = date(2020, 1, 1)
+        elif isinstance(column.type, JSON):
+            values[column.name] = []
+        elif isinstance(column.type, Integer):
+            values[column.name] = 0
+        elif isinstance(column.type, Boolean):
+            values[column.name] = False
+        else:
+            values[column.name] = "seed"
+    return values
+
+
+def _rows(model: Any, user_ids: List[uuid.UUID], per_user: int) -> Iterator[dict]:
+    values = _required_values(model)
+    for user_id in user_ids:
+        for display_order in range(per_user):
+            row = {**values, "id": uuid.uuid4(), "user_id": user_id}
+            if "display_order" in model.__table__.columns:
+                row["display_order"] = display_order
+            yield row
+
+
+def _plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain_operation_queries() -> List[Tuple[str, List[Dict[str, Any]]]]:
+    engine = create_async_engine(settings.DB_URL)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            user_ids = [uuid.uuid4() for _ in range(SEED_USERS)]
+            await connection.execute(
+                insert(User),
+                [
+                    {
+                        "id": user_id,
+                        "first_name": "Seed",
+                        "last_name": "User",
+                        "email": f"{user_id}@example.com",
+                        "hashed_password": "x",
+                    }
+                    for user_id in user_ids
+                ],
+            )
+            for model in SECTIONS:
+                await connection.execute(
+                    insert(model), list(_rows(model, user_ids, ROWS_PER_USER))
+                )
+            for model in ONE_PER_USER:
+                await connection.execute(insert(model), list(_rows(model, user_ids, 1)))
+            for model in (User, *SECTIONS, *ONE_PER_USER):
+                await connection.execute(text(f"ANALYZE {model.__tablename__}"))
+
+            statements: List[Tuple[str, Any]] = []
+
+            @event.listens_for(connection.sync_connection, "before_cursor_execute")
+            def record(conn, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    statements.append((statement, parameters))
+
+            session = AsyncSession(bind=connection)
+            user_id = user_ids[SEED_USERS // 2]
+            for model, (get_all, get_by_id, operations) in SECTIONS.items():
+                ops = operations(session)
+                items = await getattr(ops, get_all)(user_id, limit=ROWS_PER_USER // 2)
+                last = items[-1]
+                await getattr(ops, get_all)(
+                    user_id, cursor=(last.display_order, last.id)
+                )
+                await getattr(ops, get_by_id)(last.id, user_id)
+            await PersonalInfoOperations(session).get_personal_info_by_user_id(user_id)
+            await SummaryOperations(session).get_summary_by_user_id(user_id)
+            event.remove(connection.sync_connection, "before_cursor_execute", record)
+
+            plans = []
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar_one()[0]["Plan"]
+                plans.append((statement, list(_plan_nodes(plan))))
+
+            await session.close()
+            await transaction.rollback()
+            return plans
+    finally:
+        await engine.dispose()
+
+
+def test_operation_queries_use_indexes():
+    plans = asyncio.run(_explain_operation_queries())
+
+    assert len(plans) == 3 * len(SECTIONS) + 2
+    for statement, nodes in plans:
+        sequential = [
+            node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"
+        ]
+        assert not sequential, f"Sequential scan on {sequential}: {statement}"
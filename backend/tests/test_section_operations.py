@@ -0,0 +1,255 @@
+import asyncio
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from dependencies.user_input_dependencies.education_operations import (
+    EducationOperations,
+)
+from dependencies.user_input_dependencies.experience_operations import (
+    ExperienceOperations,
+)
+from dependencies.user_input_dependencies.project_operations import ProjectOperations
+from dependencies.user_input_dependencies.section_operations import update_values
+from dependencies.user_input_dependencies.summary_operations import SummaryOperations
+from models import Education, Experience
+from schemas.user_input_schemas.education_schemas import EducationUpdateSchema
+from schemas.user_input_schemas.experience_schemas import (
+    ExperienceSyncItemSchema,
+    ExperienceUpdateSchema,
+)
+from schemas.user_input_schemas.summary_schemas import SummaryCreateSchema
+
+
+class _Result:
+    def __init__(self, value, ids=()):
+        self.value = value
+        self.ids = ids
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalar_one(self):
+        return 1
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: list(self.ids))
+
+
+class _RecordingSession:
+    def __init__(self, value):
+        self.value = value
+        self.statements = []
+        self.commits = 0
+        self.returned_ids = []
+
+    async def execute(self, statement):
+        self.statements.append(
+            str(
+                statement.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        )
+        return _Result(self.value, self.returned_ids)
+
+    async def scalars(self, statement):
+        await self.execute(statement)
+        return SimpleNamespace(one_or_none=lambda: self.value)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_update_values_keep_only_sent_columns():
+    payload = EducationUpdateSchema(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), degree="MSc", grade=None
+    )
+
+    assert update_values(Education, payload) == {"degree": "MSc"}
+
+
+def test_update_is_one_statement_scoped_to_the_user():
+    experience = Experience(id=uuid.uuid4(), job_title="Engineer")
+    db = _RecordingSession(experience)
+    user_id = uuid.uuid4()
+
+    updated = asyncio.run(
+        ExperienceOperations(db).update_experience(
+            experience.id, user_id, ExperienceUpdateSchema(job_title="Engineer")
+        )
+    )
+
+    assert updated is experience
+    assert db.commits == 1
+    sql, bump = db.statements
+    assert sql.startswith("UPDATE experiences SET job_title='Engineer'")
+    assert bump.startswith(
+        "UPDATE users SET profile_version=(users.profile_version + 1)"
+    )
+    assert f"experiences.id = '{experience.id}'" in sql
+    assert f"experiences.user_id = '{user_id}'" in sql
+    assert "RETURNING" in sql
+
+
+def test_one_to_one_create_is_a_conflict_free_insert():
+    db = _RecordingSession(None)
+
+    summary = asyncio.run(
+        SummaryOperations(db).create_summary(
+            SummaryCreateSchema(summary_text="Builds things"), uuid.uuid4()
+        )
+    )
+
+    assert summary is None
+    [sql] = db.statements
+    assert sql.startswith("INSERT INTO summaries")
+    assert "ON CONFLICT (user_id) DO NOTHING RETURNING" in sql
+
+
+def test_delete_reports_whether_a_row_was_deleted():
+    db = _RecordingSession(None)
+
+    deleted = asyncio.run(
+        EducationOperations(db).delete_education(uuid.uuid4(), uuid.uuid4())
+    )
+
+    assert deleted is False
+    [sql] = db.statements
+    assert sql.startswith("DELETE FROM education WHERE")
+    assert sql.endswith("RETURNING education.id")
+
+
+class _SyncSession:
+    """Serves the stored rows to the locking SELECT and records the writes"""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.writes = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        if statement.is_select:
+            return [(item.id, item) for item in self.stored]
+        self.writes.append((statement.compile().string.split()[0], params))
+        return SimpleNamespace(scalar_one=lambda: 1)
+
+    async def scalars(self, statement, params):
+        self.writes.append(("INSERT", params))
+        return [uuid.uuid4() for _ in params]
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _stored_experience(job_title: str, display_order: int) -> Experience:
+    return Experience(
+        id=uuid.uuid4(),
+        job_title=job_title,
+        company_name="Acme",
+        location=None,
+        employment_type=None,
+        start_date=date(2020, 1, 1),
+        end_date=None,
+        is_current=False,
+        description=None,
+        achievements=None,
+        technologies_used=None,
+        display_order=display_order,
+        is_active=True,
+    )
+
+
+def _sync_item(experience: Experience, **changes) -> ExperienceSyncItemSchema:
+    return ExperienceSyncItemSchema.model_validate(
+        {
+            "id": experience.id,
+            "job_title": experience.job_title,
+            "company_name": experience.company_name,
+            "start_date": experience.start_date,
+            **changes,
+        }
+    )
+
+
+def test_sync_of_an_unchanged_list_writes_nothing():
+    stored = [_stored_experience("Engineer", 0), _stored_experience("Lead", 1)]
+    db = _SyncSession(stored)
+
+    changes, missing = asyncio.run(
+        ExperienceOperations(db).sync(
+            [_sync_item(item) for item in stored], uuid.uuid4()
+        )
+    )
+
+    assert missing == []
+    assert db.writes == []
+    assert changes["unchanged"] == [item.id for item in stored]
+
+
+def test_sync_writes_only_the_difference():
+    kept, renamed, removed = (
+        _stored_experience("Engineer", 0),
+        _stored_experience("Lead", 1),
+        _stored_experience("Intern", 2),
+    )
+    db = _SyncSession([kept, renamed, removed])
+    new = ExperienceSyncItemSchema(
+        job_title="Manager", company_name="Acme", start_date=date(2024, 1, 1)
+    )
+
+    changes, missing = asyncio.run(
+        ExperienceOperations(db).sync(
+            [_sync_item(renamed, job_title="Staff"), _sync_item(kept), new],
+            uuid.uuid4(),
+        )
+    )
+
+    assert missing == []
+    assert changes["deleted"] == [removed.id]
+    assert changes["updated"] == [renamed.id, kept.id]
+    assert changes["unchanged"] == []
+    assert len(changes["created"]) == 1
+    (_, delete_params), (_, update_rows), (_, insert_rows), bump = db.writes
+    assert update_rows == [
+        {"id": renamed.id, "job_title": "Staff", "display_order": 0},
+        {"id": kept.id, "display_order": 1},
+    ]
+    assert insert_rows[0]["display_order"] == 2
+    assert bump[0] == "UPDATE"
+    assert db.commits == 1
+
+
+def test_sync_rejects_unknown_ids_without_writing():
+    db = _SyncSession([])
+    unknown = _stored_experience("Engineer", 0)
+
+    _, missing = asyncio.run(
+        ExperienceOperations(db).sync([_sync_item(unknown)], uuid.uuid4())
+    )
+
+    assert missing == [unknown.id]
+    assert db.writes == []
+
+
+def test_reorder_is_one_update_from_values():
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    db = _RecordingSession(None)
+    db.returned_ids = ids
+
+    missing = asyncio.run(ProjectOperations(db).reorder(ids, uuid.uuid4()))
+
+    assert missing == []
+    sql, bump = db.statements
+    assert sql.startswith("UPDATE projects SET display_order=positions.display_order")
+    assert bump.startswith(
+        "UPDATE users SET profile_version=(users.profile_version + 1)"
+    )
+    assert f"FROM (VALUES ('{ids[0]}', 0), ('{ids[1]}', 1)) AS positions" in sql
+    assert "RETURNING projects.id" in sql
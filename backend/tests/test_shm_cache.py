@@ -0,0 +1,140 @@
+import asyncio
+import multiprocessing
+import struct
+import uuid
+
+import pytest
+
+from utils.cache import Cache, MemoryBackend, TieredBackend
+from utils.profile_cache import CachedResponse, ProfileCache
+from utils.shm_cache import SLOT, WAYS, SharedMemoryBackend
+
+
+def _store_in_other_process(path: str, slots: int, slot_bytes: int) -> None:
+    cache = SharedMemoryBackend(path, slots, slot_bytes)
+    cache.store(b"profile:1", b'{"summary": null}')
+    asyncio.run(cache.close())
+
+
+def test_values_round_trip_and_are_replaced(tmp_path):
+    cache = SharedMemoryBackend(str(tmp_path / "cache"), slots=64, slot_bytes=256)
+
+    assert cache.lookup(b"a") is None
+    assert cache.store(b"a", b"first")
+    assert cache.store(b"a", b"second")
+    assert cache.lookup(b"a") == b"second"
+
+    cache.remove(b"a")
+    assert cache.lookup(b"a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_values_larger_than_a_slot_are_not_stored(tmp_path):
+    cache = SharedMemoryBackend(str(tmp_path / "cache"), slots=8, slot_bytes=64)
+    capacity = 64 - SLOT.size
+
+    assert not cache.store(b"k", b"x" * capacity)
+    assert cache.store(b"k", b"x" * (capacity - 1))
+
+
+def test_clock_evicts_unreferenced_entries_first(tmp_path):
+    # A single set, so every key competes for the same WAYS slots
+    cache = SharedMemoryBackend(str(tmp_path / "cache"), slots=WAYS, slot_bytes=128)
+    keys = [f"key-{index}".encode() for index in range(WAYS)]
+    for key in keys:
+        cache.store(key, key)
+
+    cache.store(b"new-1", b"1")
+    cache.lookup(keys[2])
+    cache.store(b"new-2", b"2")
+
+    assert cache.lookup(b"new-1") == b"1"
+    assert cache.lookup(b"new-2") == b"2"
+    assert cache.lookup(keys[2]) == keys[2]
+    assert sum(cache.lookup(key) is not None for key in keys) == WAYS - 2
+    assert cache.evictions == 2
+
+
+def test_slot_left_mid_write_recovers_on_the_next_write(tmp_path):
+    cache = SharedMemoryBackend(str(tmp_path / "cache"), slots=WAYS, slot_bytes=128)
+    cache.store(b"a", b"1")
+    # A worker died while rewriting the slot, leaving its seqlock odd
+    offset = cache._slot_offset(0, 0)
+    seq = struct.unpack_from("<Q", cache._map, offset)[0]
+    struct.pack_into("<Q", cache._map, offset, seq + 1)
+    assert cache.lookup(b"a") is None
+
+    cache.store(b"a", b"2")
+
+    assert cache.lookup(b"a") == b"2"
+    assert struct.unpack_from("<Q", cache._map, offset)[0] % 2 == 0
+
+
+def test_workers_share_the_table(tmp_path):
+    path = str(tmp_path / "cache")
+    cache = SharedMemoryBackend(path, slots=64, slot_bytes=256)
+    context = multiprocessing.get_context("spawn")
+    writer = context.Process(target=_store_in_other_process, args=(path, 64, 256))
+    writer.start()
+    writer.join(timeout=30)
+
+    assert writer.exitcode == 0
+    assert cache.lookup(b"profile:1") == b'{"summary": null}'
+
+
+def test_entries_expire_with_the_wall_clock(tmp_path, monkeypatch):
+    cache = SharedMemoryBackend(str(tmp_path / "cache"), slots=64, slot_bytes=256)
+    now = [1_000.0]
+    monkeypatch.setattr("utils.shm_cache.time.time", lambda: now[0])
+
+    async def scenario() -> None:
+        await cache.set("short", b"1", ttl=5)
+        await cache.set("forever", b"2")
+        now[0] += 5
+        assert await cache.get("short") is None
+        assert await cache.get("forever") == b"2"
+
+    asyncio.run(scenario())
+
+
+def test_each_layout_has_its_own_file(tmp_path):
+    path = str(tmp_path / "cache")
+    old = SharedMemoryBackend(path, slots=64, slot_bytes=256)
+    old.store(b"a", b"1")
+
+    assert SharedMemoryBackend(path, slots=64, slot_bytes=256).lookup(b"a") == b"1"
+    new = SharedMemoryBackend(path, slots=128, slot_bytes=256)
+    assert new.lookup(b"a") is None
+    # Workers still on the old layout keep their table
+    assert old.lookup(b"a") == b"1"
+    assert old.path != new.path
+
+    with open(f"{path}.cvshm002-64x512", "wb") as other:
+        other.write(b"not a table")
+    with pytest.raises(ValueError):
+        SharedMemoryBackend(path, slots=64, slot_bytes=512)
+
+
+def test_profile_cache_reads_through_shared_memory(tmp_path):
+    path = str(tmp_path / "cache")
+    backends = [
+        TieredBackend(MemoryBackend(10_000), SharedMemoryBackend(path, 64, 1024))
+        for _ in range(2)
+    ]
+    workers = [ProfileCache(Cache(backend)) for backend in backends]
+    user_id = uuid.uuid4()
+    built = []
+
+    async def build() -> CachedResponse:
+        built.append(1)
+        return CachedResponse(b"[]", (("X-Next-Cursor", "abc"),))
+
+    async def read(cache: ProfileCache) -> CachedResponse:
+        return await cache.get_or_build(user_id, 1, "projects", "", build)
+
+    first = asyncio.run(read(workers[0]))
+    second = asyncio.run(read(workers[1]))
+
+    assert second == first
+    assert len(built) == 1
+    assert backends[1].shared_hits == 1
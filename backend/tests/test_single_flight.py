@@ -0,0 +1,133 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+
+    async def parse():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"skills_count": 2}
+
+    async def main():
+        return await asyncio.gather(
+            *(flights.do(("import", "cv"), parse) for _ in range(3))
+        )
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert [shared for _, shared in results] == [False, True, True]
+    assert all(result == {"skills_count": 2} for result, _ in results)
+    assert not flights.in_flight(("import", "cv"))
+
+
+def test_failure_is_shared_and_next_call_runs_again():
+    flights = SingleFlight()
+    calls = []
+
+    async def failing_parse():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed to parse CV")
+
+    async def main():
+        return await asyncio.gather(
+            flights.do("cv", failing_parse),
+            flights.do("cv", failing_parse),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError):
+        asyncio.run(flights.do("cv", failing_parse))
+    assert len(calls) == 2
+
+
+def test_detached_call_outlives_the_caller_that_started_it():
+    flights = SingleFlight(detach=True)
+    release = asyncio.Event()
+    calls = []
+
+    async def parse():
+        calls.append(1)
+        await release.wait()
+        return "parsed"
+
+    async def main():
+        leader = asyncio.create_task(flights.do("cv", parse))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("cv", parse))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return leader.cancelled(), await follower
+
+    leader_cancelled, follower_result = asyncio.run(main())
+
+    assert leader_cancelled
+    assert follower_result == ("parsed", True)
+    assert len(calls) == 1
+    assert not flights.in_flight("cv")
+
+
+def test_call_is_cancelled_when_every_caller_leaves():
+    flights = SingleFlight()
+    cancelled = []
+
+    async def parse():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def main():
+        callers = [asyncio.create_task(flights.do("cv", parse)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        assert not flights.in_flight("cv")
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert cancelled == [1]
+
+
+def test_waiting_caller_takes_over_when_the_starting_caller_leaves():
+    flights = SingleFlight()
+    started = []
+
+    async def parse(name):
+        started.append(name)
+        await asyncio.sleep(0.01)
+        return name
+
+    async def main():
+        leader = asyncio.create_task(flights.do("cv", partial(parse, "leader")))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(flights.do("cv", partial(parse, f"follower-{i}")))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.gather(*followers)
+
+    results = asyncio.run(main())
+
+    # The leader's call is dropped with it; one follower runs for both
+    assert started == ["leader", "follower-0"]
+    assert results == [("follower-0", False), ("follower-0", True)]
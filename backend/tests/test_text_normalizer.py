@@ -0,0 +1,38 @@
+from services.text_normalizer import TextNormalizer, count_tokens
+
+MODEL = "gpt-4o"
+
+
+def test_normalize_drops_repeated_headers_and_page_numbers():
+    pages = [
+        "Jane Doe - Curriculum Vitae\nExperience\nBackend Engineer at Acme\n1",
+        "Jane Doe - Curriculum Vitae\nEducation\nBSc Computer Science\nPage 2 of 3",
+        "Jane Doe - Curriculum Vitae\nSkills\nPython, SQL\n3",
+    ]
+    result = TextNormalizer(MODEL, token_budget=1000).normalize(pages)
+
+    assert result.text.count("Jane Doe - Curriculum Vitae") == 1
+    assert "Page 2 of 3" not in result.text
+    assert "Backend Engineer at Acme" in result.text
+    assert "Python, SQL" in result.text
+    assert result.tokens < result.original_tokens
+    assert 0 < result.reduction_ratio < 1
+
+
+def test_normalize_collapses_whitespace_and_joins_hyphenation():
+    pages = ["Built   a  data\t\tpipeline for\nregional  develop-\nment\n\n\n\nDone"]
+    result = TextNormalizer(MODEL, token_budget=1000).normalize(pages)
+
+    assert "Built a data pipeline for" in result.text
+    assert "development" in result.text
+    assert "\n\n\n" not in result.text
+
+
+def test_normalize_enforces_token_budget():
+    pages = ["\n".join(f"Line number {i} with some filler words" for i in range(500))]
+    result = TextNormalizer(MODEL, token_budget=50).normalize(pages)
+
+    assert result.truncated
+    assert result.tokens <= 50
+    assert count_tokens(result.text, MODEL) == result.tokens
+    assert result.text.startswith("Line number 0")
@@ -0,0 +1,59 @@
+from typing import Any, List, Mapping, NoReturn, Optional, Sequence, Type
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+from schemas.common import BatchItemResultSchema, BatchResponseSchema
+
+
+def raise_missing(missing: Sequence[UUID], label: str) -> NoReturn:
+    """Reject an all-or-nothing batch that names entries the user does not own"""
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{label} not found: {', '.join(str(item_id) for item_id in missing)}",
+    )
+
+
+def reject_duplicate_ids(ids: Sequence[Optional[UUID]]) -> None:
+    """Reject a request that names the same entry more than once"""
+    named = [item_id for item_id in ids if item_id is not None]
+    if len(set(named)) != len(named):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each id may appear only once",
+        )
+
+
+def batch_results(
+    ids: Sequence[UUID],
+    found: Mapping[UUID, Any],
+    status_code: int,
+    label: str,
+    schema: Optional[Type[BaseModel]] = None,
+) -> BatchResponseSchema:
+    """Per-item results in request order; IDs not in `found` are reported as 404.
+
+    With a `schema`, each result carries its entry from `found` serialized
+    through it.
+    """
+    results: List[BatchItemResultSchema] = []
+    for index, item_id in enumerate(ids):
+        if item_id not in found:
+            results.append(
+                BatchItemResultSchema(
+                    index=index,
+                    id=item_id,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{label} with id {item_id} not found",
+                )
+            )
+            continue
+
+        item = schema.model_validate(found[item_id]) if schema else None
+        results.append(
+            BatchItemResultSchema(
+                index=index, id=item_id, status_code=status_code, item=item
+            )
+        )
+    return BatchResponseSchema(results=results)
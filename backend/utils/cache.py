@@ -0,0 +1,362 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Set
+
+from settings import settings
+from utils.logger import get_logger
+from utils.metrics import metrics_registry
+from utils.single_flight import SingleFlight
+
+logger = get_logger()
+
+# Rough per-entry cost of the key, the bookkeeping and the dict slots
+ENTRY_OVERHEAD_BYTES = 256
+
+
+class CacheBackend(ABC):
+    """Storage behind a Cache: byte values by string key, with optional expiry.
+
+    `tag` groups entries so a backend that can enumerate them drops them
+    together with delete_tag(). Backends that cannot ignore it and rely on
+    versioned keys and expiry instead.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    async def delete_tag(self, tag: str) -> None:
+        return None
+
+    async def clear(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def stats(self) -> Dict[str, float]:
+        return {}
+
+
+class _MemoryEntry(NamedTuple):
+    value: bytes
+    expires_at: Optional[float]
+    tag: Optional[str]
+
+    @property
+    def size(self) -> int:
+        return len(self.value) + ENTRY_OVERHEAD_BYTES
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU bounded by the total size of its entries.
+
+    A `max_bytes` of 0 disables it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        self._remove(key)
+        expires_at = time.monotonic() + ttl if ttl else None
+        entry = _MemoryEntry(value, expires_at, tag)
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        if tag is not None:
+            self._tags.setdefault(tag, set()).add(key)
+        self.size += entry.size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+    async def delete_tag(self, tag: str) -> None:
+        for key in list(self._tags.get(tag, ())):
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        if entry.tag is not None:
+            keys = self._tags[entry.tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[entry.tag]
+
+
+class TieredBackend(CacheBackend):
+    """In-process backend in front of one shared by the workers.
+
+    Shared hits are copied into the local tier for `local_ttl` seconds. Tag
+    deletes and clears only reach the local tier; the shared one relies on
+    versioned keys and expiry.
+    """
+
+    def __init__(
+        self,
+        local: CacheBackend,
+        shared: CacheBackend,
+        local_ttl: Optional[float] = None,
+    ):
+        self.local = local
+        self.shared = shared
+        self.local_ttl = local_ttl
+        self.shared_hits = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.local.get(key)
+        if value is not None:
+            return value
+        value = await self.shared.get(key)
+        if value is not None:
+            self.shared_hits += 1
+            await self.local.set(key, value, self.local_ttl)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        # Local first, so a failing shared tier still leaves the local copy
+        await self.local.set(key, value, ttl, tag)
+        await self.shared.set(key, value, ttl, tag)
+
+    async def delete(self, key: str) -> None:
+        await self.local.delete(key)
+        await self.shared.delete(key)
+
+    async def delete_tag(self, tag: str) -> None:
+        await self.local.delete_tag(tag)
+
+    async def clear(self) -> None:
+        await self.local.clear()
+
+    async def close(self) -> None:
+        await self.local.close()
+        await self.shared.close()
+
+    def stats(self) -> Dict[str, float]:
+        shared = {
+            f"shared_{name}": value for name, value in self.shared.stats().items()
+        }
+        return {**self.local.stats(), **shared, "shared_hits": self.shared_hits}
+
+
+class Cache:
+    """Cache facade shared by the application's caches.
+
+    Keys are built with key(), which appends the version of the cached
+    data, so a version bump makes older entries unreachable. Backend errors
+    are logged and treated as misses, so a cache outage never fails a read.
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: Optional[float] = None):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._flights = SingleFlight()
+
+    @staticmethod
+    def key(*parts: Any, version: Optional[int] = None) -> str:
+        key = ":".join(str(part) for part in parts)
+        return key if version is None else f"{key}:v{version}"
+
+    @property
+    def hit_ratio(self) -> float:
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self._log_error("read", key, e)
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        try:
+            await self.backend.set(key, value, ttl or self.default_ttl, tag)
+        except Exception as e:
+            self._log_error("write", key, e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.backend.delete(key)
+        except Exception as e:
+            self._log_error("delete", key, e)
+
+    async def delete_tag(self, tag: str) -> None:
+        try:
+            await self.backend.delete_tag(tag)
+        except Exception as e:
+            self._log_error("delete", tag, e)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Optional[bytes]]],
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """Return the cached value, or compute, store and return it.
+
+        Concurrent misses of the same key in this worker share one
+        computation. It may use the state of the reader that started it, so
+        it is dropped if that reader goes away and the next waiting reader
+        computes instead. A None result is returned but not cached.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def compute_and_store() -> Optional[bytes]:
+            computed = await compute()
+            if computed is not None:
+                await self.set(key, computed, ttl, tag)
+            return computed
+
+        value, shared = await self._flights.do(key, compute_and_store)
+        if shared:
+            self.coalesced += 1
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            **self.backend.stats(),
+        }
+
+    def _log_error(self, operation: str, key: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning(
+            "Cache backend error",
+            extra={
+                "operation": operation,
+                "key": key,
+                "error": str(error) or type(error).__name__,
+            },
+        )
+
+
+# Global instance; main.lifespan adds the configured shared tier
+cache = Cache(
+    MemoryBackend(settings.CACHE_MEMORY_MAX_BYTES),
+    default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS or None,
+)
+
+metrics_registry.gauge(
+    "cache_hits_total",
+    "Cache reads served from the cache",
+    lambda: cache.hits,
+    kind="counter",
+)
+metrics_registry.gauge(
+    "cache_misses_total",
+    "Cache reads that had to be computed",
+    lambda: cache.misses,
+    kind="counter",
+)
+metrics_registry.gauge(
+    "cache_hit_ratio",
+    "Share of cache reads served from the cache",
+    lambda: cache.hit_ratio,
+)
+metrics_registry.gauge(
+    "cache_coalesced_total",
+    "Misses that joined a computation already in flight",
+    lambda: cache.coalesced,
+    kind="counter",
+)
+metrics_registry.gauge(
+    "cache_errors_total",
+    "Backend errors treated as misses",
+    lambda: cache.errors,
+    kind="counter",
+)
+metrics_registry.gauge(
+    "cache_memory_bytes",
+    "Size of the in-process cache entries",
+    lambda: cache.backend.stats().get("bytes", 0),
+)
+metrics_registry.gauge(
+    "cache_memory_evictions_total",
+    "Entries evicted to stay within the in-process size bound",
+    lambda: cache.backend.stats().get("evictions", 0),
+    kind="counter",
+)
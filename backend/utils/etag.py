@@ -0,0 +1,59 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+ETAG_HEADER = "ETag"
+
+# Lets clients and downstream caches compare profile state with one integer
+PROFILE_VERSION_HEADER = "X-Profile-Version"
+
+# OpenAPI description of conditional GET, for the `responses` of read endpoints
+ETAG_HEADER_DOC = {
+    ETAG_HEADER: {
+        "description": "Send back as If-None-Match to get a 304 while unchanged.",
+        "schema": {"type": "string"},
+    },
+    PROFILE_VERSION_HEADER: {
+        "description": "Version of the user's profile, bumped by every change.",
+        "schema": {"type": "integer"},
+    },
+}
+NOT_MODIFIED_RESPONSE_DOC = {
+    "description": "Not modified since the ETag sent in If-None-Match",
+}
+
+# Responses are per user and must be revalidated before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag derived from the version parts of a response"""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match matches `etag`, compared weakly"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque_tag(etag) in {_opaque_tag(tag) for tag in header.split(",")}
+
+
+def not_modified(etag: str, profile_version: int) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag, profile_version)
+    return response
+
+
+def set_etag(response: Response, etag: str, profile_version: int) -> None:
+    response.headers[ETAG_HEADER] = etag
+    response.headers[PROFILE_VERSION_HEADER] = str(profile_version)
+    response.headers["Cache-Control"] = CACHE_CONTROL
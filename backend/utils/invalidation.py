@@ -0,0 +1,191 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set
+from uuid import UUID
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import ColumnElement, func, literal
+from sqlalchemy.engine import make_url
+
+from settings import settings
+from utils.logger import get_logger
+from utils.metrics import metrics_registry
+
+logger = get_logger()
+
+# Postgres channel carrying cache invalidations between workers
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+invalidation_lag = metrics_registry.histogram(
+    "cache_invalidation_lag_seconds",
+    "Time from a committed write to its invalidation applied in this worker",
+    ["kind"],
+)
+
+
+class Invalidation(NamedTuple):
+    """Invalidation message: the user, the kind of cached data and its new version"""
+
+    user_id: UUID
+    kind: str
+    version: int
+    sent_at: float
+
+    @classmethod
+    def decode(cls, payload: str) -> "Invalidation":
+        """Parse a `user_id:kind:version:sent_at` notification payload"""
+        user_id, kind, version, sent_at = payload.split(":")
+        return cls(UUID(user_id), kind, int(version), float(sent_at))
+
+
+def notify(kind: str, user_id: Any, version: Any) -> ColumnElement[Any]:
+    """pg_notify() call publishing an invalidation when the transaction commits.
+
+    `user_id` and `version` may be columns, so the notification can be sent
+    from the RETURNING clause of the write itself. Notifications of a rolled
+    back transaction are never delivered.
+    """
+    payload = func.concat_ws(
+        ":",
+        user_id,
+        literal(kind),
+        version,
+        func.extract("epoch", func.clock_timestamp()),
+    )
+    return func.pg_notify(literal(INVALIDATION_CHANNEL), payload)
+
+
+def listener_dsn(db_url: str) -> str:
+    """asyncpg DSN of the SQLAlchemy database URL"""
+    url = make_url(db_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+async def connect_listener() -> asyncpg.Connection:
+    return await asyncpg.connect(listener_dsn(settings.DB_URL))
+
+
+class InvalidationListener:
+    """Apply invalidations published by any worker to this worker's caches.
+
+    Holds one dedicated LISTEN connection, checked every `ping_interval`
+    seconds and reopened with exponential backoff when it is lost.
+    Notifications sent while disconnected are lost, so the reconnect
+    handlers run on every (re)connect to drop whatever may be stale.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]] = connect_listener,
+        channel: str = INVALIDATION_CHANNEL,
+        ping_interval: float = 30.0,
+        retry_delay: float = 0.5,
+        max_retry_delay: float = 30.0,
+    ):
+        self.connect = connect
+        self.channel = channel
+        self.ping_interval = ping_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.connected = asyncio.Event()
+        self._handlers: Dict[str, List[Callable[[Invalidation], Awaitable[None]]]] = {}
+        self._reconnect_handlers: List[Callable[[], Awaitable[None]]] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+        # Invalidations being applied, referenced until they are done
+        self._applying: Set["asyncio.Task[None]"] = set()
+        self._failures = 0
+
+    def subscribe(
+        self, kind: str, handler: Callable[[Invalidation], Awaitable[None]]
+    ) -> None:
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def on_reconnect(self, handler: Callable[[], Awaitable[None]]) -> None:
+        self._reconnect_handlers.append(handler)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def dispatch(self, payload: str) -> None:
+        """Apply a notification payload in the background"""
+        try:
+            invalidation = Invalidation.decode(payload)
+        except ValueError:
+            logger.warning("Malformed invalidation", extra={"payload": payload})
+            return
+
+        task = asyncio.get_running_loop().create_task(self.apply(invalidation))
+        self._applying.add(task)
+        task.add_done_callback(self._applying.discard)
+
+    async def apply(self, invalidation: Invalidation) -> None:
+        for handler in self._handlers.get(invalidation.kind, ()):
+            try:
+                await handler(invalidation)
+            except Exception as e:
+                logger.error(
+                    "Error applying invalidation:",
+                    extra={"error": str(e), "kind": invalidation.kind},
+                )
+        invalidation_lag.observe(
+            max(time.time() - invalidation.sent_at, 0.0), kind=invalidation.kind
+        )
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self.dispatch(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                delay = min(self.retry_delay * 2**self._failures, self.max_retry_delay)
+                self._failures += 1
+                logger.warning(
+                    "Invalidation listener disconnected",
+                    extra={"error": str(e), "retry_in": delay},
+                )
+                await asyncio.sleep(delay)
+
+    async def _listen(self) -> None:
+        """Listen until the connection is lost"""
+        connection = await self.connect()
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+            for handler in self._reconnect_handlers:
+                await handler()
+            self.connected.set()
+            self._failures = 0
+            logger.info("Invalidation listener connected")
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), timeout=self.ping_interval)
+                except asyncio.TimeoutError:
+                    # Detects a silently dropped connection
+                    await asyncio.wait_for(
+                        connection.fetchval("SELECT 1"), timeout=self.ping_interval
+                    )
+            raise ConnectionError("LISTEN connection closed")
+        finally:
+            self.connected.clear()
+            if not connection.is_closed():
+                connection.terminate()
+
+
+# Global instance
+invalidation_listener = InvalidationListener()
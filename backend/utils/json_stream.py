@@ -0,0 +1,58 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JSONObjectStream:
+    """Incrementally parse a streamed JSON object.
+
+    Text is fed in chunks as it arrives and each top-level member is returned
+    as soon as its value closes, before the rest of the object is received.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add a chunk and return the top-level members it completed"""
+        self.text += chunk
+        members: List[Tuple[str, Any]] = []
+        while self._pos < len(self.text):
+            char = self.text[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = self._pos + 1
+            elif char in "}]":
+                if self._depth == 1:
+                    members.extend(self._close_member())
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                members.extend(self._close_member())
+                self._member_start = self._pos + 1
+            self._pos += 1
+        return members
+
+    def _close_member(self) -> List[Tuple[str, Any]]:
+        if self._member_start is None:
+            return []
+        member = self.text[self._member_start : self._pos].strip()
+        if not member:
+            return []
+        try:
+            return list(json.loads("{" + member + "}").items())
+        except json.JSONDecodeError:
+            return []
@@ -0,0 +1,143 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{value}"' for name, value in zip(label_names, label_values)
+    )
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    """Cumulative histogram rendered in the Prometheus text format.
+
+    Values are kept per worker process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (bucket counts, sum, count)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        counts, total, count = self._series.get(key, ([0] * len(self.buckets), 0.0, 0))
+        index = bisect_left(self.buckets, value)
+        if index < len(counts):
+            counts[index] += 1
+        self._series[key] = (counts, total + value, count + 1)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for key, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.label_names + ("le",), key + (f"{bound:g}",)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names + ("le",), key + ("+Inf",))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {total:g}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Gauge:
+    """Single value read from a callback each time the metrics are rendered.
+
+    `kind` is the Prometheus type, "counter" for monotonic totals.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        read: Callable[[], float],
+        kind: str = "gauge",
+    ):
+        self.name = name
+        self.description = description
+        self.read = read
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+            f"{self.name} {self.read():g}",
+        ]
+
+
+class MetricsRegistry:
+    """Holds the metrics exposed on the /metrics endpoint"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Union[Histogram, Gauge]] = {}
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = self._metrics.get(name)
+        if not isinstance(metric, Histogram):
+            metric = Histogram(name, description, label_names, buckets)
+            self._metrics[name] = metric
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        read: Callable[[], float],
+        kind: str = "gauge",
+    ) -> Gauge:
+        metric = Gauge(name, description, read, kind)
+        self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global instance
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,80 @@
+import base64
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Select, tuple_
+
+MAX_PAGE_SIZE = 100
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# OpenAPI description of the header, for the `responses` of list endpoints
+NEXT_CURSOR_HEADER_DOC = {
+    NEXT_CURSOR_HEADER: {
+        "description": "Pass as `cursor` to fetch the next page. "
+        "Absent on the last page.",
+        "schema": {"type": "string"},
+    }
+}
+
+# Position of the last item of a page: (display_order, id)
+Cursor = Tuple[int, UUID]
+
+
+def clamp_limit(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(display_order: int, item_id: UUID) -> str:
+    raw = f"{display_order}:{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode an opaque cursor. Raises ValueError if it is malformed"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    display_order, item_id = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+    return int(display_order), UUID(item_id)
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Decode the `cursor` query parameter of a list endpoint"""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def paginate(
+    query: Select, model: Any, skip: int, limit: int, cursor: Optional[Cursor]
+) -> Select:
+    """Order a section query by (display_order, id) and select one page.
+
+    With a cursor the page starts right after it, using the
+    (user_id, display_order, id) index; otherwise `skip` rows are skipped.
+    """
+    query = query.order_by(model.display_order, model.id).limit(clamp_limit(limit))
+    if cursor is not None:
+        return query.where(tuple_(model.display_order, model.id) > tuple_(*cursor))
+    return query.offset(skip)
+
+
+def next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor of the page after `items`, or None if it was the last one"""
+    if len(items) < clamp_limit(limit):
+        return None
+    last = items[-1]
+    return encode_cursor(last.display_order, last.id)
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Point the client at the page after `items`, unless it was the last one"""
+    cursor = next_cursor(items, limit)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
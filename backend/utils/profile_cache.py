@@ -0,0 +1,130 @@
+import json
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from uuid import UUID
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from utils.cache import Cache, cache
+from utils.etag import set_etag
+from utils.invalidation import Invalidation, invalidation_listener
+from utils.pagination import NEXT_CURSOR_HEADER, next_cursor
+
+ResponseT = TypeVar("ResponseT", bound=Optional["CachedResponse"])
+
+
+class CachedResponse(NamedTuple):
+    """Serialized JSON body of a profile read and its extra headers"""
+
+    body: bytes
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+    def encode(self) -> bytes:
+        # json.dumps escapes newlines, so the first one ends the headers
+        headers = json.dumps(self.headers).encode() if self.headers else b""
+        return headers + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        headers, body = raw.split(b"\n", 1)
+        if not headers:
+            return cls(body)
+        return cls(body, tuple((name, value) for name, value in json.loads(headers)))
+
+    def to_response(self, etag: str, profile_version: int) -> Response:
+        response = Response(
+            content=self.body, media_type="application/json", headers=dict(self.headers)
+        )
+        set_etag(response, etag, profile_version)
+        return response
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])  # type: ignore[valid-type]
+
+
+def json_entry(schema: Type[BaseModel], item: Any) -> CachedResponse:
+    """Serialize a single section entry through its response schema"""
+    return CachedResponse(schema.model_validate(item).model_dump_json().encode())
+
+
+def json_page(
+    schema: Type[BaseModel], items: Sequence[Any], limit: int
+) -> CachedResponse:
+    """Serialize a page of section entries, with its next cursor header"""
+    adapter = _list_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+    cursor = next_cursor(items, limit)
+    headers = ((NEXT_CURSOR_HEADER, cursor),) if cursor is not None else ()
+    return CachedResponse(body, headers)
+
+
+def _user_tag(user_id: UUID) -> str:
+    return f"profile:{user_id}"
+
+
+class ProfileCache:
+    """Read-through cache of serialized profile and section responses.
+
+    Entries are keyed by user, section and variant, and versioned with the
+    user's profile version. Every profile write bumps the version, which
+    makes the older entries unreachable, and drops the user's in-process
+    entries to free their memory.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+    async def get_or_build(
+        self,
+        user_id: UUID,
+        profile_version: int,
+        section: str,
+        variant: str,
+        build: Callable[[], Awaitable[ResponseT]],
+    ) -> ResponseT:
+        """Return the cached response, or build, store and return it.
+
+        `build` returns None when there is nothing to serve; that is not cached.
+        """
+        key = Cache.key("profile", user_id, section, variant, version=profile_version)
+
+        async def compute() -> Optional[bytes]:
+            built = await build()
+            return built.encode() if built is not None else None
+
+        raw = await self.cache.get_or_compute(key, compute, tag=_user_tag(user_id))
+        return cast(ResponseT, CachedResponse.decode(raw) if raw is not None else None)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        await self.cache.delete_tag(_user_tag(user_id))
+
+    async def clear(self) -> None:
+        await self.cache.backend.clear()
+
+
+# Global instance
+profile_cache = ProfileCache(cache)
+
+
+async def _apply_invalidation(invalidation: Invalidation) -> None:
+    await profile_cache.invalidate(invalidation.user_id)
+
+
+# Profile writes on other workers
+invalidation_listener.subscribe("profile", _apply_invalidation)
+invalidation_listener.on_reconnect(profile_cache.clear)
@@ -0,0 +1,182 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+from utils.cache import CacheBackend
+
+Reply = Union[None, int, str, bytes, List[Any]]
+
+
+class RespError(Exception):
+    """Error reply of the server"""
+
+
+def encode_command(*args: Union[str, bytes, int]) -> bytes:
+    """Encode a command as a RESP array of bulk strings"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Reply:
+    line = await reader.readuntil(b"\r\n")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise RespError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [await read_reply(reader) for _ in range(count)]
+    raise ConnectionError(f"Unexpected reply: {line!r}")
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class RespBackend(CacheBackend):
+    """Cache in a server speaking the Redis protocol (RESP2), shared by all hosts.
+
+    Keeps up to `max_connections` connections, opened on demand; each sends
+    one command at a time and is dropped after any error but an error reply.
+    A command that does not complete in `timeout` seconds, waiting for a
+    free connection included, raises, which the Cache facade treats as a
+    miss. Every entry expires after at most `max_ttl` seconds: keys are
+    versioned, so older versions are never deleted. Tags are ignored.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = 0.5,
+        max_ttl: float = 24 * 60 * 60,
+        max_connections: int = 4,
+    ):
+        if max_ttl <= 0:
+            raise ValueError("max_ttl must be positive")
+        self.host = host
+        self.port = port
+        self.db = db
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self.connections = 0
+        self._idle: List[Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    @classmethod
+    def from_url(cls, url: str, **options: Any) -> "RespBackend":
+        """Backend of a `redis://[[username]:password@]host[:port][/db]` URL"""
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError("Only redis:// URLs are supported")
+        path = parts.path.strip("/")
+        return cls(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(path) if path else 0,
+            username=unquote(parts.username) if parts.username else None,
+            password=unquote(parts.password) if parts.password else None,
+            **options,
+        )
+
+    async def _connect(self) -> Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        commands: List[Tuple[Union[str, bytes, int], ...]] = []
+        if self.password is not None:
+            if self.username:
+                commands.append(("AUTH", self.username, self.password))
+            else:
+                commands.append(("AUTH", self.password))
+        if self.db:
+            commands.append(("SELECT", self.db))
+        try:
+            for command in commands:
+                writer.write(encode_command(*command))
+                await writer.drain()
+                await read_reply(reader)
+        except BaseException:
+            writer.close()
+            raise
+        self.connections += 1
+        return reader, writer
+
+    async def _execute(self, *args: Union[str, bytes, int]) -> Reply:
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            reader, writer = connection
+            try:
+                writer.write(encode_command(*args))
+                await writer.drain()
+                reply = await read_reply(reader)
+            except RespError:
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                # The reply may still arrive, so the connection is out of step
+                writer.close()
+                raise
+            self._idle.append(connection)
+            return reply
+
+    async def execute(self, *args: Union[str, bytes, int]) -> Reply:
+        """Send a command and return its reply"""
+        return await asyncio.wait_for(self._execute(*args), self.timeout)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.execute("GET", key)
+        if isinstance(value, bytes):
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        ttl = min(ttl, self.max_ttl) if ttl else self.max_ttl
+        await self.execute("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.execute("DEL", key)
+
+    async def ping(self) -> bool:
+        return await self.execute("PING") == "PONG"
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "connections": self.connections,
+        }
@@ -0,0 +1,232 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from utils.cache import CacheBackend
+
+MAGIC = b"CVSHM002"
+
+# magic, slot count, slot size, ways
+HEADER = struct.Struct("<8sIII")
+HEADER_BYTES = 64
+
+# seqlock counter, key hash (0 = empty), expiry (0 = none), CLOCK reference
+# bit, key and value length
+SLOT = struct.Struct("<QQdBxHI")
+REF_OFFSET = 24
+
+# Slots a key may occupy; the hash picks the set, CLOCK picks the victim in it
+WAYS = 8
+
+# Reads retried while a writer is updating the slot
+READ_RETRIES = 3
+
+
+def _key_hash(key: bytes) -> int:
+    """Hash that is stable across processes, never 0"""
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedMemoryBackend(CacheBackend):
+    """Host-local cache shared by the worker processes through a mapped file.
+
+    The file holds a fixed-size, set-associative hash table of `slots` slots
+    of `slot_bytes` each; values that do not fit a slot are not stored.
+    Reads take no lock: each slot is guarded by a seqlock and a read that
+    overlaps a write is retried, then reported as a miss. Writers lock the
+    key's set with a byte-range lock and evict with CLOCK within the set.
+    Expiry uses the wall clock, which all processes of a host share.
+
+    The file is `path` suffixed with the layout, so workers started with
+    another version or size map their own file and a file is never resized
+    while mapped. Files of layouts no longer in use are left in place. Put
+    them on a RAM-backed filesystem such as /dev/shm.
+    """
+
+    def __init__(self, path: str, slots: int, slot_bytes: int):
+        if slot_bytes <= SLOT.size:
+            raise ValueError("slot_bytes must leave room for a value")
+        self.sets = max(slots // WAYS, 1)
+        self.slots = self.sets * WAYS
+        self.path = f"{path}.{MAGIC.decode().lower()}-{self.slots}x{slot_bytes}"
+        self.slot_bytes = slot_bytes
+        self.capacity = slot_bytes - SLOT.size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # One CLOCK hand byte per set, after the header
+        self._slots_offset = HEADER_BYTES + -(-self.sets // 64) * 64
+        self.size = self._slots_offset + self.slots * slot_bytes
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._initialize()
+            self._map = mmap.mmap(self._fd, self.size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    def _initialize(self) -> None:
+        """Format the table unless another worker already did"""
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            header = HEADER.pack(MAGIC, self.slots, self.slot_bytes, WAYS)
+            current = os.pread(self._fd, HEADER.size, 0)
+            size = os.fstat(self._fd).st_size
+            if current == header and size == self.size:
+                return
+            if size not in (0, self.size) or current.strip(b"\0"):
+                raise ValueError(f"{self.path} is not a cache table of this layout")
+            # A new file; nobody maps it before it has a header
+            os.ftruncate(self._fd, self.size)
+            os.pwrite(self._fd, header, 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    async def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _locked(self, set_index: int) -> Iterator[None]:
+        # Locks one byte per set, so writers to different sets do not wait
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, HEADER_BYTES + set_index)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, HEADER_BYTES + set_index)
+
+    def _slot_offset(self, set_index: int, way: int) -> int:
+        return self._slots_offset + (set_index * WAYS + way) * self.slot_bytes
+
+    def _read_slot(self, offset: int, key_hash: int, key: bytes) -> Optional[bytes]:
+        for _ in range(READ_RETRIES):
+            seq, slot_hash, expires_at, _, key_len, value_len = SLOT.unpack_from(
+                self._map, offset
+            )
+            if slot_hash != key_hash:
+                return None
+            if expires_at and expires_at <= time.time():
+                return None
+            if seq & 1:
+                continue
+            start = offset + SLOT.size
+            data = self._map[start : start + min(key_len + value_len, self.capacity)]
+            if struct.unpack_from("<Q", self._map, offset)[0] != seq:
+                continue
+            if data[:key_len] != key:
+                return None
+            self._map[offset + REF_OFFSET] = 1
+            return data[key_len:]
+        return None
+
+    def lookup(self, key: bytes) -> Optional[bytes]:
+        key_hash = _key_hash(key)
+        set_index = key_hash % self.sets
+        for way in range(WAYS):
+            value = self._read_slot(self._slot_offset(set_index, way), key_hash, key)
+            if value is not None:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def _write_slot(
+        self,
+        offset: int,
+        key_hash: int,
+        data: bytes,
+        key_len: int,
+        expires_at: float = 0.0,
+    ) -> None:
+        # Odd while writing; a writer that died mid-write left it odd already
+        seq = struct.unpack_from("<Q", self._map, offset)[0] | 1
+        struct.pack_into("<Q", self._map, offset, seq)
+        start = offset + SLOT.size
+        self._map[start : start + len(data)] = data
+        SLOT.pack_into(
+            self._map,
+            offset,
+            seq,
+            key_hash,
+            expires_at,
+            1,
+            key_len,
+            len(data) - key_len,
+        )
+        struct.pack_into("<Q", self._map, offset, seq + 1)
+
+    def _victim(self, set_index: int) -> int:
+        """Way to overwrite: the first one the CLOCK hand finds unreferenced"""
+        hand_offset = HEADER_BYTES + set_index
+        hand = self._map[hand_offset]
+        for step in range(2 * WAYS):
+            way = (hand + step) % WAYS
+            offset = self._slot_offset(set_index, way)
+            if not self._map[offset + REF_OFFSET]:
+                self._map[hand_offset] = (way + 1) % WAYS
+                return way
+            self._map[offset + REF_OFFSET] = 0
+        return hand % WAYS
+
+    def store(self, key: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Store a value. Returns False if it is too large for a slot"""
+        if len(key) + len(value) > self.capacity:
+            return False
+        key_hash = _key_hash(key)
+        set_index = key_hash % self.sets
+        with self._locked(set_index):
+            empty = None
+            for way in range(WAYS):
+                offset = self._slot_offset(set_index, way)
+                slot_hash = SLOT.unpack_from(self._map, offset)[1]
+                if slot_hash == key_hash:
+                    break
+                if slot_hash == 0 and empty is None:
+                    empty = way
+            else:
+                if empty is None:
+                    empty = self._victim(set_index)
+                    self.evictions += 1
+                offset = self._slot_offset(set_index, empty)
+            expires_at = time.time() + ttl if ttl else 0.0
+            self._write_slot(offset, key_hash, key + value, len(key), expires_at)
+        return True
+
+    def remove(self, key: bytes) -> None:
+        key_hash = _key_hash(key)
+        set_index = key_hash % self.sets
+        with self._locked(set_index):
+            for way in range(WAYS):
+                offset = self._slot_offset(set_index, way)
+                if self._read_slot(offset, key_hash, key) is not None:
+                    self._write_slot(offset, 0, b"", 0)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.lookup(key.encode())
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None,
+    ) -> None:
+        self.store(key.encode(), value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.remove(key.encode())
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self.size,
+        }
@@ -0,0 +1,68 @@
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _is_cancelling() -> bool:
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into a single execution.
+
+    The first caller starts the function in its own task; every caller,
+    the first included, awaits the same result, or the same exception. A
+    cancelled caller only stops waiting, unless it started the call: the
+    function may use its state, such as its database session, so the call
+    is cancelled too and the next waiting caller runs its own function.
+    With `detach`, functions must not depend on the caller that started
+    them, and a call is only cancelled once no caller is waiting. Calls are
+    only shared within one worker process.
+    """
+
+    def __init__(self, detach: bool = False) -> None:
+        self.detach = detach
+        self._calls: Dict[Hashable, _Flight] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run `fn` once per key. Returns the result and whether it was shared"""
+        while True:
+            flight = self._calls.get(key)
+            shared = flight is not None
+            if flight is None:
+                flight = self._calls[key] = _Flight(asyncio.ensure_future(fn()))
+                flight.task.add_done_callback(partial(self._forget, key, flight))
+
+            flight.waiters += 1
+            try:
+                return await asyncio.shield(flight.task), shared
+            except asyncio.CancelledError:
+                if flight.task.cancelled() and not _is_cancelling():
+                    # The caller that started it went away; take over
+                    continue
+                raise
+            finally:
+                flight.waiters -= 1
+                owner_left = not shared and not self.detach
+                if not flight.task.done() and (owner_left or not flight.waiters):
+                    self._forget(key, flight)
+                    flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight, *_: Any) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        if flight.task.done() and not flight.task.cancelled():
+            # Mark the exception as retrieved in case nobody else awaits it
+            flight.task.exception()
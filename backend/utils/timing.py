@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """Collects wall-clock durations of named request stages in milliseconds"""
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self._started = perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (perf_counter() - start) * 1000
+            self.stages[name] = round(self.stages.get(name, 0.0) + elapsed_ms, 3)
+
+    def copy(self) -> "StageTimer":
+        """Timer continuing from this one's stages and start time"""
+        timer = StageTimer()
+        timer.stages = dict(self.stages)
+        timer._started = self._started
+        return timer
+
+    @property
+    def total_ms(self) -> float:
+        return round((perf_counter() - self._started) * 1000, 3)
+
+    def server_timing_header(self) -> str:
+        """Format the stages as a Server-Timing header value"""
+        metrics = [
+            f"{name};dur={duration:.1f}" for name, duration in self.stages.items()
+        ]
+        metrics.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(metrics)